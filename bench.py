@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Scraper benchmarks, run against the local ECI stand-in (core/standin.py).
+
+Nothing here touches results.eci.gov.in.
+
+Usage:
+  python bench.py fetch                     # pooled libcurl vs curl-per-page
+  python bench.py fetch --pages 800 --workers 8
+  python bench.py parse                     # fast vs BS4 parser: parity + speed
+  python bench.py parse pages/              # ...over recorded Roundwise pages
+  python bench.py parse data/archive        # ...over a page archive (--archive)
+  python bench.py executors                 # parse stage: threads vs processes vs sub-interpreters
+  python bench.py extract                   # Selenium: per-element vs one execute_script
+  python bench.py schedule                  # adaptive polling vs fixed interval (simulated)
+  python bench.py throttle                  # AIMD controller vs fixed jitter, throttling stand-in
+"""
+
+import argparse
+import glob
+import os
+import random
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core import parse_pool, throttle
+from core.archive import INDEX_FILE, PageArchive
+from core.fetch import HAS_PYCURL, CurlFetcher, SubprocessFetcher, outcome
+from core.parser import Bs4RoundwisePage, RoundwisePage, parse_roundwise, peek_round_status
+from core.schedule import PollScheduler
+from core.standin import (StandinServer, SyntheticSite, ThrottlePolicy, render_roundwise,
+                          synthetic_rounds)
+
+
+def _roundwise_urls(base_url: str, n: int) -> list[str]:
+    return [f"{base_url}/ResultAcGenMay2026/RoundwiseS22{i}.htm" for i in range(1, n + 1)]
+
+
+def _run_fetch(fetcher, urls: list[str], workers: int) -> tuple[float, int, int]:
+    """Fetch every URL from ``workers`` threads, like run_cycle does."""
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(fetcher.fetch, urls))
+    elapsed = time.perf_counter() - started
+    ok = sum(1 for r in results if r.ok and r.status == 200)
+    return elapsed, ok, sum(len(r.body) for r in results)
+
+
+def bench_fetch(args) -> None:
+    with StandinServer() as server:
+        urls = _roundwise_urls(server.base_url, args.pages)
+        engines = [("curl subprocess", SubprocessFetcher(max_connections=args.workers,
+                                                        compressed=False))]
+        if HAS_PYCURL:
+            engines.append(("pooled libcurl", CurlFetcher(max_connections=args.workers)))
+        else:
+            print("pycurl not installed — only the subprocess path can be measured")
+
+        print(f"{args.pages} Roundwise pages, {args.workers} workers, stand-in at {server.base_url}\n")
+        print(f"{'engine':<18} {'seconds':>8} {'pages/s':>9} {'ok':>6} {'MB':>7}")
+        baseline = None
+        for name, fetcher in engines:
+            _run_fetch(fetcher, urls[: args.workers], args.workers)  # warm up
+            elapsed, ok, nbytes = _run_fetch(fetcher, urls, args.workers)
+            fetcher.close()
+            rate = args.pages / elapsed
+            baseline = baseline or rate
+            print(f"{name:<18} {elapsed:>8.2f} {rate:>9.1f} {ok:>6} {nbytes / 1e6:>7.2f}"
+                  f"   x{rate / baseline:.1f}")
+
+
+def _messy(page: str, seed: int) -> str:
+    """Perturb rendered markup the way real pages vary: comments, entities,
+    whitespace, attribute quoting, tag case and scripts."""
+    rng = random.Random(seed)
+    page = page.replace("<td>", "<td>\n    ", rng.randint(0, 40))
+    page = page.replace("</td>", " &nbsp;</td>", rng.randint(0, 40))
+    page = page.replace("<tr>", "<tr class='row'><!-- row -->", rng.randint(0, 40))
+    page = re.sub(r'id="tab(\d+)"', lambda m: rng.choice([m.group(0), f"id='tab{m.group(1)}'"]), page)
+    page = page.replace("<tbody>", "<TBODY>").replace("</tbody>", "</TBODY>")
+    page = page.replace("</head>", "<script>var x = '<h2>not a heading</h2>';</script></head>")
+    page = page.replace("CANDIDATE", "CANDIDATE &amp; <b>SON</b>", rng.randint(0, 5))
+    return page
+
+
+def _recorded_pages(paths: list[str]) -> list[tuple[str, bytes]]:
+    files = []
+    pages = []
+    for path in paths:
+        if os.path.exists(os.path.join(path, INDEX_FILE)):
+            # A page archive (eci-live-scraper.py --archive): each distinct page once
+            archive = PageArchive(path)
+            digests = {e["hash"]: e["url"] for e in archive.entries() if "Roundwise" in e["url"]}
+            pages += [(f"{url} {digest[:8]}", archive.get(digest)) for digest, url in digests.items()]
+        elif os.path.isdir(path):
+            files += sorted(glob.glob(os.path.join(path, "**", "*.htm*"), recursive=True))
+        else:
+            files.append(path)
+    for name in files:
+        with open(name, "rb") as f:
+            pages.append((name, f.read()))
+    return pages
+
+
+def _synthetic_pages(n: int) -> list[tuple[str, bytes]]:
+    pages = []
+    for i in range(n):
+        rounds = synthetic_rounds(n_candidates=5 + i % 15, n_rounds=i % 30, seed=i)
+        page = render_roundwise(i + 1, f"AC NAME {i + 1}", "Tamil Nadu", rounds, 30)
+        if i % 2:
+            page = _messy(page, i)
+        pages.append((f"synthetic-{i + 1}", page.encode("utf-8")))
+    return pages
+
+
+def _page_pieces(page) -> dict:
+    return {
+        "title": page.title,
+        "heading": page.heading,
+        "round_status": page.round_status,
+        "h1": page.text_of("h1"),
+        "table": page.table_rows(),
+        "tabs": {n: page.tab_rows(n) for n in page.tab_numbers()},
+    }
+
+
+def bench_parse(args) -> None:
+    pages = _recorded_pages(args.paths) if args.paths else _synthetic_pages(args.pages)
+    if not pages:
+        print("No pages found.")
+        return
+
+    mismatches = 0
+    for name, body in pages:
+        fast, ref = _page_pieces(RoundwisePage(body)), _page_pieces(Bs4RoundwisePage(body))
+        if fast != ref:
+            mismatches += 1
+            diff = [k for k in ref if fast[k] != ref[k]]
+            print(f"MISMATCH {name}: {', '.join(diff)}")
+    print(f"Parity: {len(pages) - mismatches}/{len(pages)} pages identical "
+          f"(title, headings, round status, first table, every tab's rows)\n")
+
+    # Time what the live scraper does per page: status + current round's table
+    def one_pass(cls):
+        started = time.perf_counter()
+        for _, body in pages:
+            page = cls(body)
+            page.title, page.heading
+            status = page.round_status
+            page.tab_rows(status[0] if status else 1)
+        return time.perf_counter() - started
+
+    print(f"{'parser':<8} {'seconds':>8} {'pages/s':>9}")
+    results = {name: one_pass(cls) for name, cls in (("bs4", Bs4RoundwisePage), ("fast", RoundwisePage))}
+    for name, elapsed in results.items():
+        print(f"{name:<8} {elapsed:>8.3f} {len(pages) / elapsed:>9.1f}"
+              f"   x{results['bs4'] / elapsed:.1f}")
+
+    # The parse-stage job: every tab, or only those after the last stored round
+    known = {name: max((RoundwisePage(body).round_status or (0, 0))[0] - 1, 0) for name, body in pages}
+    mismatches = 0
+    for name, body in pages:
+        full, new = parse_roundwise(body), parse_roundwise(body, known_round=known[name])
+        if any(new.tabs.get(n) != rows for n, rows in full.tabs.items() if n > known[name]):
+            mismatches += 1
+            print(f"MISMATCH {name}: tabs after round {known[name]}")
+    print(f"\nIncremental parity: {len(pages) - mismatches}/{len(pages)} pages")
+    peeked = [(peek_round_status(body), RoundwisePage(body).round_status) for _, body in pages]
+    wrong = sum(1 for peek, status in peeked if peek is not None and peek != status)
+    print(f"Round status from raw bytes: {sum(peek is not None for peek, _ in peeked)}/{len(pages)} "
+          f"pages read, {wrong} wrong\n")
+    print(f"{'parse_roundwise':<18} {'seconds':>8} {'pages/s':>9}")
+    results = {}
+    for label, hint in (("every tab", False), ("new tabs only", True)):
+        started = time.perf_counter()
+        for name, body in pages:
+            parse_roundwise(body, known_round=known[name] if hint else 0)
+        results[label] = time.perf_counter() - started
+    for label, elapsed in results.items():
+        print(f"{label:<18} {elapsed:>8.3f} {len(pages) / elapsed:>9.1f}"
+              f"   x{results['every tab'] / elapsed:.1f}")
+
+
+def bench_executors(args) -> None:
+    pages = _recorded_pages(args.paths) if args.paths else _synthetic_pages(args.pages)
+    if not pages:
+        print("No pages found.")
+        return
+    bodies = [body for _, body in pages] * args.repeat
+    workers = args.workers or parse_pool.cpu_count()
+    cores = min(workers, parse_pool.cpu_count())
+    kinds = ["thread", "process"] + (["interpreter"] if parse_pool.HAS_INTERPRETERS else [])
+    build = "free-threaded" if parse_pool.free_threaded() else "GIL"
+    print(f"{len(bodies)} pages, {workers} workers on {cores} cores, {build} build, "
+          f"auto = {parse_pool.resolve('auto')}\n")
+
+    print(f"{'executor':<12} {'start s':>8} {'seconds':>8} {'pages/s':>9} {'/core':>8}")
+    for kind in kinds:
+        if kind == "thread":
+            # What the scraper's own worker threads do with --parse-executor thread
+            executor = ThreadPoolExecutor(max_workers=workers)
+            run = lambda: list(executor.map(parse_roundwise, bodies))
+        else:
+            executor = parse_pool.ParsePool(kind, workers)
+            run = lambda: list(executor.map(parse_roundwise, bodies, chunksize=args.chunksize))
+        started = time.perf_counter()
+        try:
+            list(executor.map(parse_roundwise, bodies[:workers]))  # start the workers
+        except Exception as e:
+            print(f"{kind:<12} unavailable: {e}")
+            continue
+        startup = time.perf_counter() - started
+        started = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - started
+        rate = len(bodies) / elapsed
+        print(f"{kind:<12} {startup:>8.2f} {elapsed:>8.3f} {rate:>9.1f} {rate / cores:>8.1f}")
+        if kind == "thread":
+            executor.shutdown()
+        else:
+            executor.close()
+
+
+# Make every round tab visible so the per-element path (Selenium .text only
+# returns rendered text) reads the same tables as the snapshot.
+_SHOW_ALL_TABS_JS = "document.querySelectorAll('div.tabcontent').forEach(d => d.style.display = 'block')"
+
+
+def bench_extract(args) -> None:
+    from selenium.common.exceptions import WebDriverException
+
+    from core import scraper
+    from core.browser import create_chrome_driver
+
+    site = SyntheticSite(n_candidates=args.candidates, n_rounds=args.rounds,
+                         total_rounds=args.rounds)
+    with StandinServer(site) as server:
+        urls = _roundwise_urls(server.base_url, args.pages)
+        try:
+            driver = create_chrome_driver()
+        except WebDriverException as e:
+            print(f"No Chrome to measure with: {e.msg or e}".strip())
+            return
+        calls = [0]
+        execute = driver.execute
+
+        def counted(*a, **kw):
+            calls[0] += 1
+            return execute(*a, **kw)
+
+        driver.execute = counted  # every WebDriver command goes through execute()
+        engines = (("per-element", scraper._extract_all_roundwise_rounds_elements),
+                   ("execute_script", scraper.extract_all_roundwise_rounds))
+        seconds = {name: 0.0 for name, _ in engines}
+        commands = {name: 0 for name, _ in engines}
+        mismatches = 0
+        try:
+            for url in urls:
+                driver.get(url)
+                driver.execute_script(_SHOW_ALL_TABS_JS)
+                extracted = []
+                for name, extract in engines:
+                    calls[0] = 0
+                    started = time.perf_counter()
+                    extracted.append(extract(driver))
+                    seconds[name] += time.perf_counter() - started
+                    commands[name] += calls[0]
+                mismatches += extracted[0] != extracted[1]
+        finally:
+            driver.quit()
+
+    print(f"{args.pages} Roundwise pages, {args.rounds} rounds x {args.candidates} candidates\n")
+    print(f"Parity: {args.pages - mismatches}/{args.pages} pages identical\n")
+    print(f"{'extraction':<16} {'s/page':>8} {'commands/page':>14}")
+    baseline = seconds["per-element"]
+    for name, _ in engines:
+        print(f"{name:<16} {seconds[name] / args.pages:>8.3f} {commands[name] / args.pages:>14.0f}"
+              f"   x{baseline / seconds[name]:.1f}")
+
+
+def _simulated_counting(n_acs: int, seed: int) -> list[dict]:
+    """Per-AC counting day: start time, round gap (with jitter) and margin."""
+    rng = random.Random(seed)
+    acs = []
+    for ac_no in range(1, n_acs + 1):
+        start = rng.uniform(0, 3600)
+        gap = rng.uniform(12, 30) * 60
+        total = rng.randint(14, 30)
+        times = [start]
+        for _ in range(total - 1):
+            times.append(times[-1] + gap * rng.uniform(0.8, 1.2))
+        acs.append({"state_code": "S22", "ac_no": ac_no, "times": times,
+                    "margin": rng.choice([0.01, 0.1, 0.3])})
+    return acs
+
+
+def _published(ac: dict, t: float) -> int:
+    return sum(1 for ts in ac["times"] if ts <= t)
+
+
+def bench_schedule(args) -> None:
+    acs = _simulated_counting(args.acs, args.seed)
+    horizon = max(ac["times"][-1] for ac in acs) + 600
+    step = 5.0
+
+    def simulate(poll_due):
+        requests, lag, seen = 0, [], {ac["ac_no"]: 0 for ac in acs}
+        t = 0.0
+        while t <= horizon:
+            for ac in poll_due(t):
+                requests += 1
+                rnd = _published(ac, t)
+                for r in range(seen[ac["ac_no"]], rnd):
+                    lag.append(t - ac["times"][r])
+                seen[ac["ac_no"]] = rnd
+                yield_status = "DONE" if rnd == len(ac["times"]) else ("LIVE" if rnd else "NOT_YET_LIVE")
+                ac["_status"] = yield_status
+                ac["_round"] = rnd
+                if hasattr(poll_due, "observe"):
+                    poll_due.observe(ac, t)
+            t += step
+        lag.sort()
+        p95 = lag[int(0.95 * (len(lag) - 1))] if lag else 0.0
+        return requests, sum(lag) / max(len(lag), 1), p95, max(lag, default=0.0)
+
+    print(f"{args.acs} simulated ACs, 12-30 min round cadence, {horizon / 3600:.1f} h of counting\n")
+    print("lag: seconds from a round being published to the poll that sees it\n")
+    print(f"{'policy':<16} {'requests':>9} {'avg lag s':>10} {'p95 lag s':>10} {'max lag s':>10}")
+    for interval in args.fixed:
+        for ac in acs:
+            ac.pop("_status", None)
+        last = {}
+
+        def fixed(t, interval=interval, last=last):
+            due = [ac for ac in acs if ac.get("_status") != "DONE"
+                   and t - last.get(ac["ac_no"], -1e9) >= interval]
+            for ac in due:
+                last[ac["ac_no"]] = t
+            return due
+
+        req, avg, p95, worst = simulate(fixed)
+        print(f"{f'fixed {interval}s':<16} {req:>9} {avg:>10.0f} {p95:>10.0f} {worst:>10.0f}")
+
+    for ac in acs:
+        ac.pop("_status", None)
+    scheduler = PollScheduler()
+
+    class Adaptive:
+        def __call__(self, t):
+            return [ac for ac in scheduler.select(acs, now=t) if ac.get("_status") != "DONE"]
+
+        @staticmethod
+        def observe(ac, t):
+            scheduler.observe(ac["state_code"], ac["ac_no"], ac["_status"], ac["_round"],
+                              len(ac["times"]), ac["margin"] if ac["_round"] else None, now=t)
+
+    req, avg, p95, worst = simulate(Adaptive())
+    print(f"{'adaptive':<16} {req:>9} {avg:>10.0f} {p95:>10.0f} {worst:>10.0f}")
+
+
+def _fetch_until_ok(fetcher, url: str, jitter: tuple[float, float] | None,
+                    attempts: int = 30) -> dict:
+    """Fetch one page, retrying denials (the next cycle would), like a worker."""
+    counts = {"ok": 0, "denied": 0, "other": 0}
+    for _ in range(attempts):
+        result = fetcher.fetch(url)
+        if jitter:
+            time.sleep(random.uniform(*jitter))
+        kind = outcome(result)
+        if kind == throttle.OK:
+            counts["ok"] += 1
+            break
+        counts["denied" if kind == throttle.DENIED else "other"] += 1
+    return counts
+
+
+def bench_throttle(args) -> None:
+    fetcher_cls = CurlFetcher if HAS_PYCURL else SubprocessFetcher
+    runs = [
+        (f"{args.workers} workers + jitter", args.workers, (0.2, 0.8), None),
+        (f"{args.workers} workers, no jitter", args.workers, None, None),
+        ("AIMD controller", throttle.MAX_CONCURRENCY, None, throttle.AimdController()),
+    ]
+    print(f"{args.pages} Roundwise pages; stand-in allows {args.max_rate:g} req/s and "
+          f"{args.max_in_flight} in flight\n")
+    print(f"{'run':<24} {'seconds':>8} {'pages/s':>8} {'ok':>5} {'denied':>7} {'other':>6}")
+    for name, workers, jitter, controller in runs:
+        policy = ThrottlePolicy(max_rate=args.max_rate, max_in_flight=args.max_in_flight)
+        with StandinServer(throttle=policy) as server:
+            urls = _roundwise_urls(server.base_url, args.pages)
+            fetcher = fetcher_cls(max_connections=workers)
+            fetcher.controller = controller
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                counts = list(pool.map(lambda u: _fetch_until_ok(fetcher, u, jitter), urls))
+            elapsed = time.perf_counter() - started
+            fetcher.close()
+        totals = {k: sum(c[k] for c in counts) for k in ("ok", "denied", "other")}
+        print(f"{name:<24} {elapsed:>8.2f} {totals['ok'] / elapsed:>8.1f} {totals['ok']:>5} "
+              f"{totals['denied']:>7} {totals['other']:>6}")
+        if controller is not None:
+            print(f"{'':<24} settled at {controller.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper benchmarks (local stand-in only)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("fetch", help="Pooled libcurl fetcher vs one curl process per page")
+    p.add_argument("--pages", type=int, default=400)
+    p.add_argument("--workers", type=int, default=8)
+    p.set_defaults(func=bench_fetch)
+
+    p = sub.add_parser("parse", help="Fast Roundwise parser vs BS4, full vs incremental: parity and speed")
+    p.add_argument("paths", nargs="*",
+                   help="Recorded pages, directories or page archives (default: synthetic)")
+    p.add_argument("--pages", type=int, default=200, help="Synthetic pages to generate")
+    p.set_defaults(func=bench_parse)
+
+    p = sub.add_parser("executors", help="Parse stage on threads, processes or sub-interpreters")
+    p.add_argument("paths", nargs="*",
+                   help="Recorded pages, directories or page archives (default: synthetic)")
+    p.add_argument("--pages", type=int, default=200, help="Synthetic pages to generate")
+    p.add_argument("--repeat", type=int, default=5, help="Parse every page this many times")
+    p.add_argument("--workers", type=int, default=0, help="Default: one per CPU")
+    p.add_argument("--chunksize", type=int, default=8)
+    p.set_defaults(func=bench_executors)
+
+    p = sub.add_parser("extract", help="Selenium extraction: per-element calls vs one execute_script")
+    p.add_argument("--pages", type=int, default=10)
+    p.add_argument("--rounds", type=int, default=30)
+    p.add_argument("--candidates", type=int, default=15)
+    p.set_defaults(func=bench_extract)
+
+    p = sub.add_parser("schedule", help="Adaptive per-AC polling vs fixed intervals (simulation)")
+    p.add_argument("--acs", type=int, default=200)
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--fixed", type=int, nargs="*", default=[300, 900],
+                   help="Fixed polling intervals to compare against (seconds)")
+    p.set_defaults(func=bench_schedule)
+
+    p = sub.add_parser("throttle", help="AIMD rate/concurrency controller vs fixed jitter sleeps")
+    p.add_argument("--pages", type=int, default=300)
+    p.add_argument("--workers", type=int, default=8)
+    p.add_argument("--max-rate", type=float, default=40.0, help="Stand-in's requests/s limit")
+    p.add_argument("--max-in-flight", type=int, default=6, help="Stand-in's concurrency limit")
+    p.set_defaults(func=bench_throttle)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
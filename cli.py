@@ -12,6 +12,8 @@ Usage:
   python cli.py --url "..." --csv        # also save CSV
   python cli.py --url "..." --json       # also save JSON
   python cli.py --url "..." --respect    # respectful mode
+  python cli.py --url "..." --engine chrome  # drive Chrome for every page
+  python cli.py --url "..." --base-url http://127.0.0.1:8080  # local stand-in
 """
 
 import argparse
@@ -20,20 +22,27 @@ from datetime import datetime, timezone
 from threading import Lock
 from time import perf_counter
 
-from core.browser import create_chrome_driver
+from core import throttle
+from core.browser import DriverPool
+from core.fetch import close_fetcher, get_fetcher
 from core.output import write_csv, write_json, output_path
 from core.scraper import (
-    build_constituency_url,
+    ENGINES,
+    ac_numbers,
+    election_headings,
     get_state_name,
     parse_partywise_url,
     scrape_worker,
+    set_base_url,
 )
-from db_utils import insert_round_snapshot
+from db_utils import get_assembly_seats, insert_round_snapshot
+
+CHROME_WORKERS = 5  # one Chrome each
 
 
 def show_usage():
     print("""
-Usage: python cli.py --url <partywise_results_url> [limit] [--csv] [--json] [--respect]
+Usage: python cli.py --url <partywise_results_url> [limit] [--csv] [--json] [--respect] [--engine http|chrome] [--base-url URL]
 
 Description:
     Scrapes ECI election results from constituency-wise pages.
@@ -47,6 +56,9 @@ Optional Arguments:
     --csv       Also save results to CSV
     --json      Also save results to JSON
     --respect   Respectful scraping mode (1s pause every 10 URLs)
+    --engine    http (default: plain HTTP, Chrome only as fallback) or chrome
+    --base-url  Fetch pages from this site instead of results.eci.gov.in
+                (e.g. a local `python -m core.standin`; default: ECI_BASE_URL)
 """)
 
 
@@ -97,7 +109,14 @@ def main():
                         help="Also save results to JSON")
     parser.add_argument("--respect", action="store_true",
                         help="Respectful scraping mode")
+    parser.add_argument("--engine", choices=ENGINES, default="http",
+                        help="http (default; Chrome only as fallback) or chrome")
+    parser.add_argument("--base-url", default=None,
+                        help="Fetch pages from here instead of results.eci.gov.in "
+                             "(e.g. a core.standin server; default: ECI_BASE_URL)")
     args = parser.parse_args()
+    if args.base_url:
+        set_base_url(args.base_url)
 
     try:
         election_identifier, state_code = parse_partywise_url(args.url)
@@ -106,41 +125,44 @@ def main():
         show_usage()
         return
 
-    driver = create_chrome_driver()
+    # With --engine http the shared rate controller (core.throttle) decides
+    # how many requests are really in flight; threads only bound it
+    if args.respect:
+        num_workers = 1
+    else:
+        num_workers = CHROME_WORKERS if args.engine == "chrome" else throttle.MAX_CONCURRENCY
+    # Chrome drivers; with --engine http they only start on fallback
+    pool = DriverPool(size=min(num_workers, CHROME_WORKERS))
+    if args.engine == "chrome":
+        pool.warm()
     results = []
     thread_lock = Lock()
 
     try:
-        url = build_constituency_url(election_identifier, state_code, 1)
-        driver.get(url)
-
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from selenium.webdriver.common.by import By
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, 'h1')))
-
-        h1 = driver.find_element(By.TAG_NAME, 'h1').text
-        h2 = driver.find_element(By.TAG_NAME, 'h2').text
+        h1, h2 = election_headings(election_identifier, state_code,
+                                   pool=pool, engine=args.engine)
         state_name = h2.split('(')[-1].replace(')', '')
         election_year = h1.split('-')[-1].strip()
         election_type = ''.join(h2.split()[:1])
 
         print(f"{election_year} {election_type} Elections, {state_name}")
-        mode = "Respectful" if args.respect else "High-Speed (5 workers)"
-        print(f"Download Engine: {mode}\n")
+        mode = "Respectful" if args.respect else f"High-Speed ({num_workers} workers)"
+        print(f"Download Engine: {mode}, {args.engine}\n")
 
         start_time = perf_counter()
 
+        # ACs 1..assembly_seats, confirmed with a few probes past the end
+        acs = ac_numbers(election_identifier, state_code, get_assembly_seats(state_code),
+                         pool=pool, fetcher=get_fetcher() if args.engine == "http" else None)
+        state = {'pending': list(acs), 'missing': []}
         if args.respect:
-            state = {'current': 1, 'end_of_results': False}
-            scrape_worker(election_identifier, state_code, results, state, thread_lock, True)
+            scrape_worker(election_identifier, state_code, results, state, thread_lock,
+                          True, args.engine, pool)
         else:
-            num_workers = 5
-            state = {'current': 1, 'end_of_results': False}
             with ThreadPoolExecutor(max_workers=num_workers) as executor:
                 futures = [
                     executor.submit(scrape_worker, election_identifier, state_code,
-                                    results, state, thread_lock, False)
+                                    results, state, thread_lock, False, args.engine, pool)
                     for _ in range(num_workers)
                 ]
                 for future in as_completed(futures):
@@ -150,12 +172,21 @@ def main():
                         print(f"Worker error: {e}")
 
         total_time = perf_counter() - start_time
-        print(f"\nScraped {len(results)} constituencies in {total_time:.1f}s")
+        print(f"\nScraped {len(results)} of {len(acs)} constituencies in {total_time:.1f}s")
+        if state['missing']:
+            print(f"Missing pages: ACs {sorted(state['missing'])}")
 
     except Exception as e:
         print(f"Scraping stopped due to error: {e}")
     finally:
-        driver.quit()
+        stats = pool.stats()
+        if stats["checkouts"]:
+            print(f"Chrome pool: {stats['created']} started, {stats['checkouts']} checkouts, "
+                  f"avg wait {stats['wait_avg_s']}s, recycled {stats['recycled']}")
+        pool.close()
+        if args.engine == "http":
+            print(f"Rate controller: {throttle.get_controller().stats()}")
+        close_fetcher()
 
     if not results:
         print("No results to save.")
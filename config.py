@@ -32,6 +32,14 @@ def get_election_id() -> str:
     return _parse_url(urls[0])[0] if urls else ""
 
 
+def get_state_urls() -> dict[str, str]:
+    """{state_code: party-wise results URL}, in election.conf order."""
+    urls = {}
+    for url in _load_urls():
+        urls.setdefault(_parse_url(url)[1], url)
+    return urls
+
+
 def get_tracked_states() -> list[dict]:
     """Derive tracked states from election.conf + DB."""
     seen = {}
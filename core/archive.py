@@ -0,0 +1,151 @@
+"""
+Content-addressed archive of raw ECI pages.
+
+Every page the live scraper parses can be kept here, so that a parser bug
+found after counting day can be fixed and the archive re-parsed
+(``eci-live-scraper.py --replay``), and so that parser benchmarks can run
+on real pages.
+
+Layout under the archive root::
+
+    objects/ab/ab12...ef.zst   one zstd-compressed body per distinct page
+    index.jsonl                {"url", "fetched_at", "hash", "status"} per fetch
+
+Objects are named by the body's blake2b digest (the same digest as
+``FetchResult.digest``), so a page fetched again unchanged, or the same
+page under several URLs, is stored once.  zstd comes from the standard
+library's ``compression.zstd`` (Python 3.14+) or the ``zstandard``
+package; without either, objects are gzip-compressed instead.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+try:
+    from compression import zstd as _zstd
+
+    HAS_ZSTD = True
+except ImportError:
+    try:
+        import zstandard as _zstandard
+
+        HAS_ZSTD = True
+    except ImportError:
+        HAS_ZSTD = False
+
+ZSTD_LEVEL = 9
+INDEX_FILE = "index.jsonl"
+
+
+def _digest(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _compress(body: bytes, level: int) -> tuple[bytes, str]:
+    """(compressed bytes, file suffix)."""
+    if not HAS_ZSTD:
+        return gzip.compress(body, compresslevel=6), ".gz"
+    if "_zstd" in globals():
+        return _zstd.compress(body, level=level), ".zst"
+    return _zstandard.ZstdCompressor(level=level).compress(body), ".zst"
+
+
+def _decompress(data: bytes, suffix: str) -> bytes:
+    if suffix == ".gz":
+        return gzip.decompress(data)
+    if not HAS_ZSTD:
+        raise RuntimeError("archive holds zstd objects: install zstandard or use Python 3.14+")
+    if "_zstd" in globals():
+        return _zstd.decompress(data)
+    return _zstandard.ZstdDecompressor().decompress(data)
+
+
+class PageArchive:
+    """Append-only page store; safe to ``put`` from many threads."""
+
+    def __init__(self, root: str, level: int = ZSTD_LEVEL):
+        self.root = root
+        self.level = level
+        self._index_path = os.path.join(root, INDEX_FILE)
+        self._index = None
+        self._lock = threading.Lock()
+        self._stats = {"pages": 0, "stored": 0, "bytes_in": 0, "bytes_stored": 0}
+
+    def _object_path(self, digest: str, suffix: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest + suffix)
+
+    def _find(self, digest: str) -> str | None:
+        for suffix in (".zst", ".gz"):
+            path = self._object_path(digest, suffix)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def put(self, url: str, body: bytes, fetched_at: str | None = None,
+            status: int = 200, digest: str | None = None) -> str:
+        """Store ``body`` (once per distinct content) and index the fetch.
+
+        Returns the content hash.
+        """
+        digest = digest or _digest(body)
+        stored = 0
+        if self._find(digest) is None:
+            data, suffix = _compress(body, self.level)
+            path = self._object_path(digest, suffix)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            stored = len(data)
+        line = json.dumps({
+            "url": url,
+            "fetched_at": fetched_at or datetime.now(timezone.utc).isoformat(),
+            "hash": digest,
+            "status": status,
+        })
+        with self._lock:
+            if self._index is None:
+                os.makedirs(self.root, exist_ok=True)
+                self._index = open(self._index_path, "a", encoding="utf-8")
+            self._index.write(line + "\n")
+            self._index.flush()
+            self._stats["pages"] += 1
+            self._stats["bytes_in"] += len(body)
+            if stored:
+                self._stats["stored"] += 1
+                self._stats["bytes_stored"] += stored
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        path = self._find(digest)
+        if path is None:
+            raise KeyError(digest)
+        with open(path, "rb") as f:
+            return _decompress(f.read(), os.path.splitext(path)[1])
+
+    def entries(self):
+        """Index entries in the order they were written."""
+        if not os.path.exists(self._index_path):
+            return
+        with open(self._index_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue  # torn last line after a crash
+
+    def stats(self) -> dict:
+        """Pages indexed and objects written by this process."""
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._index is not None:
+                self._index.close()
+                self._index = None
@@ -1,8 +1,33 @@
-"""Browser configuration and driver factory for ECI scraping."""
+"""Browser configuration, driver factory and shared driver pool for ECI scraping."""
+
+import base64
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from urllib.parse import urlsplit
 
 from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options
 
+from core.fetch import DEFAULT_TIMEOUT, FetchResult, _Fetcher
+
+try:
+    import psutil
+
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
 
 def create_chrome_driver():
     """Create and configure Chrome WebDriver instance."""
@@ -21,4 +46,445 @@ def create_chrome_driver():
     driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
         "source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
     })
-    return driver
\ No newline at end of file
+    return driver
+
+
+# ---------------------------------------------------------------------------
+# Driver pool
+# ---------------------------------------------------------------------------
+# Starting Chrome costs ~5s, so drivers are kept warm and shared: callers
+# check one out, load their pages and check it back in.  A driver is
+# health-checked before it is handed out and is replaced after
+# ``max_pages`` page loads, when its process tree grows past
+# ``max_memory_mb`` (needs psutil) or when a WebDriver call breaks it.
+
+POOL_SIZE = int(os.environ.get("CHROME_POOL_SIZE", "2"))
+POOL_MAX_PAGES = int(os.environ.get("CHROME_POOL_MAX_PAGES", "200"))
+POOL_MAX_MEMORY_MB = int(os.environ.get("CHROME_POOL_MAX_MEMORY_MB", "1024"))
+FETCH_BATCH = int(os.environ.get("CHROME_FETCH_BATCH", "32"))  # URLs per in-browser fetch script
+
+# Errors about the page, not the browser: the driver is still fine to reuse
+_PAGE_ERRORS = (TimeoutException, NoSuchElementException, StaleElementReferenceException)
+
+
+class _PooledDriver:
+    __slots__ = ("driver", "pages", "created")
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.created = time.monotonic()
+
+
+class DriverPool:
+    """Thread-safe pool of warm Chrome drivers.
+
+    ``checkout`` blocks while ``size`` drivers are in use; ``warm(n)``
+    starts drivers in the background so the first callers do not pay for
+    Chrome start-up.  ``stats()`` reports checkouts, wait times and why
+    drivers were recycled.
+    """
+
+    def __init__(self, size: int = POOL_SIZE, factory=create_chrome_driver,
+                 max_pages: int = POOL_MAX_PAGES,
+                 max_memory_mb: int | None = POOL_MAX_MEMORY_MB):
+        self.size = max(1, size)
+        self.factory = factory
+        self.max_pages = max_pages
+        self.max_memory_mb = max_memory_mb if HAS_PSUTIL else None
+        self._cond = threading.Condition()
+        self._idle: deque[_PooledDriver] = deque()
+        self._leased: dict[int, _PooledDriver] = {}
+        self._total = 0  # idle + leased + starting
+        self._closed = False
+        self._fetcher: BrowserFetcher | None = None
+        self._stats = {
+            "created": 0,
+            "create_failures": 0,
+            "checkouts": 0,
+            "wait_total_s": 0.0,
+            "wait_max_s": 0.0,
+            "recycled": {"pages": 0, "memory": 0, "unhealthy": 0, "broken": 0},
+        }
+
+    # -- leasing ------------------------------------------------------------
+
+    def checkout(self, timeout: float | None = None):
+        """Take a healthy driver, starting one if the pool is not full.
+
+        Raises TimeoutError if none is free within ``timeout`` seconds.
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        while True:
+            entry = None
+            with self._cond:
+                while not self._idle and self._total >= self.size:
+                    if self._closed:
+                        raise RuntimeError("driver pool is closed")
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"no Chrome driver free within {timeout}s")
+                    self._cond.wait(remaining)
+                if self._idle:
+                    entry = self._idle.pop()  # most recently used: warm caches
+                else:
+                    self._total += 1
+
+            if entry is None:
+                entry = self._start()
+            elif not self._healthy(entry):
+                self._discard(entry, "unhealthy")
+                continue
+
+            waited = time.monotonic() - started
+            with self._cond:
+                self._leased[id(entry.driver)] = entry
+                self._stats["checkouts"] += 1
+                self._stats["wait_total_s"] += waited
+                self._stats["wait_max_s"] = max(self._stats["wait_max_s"], waited)
+            return entry.driver
+
+    def checkin(self, driver, pages: int = 1, broken: bool = False) -> None:
+        """Return a driver after loading ``pages`` pages with it."""
+        with self._cond:
+            entry = self._leased.pop(id(driver), None)
+        if entry is None:
+            return
+        entry.pages += pages
+        if broken:
+            reason = "broken"
+        elif entry.pages >= self.max_pages:
+            reason = "pages"
+        elif self.max_memory_mb and self._memory_mb(entry) > self.max_memory_mb:
+            reason = "memory"
+        else:
+            reason = None
+
+        if reason:
+            self._discard(entry, reason)
+            return
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+            else:
+                self._idle.append(entry)
+                self._cond.notify()
+                return
+        _quit(entry.driver)
+
+    @contextmanager
+    def lease(self, pages: int = 1, timeout: float | None = None):
+        """``with pool.lease() as driver:`` — checkout/checkin around a block.
+
+        A WebDriverException other than a page-level timeout or missing
+        element marks the driver as broken so it is replaced.
+        """
+        driver = self.checkout(timeout)
+        broken = False
+        try:
+            yield driver
+        except WebDriverException as e:
+            broken = not isinstance(e, _PAGE_ERRORS)
+            raise
+        finally:
+            self.checkin(driver, pages=pages, broken=broken)
+
+    def fetcher(self) -> "BrowserFetcher":
+        """This pool's BrowserFetcher (fetch() inside its drivers), created on first use."""
+        with self._cond:
+            if self._fetcher is None:
+                self._fetcher = BrowserFetcher(self)
+            return self._fetcher
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def warm(self, n: int | None = None) -> None:
+        """Start up to ``n`` (default: size) idle drivers in the background."""
+        with self._cond:
+            n = min(self.size if n is None else n, self.size - self._total)
+            self._total += max(n, 0)
+        for _ in range(max(n, 0)):
+            threading.Thread(target=self._warm_one, name="chrome-warm", daemon=True).start()
+
+    def _warm_one(self) -> None:
+        try:
+            entry = self._start()
+        except Exception:
+            return
+        with self._cond:
+            if self._closed:
+                self._total -= 1
+            else:
+                self._idle.append(entry)
+                self._cond.notify()
+                return
+        _quit(entry.driver)
+
+    def close(self) -> None:
+        """Quit idle drivers; leased ones are quit when checked back in."""
+        with self._cond:
+            fetcher, self._fetcher = self._fetcher, None
+        if fetcher is not None:
+            fetcher.close()
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._total -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            _quit(entry.driver)
+
+    def stats(self) -> dict:
+        with self._cond:
+            checkouts = self._stats["checkouts"]
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": len(self._leased),
+                "starting": self._total - len(self._idle) - len(self._leased),
+                "created": self._stats["created"],
+                "create_failures": self._stats["create_failures"],
+                "checkouts": checkouts,
+                "wait_avg_s": round(self._stats["wait_total_s"] / checkouts, 3) if checkouts else 0.0,
+                "wait_max_s": round(self._stats["wait_max_s"], 3),
+                "recycled": dict(self._stats["recycled"]),
+                "max_pages": self.max_pages,
+                "max_memory_mb": self.max_memory_mb,
+            }
+
+    # -- internals ----------------------------------------------------------
+
+    def _start(self) -> _PooledDriver:
+        """Create a driver for a slot already counted in ``_total``."""
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._total -= 1
+                self._stats["create_failures"] += 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._stats["created"] += 1
+        return _PooledDriver(driver)
+
+    def _discard(self, entry: _PooledDriver, reason: str) -> None:
+        _quit(entry.driver)
+        with self._cond:
+            self._total -= 1
+            self._stats["recycled"][reason] += 1
+            self._cond.notify()
+
+    @staticmethod
+    def _healthy(entry: _PooledDriver) -> bool:
+        try:
+            return entry.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _memory_mb(entry: _PooledDriver) -> float:
+        """RSS of chromedriver plus every Chrome process it started."""
+        try:
+            root = psutil.Process(entry.driver.service.process.pid)
+            procs = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in procs) / 2**20
+        except Exception:
+            return 0.0
+
+
+# ---------------------------------------------------------------------------
+# In-browser fetching
+# ---------------------------------------------------------------------------
+
+# arguments: urls, per-URL request headers, timeout (ms), callback.  Bodies
+# come back base64-encoded so the parsers see the exact bytes served.
+_FETCH_SCRIPT = """
+const [urls, headers, timeoutMs, done] = arguments;
+Promise.all(urls.map(async (url, i) => {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), timeoutMs);
+    const started = performance.now();
+    try {
+        const response = await fetch(url, {headers: headers[i], credentials: "include",
+                                           cache: "no-store", signal: controller.signal});
+        const bytes = new Uint8Array(await response.arrayBuffer());
+        let binary = "";
+        for (let j = 0; j < bytes.length; j += 0x8000) {
+            binary += String.fromCharCode.apply(null, bytes.subarray(j, j + 0x8000));
+        }
+        return {status: response.status, body: btoa(binary),
+                headers: Object.fromEntries(response.headers.entries()),
+                elapsed: (performance.now() - started) / 1000};
+    } catch (e) {
+        return {status: 0, error: e.name === "AbortError" ? "timed out" : String(e),
+                elapsed: (performance.now() - started) / 1000};
+    } finally {
+        clearTimeout(timer);
+    }
+})).then(done);
+"""
+
+_BATCH_LINGER = 0.02  # seconds to wait for more URLs before sending a batch
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class BrowserFetcher(_Fetcher):
+    """Fetcher that runs ``fetch()`` inside the pool's Chrome drivers.
+
+    When Akamai refuses plain HTTP, a Chrome that has loaded one page of
+    the site can still fetch the rest: the requests carry the browser's TLS
+    fingerprint and cookies, but nothing is rendered or navigated to.
+    Submitted URLs are gathered into batches of up to ``batch``; each
+    batch is one ``execute_async_script`` call on a leased driver, after
+    one real page load if the driver is not on that site yet.
+
+    Same interface as the core.fetch fetchers, with the raw page bytes as
+    ``FetchResult.body``, so the results feed core.parser unchanged.  No
+    ``controller`` by default: browser timings say more about Chrome than
+    about ECI.
+    """
+
+    def __init__(self, pool: DriverPool | None = None, batch: int = FETCH_BATCH,
+                 timeout: int = DEFAULT_TIMEOUT):
+        self.pool = pool
+        self.batch = max(1, batch)
+        self.timeout = timeout
+        self._queue: queue.Queue = queue.Queue()
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {"batches": 0, "pages": 0, "navigations": 0, "failed_batches": 0}
+
+    def submit(self, url: str, headers: dict | None = None,
+               timeout: int | None = None) -> Future:
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("browser fetcher is closed")
+            self._queue.put((url, headers or {}, timeout or self.timeout, future))
+            # One dispatcher per driver the pool may lend out
+            if len(self._threads) < self._pool().size:
+                thread = threading.Thread(target=self._run, name="chrome-fetch", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+        for thread in threads:
+            thread.join()
+        while True:  # URLs nobody will fetch now
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[3].set_running_or_notify_cancel():
+                item[3].set_exception(RuntimeError("browser fetcher is closed"))
+
+    # -- internals ----------------------------------------------------------
+
+    def _pool(self) -> DriverPool:
+        return self.pool or get_driver_pool()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            linger_until = time.monotonic() + _BATCH_LINGER
+            while len(batch) < self.batch:
+                try:
+                    item = self._queue.get(timeout=max(0.0, linger_until - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)  # finish this batch, then stop
+                    break
+                batch.append(item)
+            batch = [item for item in batch if item[3].set_running_or_notify_cancel()]
+
+            by_origin: dict[str, list] = {}
+            for item in batch:
+                by_origin.setdefault(_origin(item[0]), []).append(item)
+            for items in by_origin.values():
+                for (_, _, _, future), result in zip(items, self._fetch_batch(items)):
+                    future.set_result(result)
+
+    def _fetch_batch(self, items: list) -> list[FetchResult]:
+        urls = [url for url, _, _, _ in items]
+        timeout = max(t for _, _, t, _ in items)
+        navigated = False
+        try:
+            # Every fetch() counts towards the driver's recycle threshold
+            with self._pool().lease(pages=len(items)) as driver:
+                if _origin(driver.current_url) != _origin(urls[0]):
+                    # One real page load: cookies, and Akamai's script runs once
+                    driver.get(urls[0])
+                    navigated = True
+                driver.set_script_timeout(timeout + 5)
+                raw = driver.execute_async_script(
+                    _FETCH_SCRIPT, urls, [headers for _, headers, _, _ in items], timeout * 1000)
+        except Exception as e:
+            with self._lock:
+                self._stats["failed_batches"] += 1
+                self._stats["navigations"] += navigated
+            return [FetchResult(url=url, error=f"browser fetch failed: {e}") for url in urls]
+
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["pages"] += len(urls)
+            self._stats["navigations"] += navigated
+        return [
+            FetchResult(
+                url=url,
+                status=r.get("status") or 0,
+                body=base64.b64decode(r.get("body") or ""),
+                headers={k.lower(): v for k, v in (r.get("headers") or {}).items()},
+                elapsed=r.get("elapsed") or 0.0,
+                error=r.get("error"),
+            )
+            for url, r in zip(urls, raw)
+        ]
+
+
+def _quit(driver) -> None:
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+_pool: DriverPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """The process-wide pool of ``create_chrome_driver`` drivers."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+        return _pool
+
+
+def close_driver_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
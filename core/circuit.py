@@ -0,0 +1,119 @@
+"""
+Per-host circuit breaker for the plain-HTTP path.
+
+When ECI (Akamai) starts refusing or dropping our requests, every page
+would otherwise still be tried over HTTP first, time out or be denied, and
+then fall back to Chrome.  A breaker counts consecutive failures per host:
+
+* CLOSED    — requests go through; FAILURE_THRESHOLD failures in a row open it.
+* OPEN      — requests are not sent (callers go straight to their
+              fallback) until ``reset_timeout`` has passed.
+* HALF_OPEN — one probe request is let through: success closes the
+              breaker, failure opens it again for twice as long (up to
+              MAX_RESET_TIMEOUT).
+
+Only failures that say something about the host count (Access Denied,
+429/503, timeouts, connection errors); a 404 or a page the parser cannot
+read is a success for the breaker.
+"""
+
+import threading
+import time
+
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0        # seconds open before the first probe
+MAX_RESET_TIMEOUT = 300.0
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe closed / open / half-open breaker."""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD,
+                 reset_timeout: float = RESET_TIMEOUT,
+                 max_reset_timeout: float = MAX_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.base_timeout = reset_timeout
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self._stats = {"opened": 0, "rejected": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """May a request go out now?  In HALF_OPEN only one probe at a time may."""
+        with self._lock:
+            if self._state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    self._stats["rejected"] += 1
+                    return False
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN:
+                if self._probing:
+                    self._stats["rejected"] += 1
+                    return False
+                self._probing = True
+            return True
+
+    def cancel(self) -> None:
+        """Hand back a request ``allow()`` let through that never reached the host."""
+        with self._lock:
+            self._probing = False
+
+    def record(self, ok: bool) -> None:
+        """Report the outcome of a request ``allow()`` let through."""
+        with self._lock:
+            if ok:
+                self._state = CLOSED
+                self._failures = 0
+                self._probing = False
+                self.reset_timeout = self.base_timeout
+                return
+            self._failures += 1
+            if self._state == HALF_OPEN:
+                self.reset_timeout = min(self.max_reset_timeout, self.reset_timeout * 2)
+            elif self._failures < self.failure_threshold:
+                return
+            self._state = OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
+            self._stats["opened"] += 1
+
+    def stats(self) -> dict:
+        state = self.state
+        with self._lock:
+            return {"state": state, "failures": self._failures,
+                    "reset_timeout": self.reset_timeout, **self._stats}
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(host: str) -> CircuitBreaker:
+    """The process-wide breaker for ``host``."""
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker()
+        return breaker
+
+
+def breaker_stats() -> dict[str, dict]:
+    """{host: stats} for every host seen so far."""
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {host: breaker.stats() for host, breaker in breakers.items()}
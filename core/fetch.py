@@ -0,0 +1,467 @@
+"""Pooled HTTP fetch engine for ECI result pages.
+
+ECI sits behind Akamai, which blocks Python TLS stacks but lets curl
+through.  Spawning a ``curl`` process per page pays a fork, a DNS lookup
+and a full TLS handshake every time, so this module keeps one long-lived
+libcurl multi handle (via pycurl) that every worker thread submits to.
+Connections stay open, TLS sessions and DNS answers are shared, responses
+are requested compressed, and many transfers run at once.
+
+If pycurl is not installed, ``SubprocessFetcher`` provides the same
+interface on top of the ``curl`` binary.
+
+A ``ValidatorCache`` passed to ``fetch``/``fetch_many`` turns them into
+conditional GETs: ETag / Last-Modified are sent back to the server, and a
+304 or a byte-identical body is flagged as ``unchanged``.
+
+A fetcher with a ``controller`` (core.throttle; the shared fetcher from
+``get_fetcher`` has one) waits for a rate token and an in-flight slot
+before each request and reports how it went.  The wait comes out of the
+request's timeout: a request still waiting when that runs out fails with
+SLOT_TIMEOUT without being sent.  One with a ``session``
+(core.session.SessionBroker; the shared fetcher has one too) sends the
+cookies of a Chrome session once plain requests start being denied.
+"""
+
+import hashlib
+import json
+import math
+import os
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from io import BytesIO
+
+from core import throttle
+from core.session import SESSION_HANDOFF, get_session_broker
+
+try:
+    import pycurl
+
+    HAS_PYCURL = True
+except ImportError:
+    HAS_PYCURL = False
+
+DEFAULT_TIMEOUT = 15
+DEFAULT_MAX_CONNECTIONS = 16
+# FetchResult.error of a request the rate controller held until its timeout ran out
+SLOT_TIMEOUT = "timed out waiting for a rate-controller slot"
+
+
+@dataclass
+class FetchResult:
+    """Outcome of a single HTTP fetch."""
+    url: str
+    status: int = 0          # HTTP status code, 0 if the transfer failed
+    body: bytes = b""
+    headers: dict = field(default_factory=dict)  # lower-cased names
+    elapsed: float = 0.0
+    error: str | None = None  # transport error (DNS, connect, timeout)
+    unchanged: bool = False   # set by ValidatorCache: 304 or same body as last time
+
+    @property
+    def ok(self) -> bool:
+        """True if the transfer completed (any HTTP status)."""
+        return self.error is None
+
+    @property
+    def digest(self) -> str:
+        return hashlib.blake2b(self.body, digest_size=16).hexdigest()
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+def _parse_header_lines(lines: list[bytes]) -> dict:
+    """Parse raw header lines, keeping only the last response's headers."""
+    headers = {}
+    for raw in lines:
+        line = raw.decode("iso-8859-1").strip()
+        if line.startswith("HTTP/"):
+            headers = {}  # new response (redirect hop) — start over
+            continue
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _header_list(headers: dict | None) -> list[str]:
+    return [f"{k}: {v}" for k, v in (headers or {}).items()]
+
+
+# ---------------------------------------------------------------------------
+# Conditional GET support
+# ---------------------------------------------------------------------------
+
+class ValidatorCache:
+    """Per-URL ETag, Last-Modified and body digest, kept across cycles.
+
+    Callers ``store`` a response only once it has been fully processed, so
+    a page whose parse or DB write failed is fetched and handled in full
+    next time.  ``save``/``load`` persist the cache as JSON between runs.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        if path and os.path.exists(path):
+            self.load()
+
+    def conditional_headers(self, url: str) -> dict:
+        with self._lock:
+            entry = self._entries.get(url)
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def check(self, result: FetchResult) -> FetchResult:
+        """Set ``result.unchanged`` for a 304 or a body seen last time."""
+        if not result.ok:
+            return result
+        if result.status == 304:
+            result.unchanged = True
+        elif result.status == 200:
+            with self._lock:
+                entry = self._entries.get(result.url)
+            result.unchanged = bool(entry) and entry.get("digest") == result.digest
+        return result
+
+    def store(self, result: FetchResult) -> None:
+        """Remember a fully processed 200 response (304s keep the old entry)."""
+        if not result.ok or result.status != 200:
+            return
+        entry = {
+            "etag": result.headers.get("etag"),
+            "last_modified": result.headers.get("last-modified"),
+            "digest": result.digest,
+        }
+        with self._lock:
+            self._entries[result.url] = entry
+
+    def forget(self, url: str) -> None:
+        with self._lock:
+            self._entries.pop(url, None)
+
+    def load(self) -> None:
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        with self._lock:
+            self._entries = entries
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            data = json.dumps(self._entries)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            f.write(data)
+        os.replace(tmp, self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def outcome(result: FetchResult) -> str:
+    """Classify a response for the rate controller."""
+    if result.error is not None:
+        timed_out = "timed out" in result.error.lower() or result.error == "curl exit 28"
+        return throttle.TIMEOUT if timed_out else throttle.ERROR
+    if result.status in (403, 429, 503) or b"Access Denied" in result.body[:500]:
+        return throttle.DENIED
+    return throttle.OK
+
+
+class _Fetcher:
+    """Blocking helpers shared by both engines; subclasses provide ``submit``."""
+
+    controller: throttle.AimdController | None = None
+    session = None  # core.session.SessionBroker
+    timeout: int = DEFAULT_TIMEOUT
+
+    def _submit(self, url: str, headers: dict | None, timeout: int | None,
+                deadline: float | None = None) -> Future:
+        """
+        ``submit`` gated by the rate controller and with the session's headers, if any.
+
+        The controller is waited for until ``deadline`` (monotonic; default
+        ``timeout`` from now), and the transfer gets what is left of it.
+        """
+        controller, session = self.controller, self.session
+        if session is not None:
+            headers = {**session.headers(url), **(headers or {})}
+        if controller is None and session is None:
+            return self.submit(url, headers, timeout)
+        if controller is not None:
+            if deadline is None:
+                deadline = time.monotonic() + (timeout or self.timeout)
+            if not controller.acquire(max(0.0, deadline - time.monotonic())):
+                future = Future()
+                future.set_result(FetchResult(url, error=SLOT_TIMEOUT))
+                return future
+            timeout = max(1, math.ceil(deadline - time.monotonic()))
+        started = time.monotonic()
+        try:
+            future = self.submit(url, headers, timeout)
+        except Exception:
+            if controller is not None:
+                controller.release(throttle.ERROR, time.monotonic() - started)
+            raise
+
+        def done(f: Future) -> None:
+            result_outcome = outcome(f.result())
+            if controller is not None:
+                controller.release(result_outcome, time.monotonic() - started)
+            if session is not None:
+                session.report(url, result_outcome)
+
+        future.add_done_callback(done)
+        return future
+
+    def fetch(self, url: str, headers: dict | None = None,
+              timeout: int | None = None,
+              cache: ValidatorCache | None = None) -> FetchResult:
+        """Fetch one URL, blocking until the transfer completes."""
+        if cache is not None:
+            headers = {**(headers or {}), **cache.conditional_headers(url)}
+        result = self._submit(url, headers, timeout).result()
+        return cache.check(result) if cache is not None else result
+
+    def fetch_many(self, urls: list[str], headers: dict | None = None,
+                   timeout: int | None = None,
+                   cache: ValidatorCache | None = None) -> dict[str, FetchResult]:
+        """Fetch several URLs concurrently. Returns {url: FetchResult}."""
+        futures = {}
+        deadline = time.monotonic() + (timeout or self.timeout)  # one wait for the whole batch
+        for url in urls:
+            h = headers
+            if cache is not None:
+                h = {**(headers or {}), **cache.conditional_headers(url)}
+            futures[url] = self._submit(url, h, timeout, deadline)
+        results = {url: f.result() for url, f in futures.items()}
+        if cache is not None:
+            for result in results.values():
+                cache.check(result)
+        return results
+
+
+class CurlFetcher(_Fetcher):
+    """Thread-safe fetcher backed by a single libcurl multi handle.
+
+    Worker threads call ``fetch`` (blocking) or ``submit`` (returns a
+    Future); a background thread drives all transfers.  The multi handle's
+    connection cache keeps sockets to results.eci.gov.in open across
+    pages, and the share handle reuses TLS sessions and DNS lookups.
+    """
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: int = DEFAULT_TIMEOUT):
+        if not HAS_PYCURL:
+            raise RuntimeError("pycurl is not installed")
+        self.timeout = timeout
+        self._multi = pycurl.CurlMulti()
+        self._multi.setopt(pycurl.M_MAX_HOST_CONNECTIONS, max_connections)
+        self._multi.setopt(pycurl.M_MAX_TOTAL_CONNECTIONS, max_connections)
+        self._multi.setopt(pycurl.M_MAXCONNECTS, max_connections)
+        self._multi.setopt(pycurl.M_PIPELINING, pycurl.PIPE_MULTIPLEX)
+        self._share = pycurl.CurlShare()
+        self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_DNS)
+        self._share.setopt(pycurl.SH_SHARE, pycurl.LOCK_DATA_SSL_SESSION)
+        self._user_agent = f"curl/{pycurl.version_info()[1]}"
+        self._idle: list = []
+        self._pending: queue.SimpleQueue = queue.SimpleQueue()
+        self._active = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="curl-multi", daemon=True)
+        self._thread.start()
+
+    # -- public API ---------------------------------------------------------
+
+    def submit(self, url: str, headers: dict | None = None,
+               timeout: int | None = None) -> Future:
+        """Queue a GET for ``url``; the Future resolves to a FetchResult."""
+        if self._closed:
+            raise RuntimeError("fetcher is closed")
+        future: Future = Future()
+        self._pending.put((url, headers, timeout or self.timeout, future))
+        return future
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._pending.put(None)
+        self._thread.join(timeout=5)
+
+    # -- transfer loop ------------------------------------------------------
+
+    def _start(self, url: str, headers: dict | None, timeout: int, future: Future) -> None:
+        if self._idle:
+            c = self._idle.pop()
+        else:
+            c = pycurl.Curl()
+            c.setopt(pycurl.SHARE, self._share)
+        buf = BytesIO()
+        header_lines: list[bytes] = []
+        c.setopt(pycurl.URL, url)
+        c.setopt(pycurl.WRITEDATA, buf)
+        c.setopt(pycurl.HEADERFUNCTION, header_lines.append)
+        c.setopt(pycurl.FOLLOWLOCATION, 1)
+        c.setopt(pycurl.MAXREDIRS, 5)
+        c.setopt(pycurl.TIMEOUT, timeout)
+        c.setopt(pycurl.CONNECTTIMEOUT, min(timeout, 10))
+        c.setopt(pycurl.NOSIGNAL, 1)
+        c.setopt(pycurl.ENCODING, "")  # advertise every encoding libcurl can decode
+        c.setopt(pycurl.USERAGENT, self._user_agent)
+        c.setopt(pycurl.HTTPHEADER, _header_list(headers))
+        c._job = (url, buf, header_lines, future, time.perf_counter())
+        self._multi.add_handle(c)
+        self._active += 1
+
+    def _finish(self, c, error: str | None) -> None:
+        url, buf, header_lines, future, started = c._job
+        result = FetchResult(
+            url=url,
+            status=c.getinfo(pycurl.RESPONSE_CODE) if error is None else 0,
+            body=buf.getvalue() if error is None else b"",
+            headers=_parse_header_lines(header_lines),
+            elapsed=time.perf_counter() - started,
+            error=error,
+        )
+        self._multi.remove_handle(c)
+        c._job = None
+        self._idle.append(c)
+        self._active -= 1
+        future.set_result(result)
+
+    def _drain_pending(self, block: bool) -> bool:
+        """Move queued requests onto the multi handle. False on shutdown."""
+        while True:
+            try:
+                item = self._pending.get(block=block)
+            except queue.Empty:
+                return True
+            if item is None:
+                return False
+            try:
+                self._start(*item)
+            except Exception as e:
+                item[3].set_result(FetchResult(url=item[0], error=str(e)))
+            block = False
+
+    def _run(self) -> None:
+        running = True
+        while running or self._active:
+            if running:
+                running = self._drain_pending(block=self._active == 0)
+            while True:
+                ret, _ = self._multi.perform()
+                if ret != pycurl.E_CALL_MULTI_PERFORM:
+                    break
+            while True:
+                _, ok_list, err_list = self._multi.info_read()
+                for c in ok_list:
+                    self._finish(c, None)
+                for c, _errno, errmsg in err_list:
+                    self._finish(c, errmsg or "curl error")
+                if not ok_list and not err_list:
+                    break
+            if self._active:
+                # curl's own timeout hint covers connect/DNS phases with no fds yet
+                hint_ms = self._multi.timeout()
+                wait = 0.01 if hint_ms < 0 else min(hint_ms / 1000, 0.01)
+                if wait > 0:
+                    self._multi.select(wait)
+        for c in self._idle:
+            c.close()
+        self._multi.close()
+
+
+class SubprocessFetcher(_Fetcher):
+    """Same interface as CurlFetcher, spawning one ``curl`` per page.
+
+    Used when pycurl is unavailable, and as the baseline in benchmarks.
+    """
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: int = DEFAULT_TIMEOUT, compressed: bool = True):
+        self.timeout = timeout
+        self.compressed = compressed
+        self._executor = ThreadPoolExecutor(max_workers=max_connections,
+                                            thread_name_prefix="curl-proc")
+
+    def _run_curl(self, url: str, headers: dict | None = None,
+                  timeout: int | None = None) -> FetchResult:
+        timeout = timeout or self.timeout
+        cmd = ["curl", "-s", "-L", "-D", "-", "--max-time", str(timeout)]
+        if self.compressed:
+            cmd.append("--compressed")
+        for h in _header_list(headers):
+            cmd += ["-H", h]
+        cmd.append(url)
+        started = time.perf_counter()
+        try:
+            r = subprocess.run(cmd, capture_output=True, timeout=timeout + 5)
+        except Exception as e:
+            return FetchResult(url=url, error=str(e), elapsed=time.perf_counter() - started)
+        elapsed = time.perf_counter() - started
+        if r.returncode != 0:
+            return FetchResult(url=url, error=f"curl exit {r.returncode}", elapsed=elapsed)
+
+        # -D - writes every response's headers ahead of the final body
+        out = r.stdout
+        header_lines: list[bytes] = []
+        status = 0
+        while out.startswith(b"HTTP/"):
+            head, _, out = out.partition(b"\r\n\r\n")
+            lines = head.split(b"\r\n")
+            status = int(lines[0].split()[1])
+            header_lines += lines
+        return FetchResult(url=url, status=status, body=out,
+                           headers=_parse_header_lines(header_lines), elapsed=elapsed)
+
+    def submit(self, url: str, headers: dict | None = None,
+               timeout: int | None = None) -> Future:
+        return self._executor.submit(self._run_curl, url, headers, timeout)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide shared fetcher
+# ---------------------------------------------------------------------------
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher():
+    """Return the process-wide fetcher, creating it on first use."""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = CurlFetcher() if HAS_PYCURL else SubprocessFetcher()
+            _fetcher.controller = throttle.get_controller()
+            if SESSION_HANDOFF:
+                _fetcher.session = get_session_broker()
+        return _fetcher
+
+
+def close_fetcher() -> None:
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is not None:
+            _fetcher.close()
+            _fetcher = None
@@ -0,0 +1,155 @@
+"""
+Where Roundwise pages are parsed.
+
+Fetching a page is network I/O and runs on the live scraper's worker
+threads; parsing it is CPU work, and on a GIL build those threads parse one
+page at a time however many of them there are.  So the parse stage runs on
+its own executor, handed the raw page bytes:
+
+* ``thread``      — on the calling worker thread itself.  Parallel only on
+                    a free-threaded (no-GIL) build.
+* ``process``     — a ProcessPoolExecutor, one process per core.
+* ``interpreter`` — concurrent.futures.InterpreterPoolExecutor (Python
+                    3.14+): one sub-interpreter, with its own GIL, per core.
+
+``auto`` (the default) picks ``thread`` on a free-threaded build or a
+single core, otherwise ``process``.  Sub-interpreters are opt-in: every
+module the parser imports must support them.  ``bench.py executors``
+measures pages parsed per second per core for each option.
+
+Jobs must be importable module-level functions (e.g.
+core.parser.parse_roundwise) with picklable arguments and results.
+"""
+
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+
+try:
+    from concurrent.futures import InterpreterPoolExecutor
+
+    HAS_INTERPRETERS = True
+except ImportError:  # Python < 3.14
+    HAS_INTERPRETERS = False
+
+EXECUTORS = ("auto", "thread", "process", "interpreter")
+
+
+def free_threaded() -> bool:
+    """True on a free-threaded build running with the GIL disabled."""
+    return not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def cpu_count() -> int:
+    """CPUs this process may use."""
+    if hasattr(os, "process_cpu_count"):
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def resolve(kind: str) -> str:
+    """The executor ``kind`` stands for (``auto`` resolved, availability checked)."""
+    if kind not in EXECUTORS:
+        raise ValueError(f"Unknown parse executor: {kind!r} (expected one of {EXECUTORS})")
+    if kind == "auto":
+        return "thread" if free_threaded() or cpu_count() == 1 else "process"
+    if kind == "interpreter" and not HAS_INTERPRETERS:
+        raise ValueError("parse executor 'interpreter' needs Python 3.14+")
+    return kind
+
+
+class ParsePool:
+    """Runs parse jobs on the chosen executor; safe to call from many threads."""
+
+    def __init__(self, kind: str = "auto", workers: int | None = None):
+        self.kind = resolve(kind)
+        self.workers = workers or cpu_count()
+        self._executor = None
+        self._lock = threading.Lock()
+        self._stats = {"jobs": 0, "inline": 0, "wait_s": 0.0, "restarts": 0}
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                if self.kind == "process":
+                    # No fork: the scraper's fetch threads may hold locks
+                    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers, mp_context=multiprocessing.get_context(method))
+                else:
+                    self._executor = InterpreterPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def run(self, fn, *args, timeout: float | None = None):
+        """``fn(*args)`` on the parse executor; its result, or its exception.
+
+        TimeoutError if a pool worker has not returned after ``timeout`` seconds.
+        """
+        started = time.monotonic()
+        inline = self.kind == "thread"
+        if not inline:
+            executor = self._get_executor()
+            try:
+                result = executor.submit(fn, *args).result(timeout)
+            except BrokenExecutor:
+                # A worker died (e.g. OOM-killed): start a fresh pool next
+                # time, parse this page here
+                with self._lock:
+                    if self._executor is executor:
+                        self._executor = None
+                        self._stats["restarts"] += 1
+                executor.shutdown(wait=False, cancel_futures=True)
+                inline = True
+        if inline:
+            result = fn(*args)
+        with self._lock:
+            self._stats["jobs"] += 1
+            self._stats["inline"] += inline
+            self._stats["wait_s"] += time.monotonic() - started
+        return result
+
+    def map(self, fn, iterable, chunksize: int = 1):
+        """``fn`` over ``iterable`` in order (bulk jobs: replay, benchmarks)."""
+        if self.kind == "thread":
+            return map(fn, iterable)
+        return self._get_executor().map(fn, iterable, chunksize=chunksize)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"executor": self.kind, "workers": self.workers,
+                    **{k: (round(v, 2) if isinstance(v, float) else v) for k, v in self._stats.items()}}
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+
+_pool: ParsePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool(kind: str | None = None) -> ParsePool:
+    """
+    The process-wide parse pool.  ``kind`` (default: ECI_PARSE_EXECUTOR or
+    auto) only matters for the first call or after close_parse_pool().
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParsePool(kind or os.environ.get("ECI_PARSE_EXECUTOR", "auto"))
+        return _pool
+
+
+def close_parse_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
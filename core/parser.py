@@ -0,0 +1,394 @@
+"""
+Targeted parsers for ECI Roundwise pages.
+
+A Roundwise page carries every counted round as a pre-rendered
+``<div id="tab{N}">`` table, so late on counting day the page holds 20–30
+tables.  The live scraper only needs four things from it: the ``<title>``,
+the ``<h2>`` heading, the ``round-status`` div and one or more tab tables.
+Constituencywise pages use the same markup for their heading and a single
+results table, so the same classes read those too.
+
+``RoundwisePage`` pulls exactly those out of the raw bytes with compiled
+regular expressions, without building a document tree.  ``Bs4RoundwisePage``
+exposes the same properties on top of BeautifulSoup's ``html.parser`` and
+is the reference implementation / fallback.  Both return raw strings
+(party names are not normalised here) so they can run without a database.
+
+Rounds already stored need not be read again: ``tab_numbers(after=K)``
+lists only the tabs of rounds after K.  The tabs follow the
+``round-status`` div oldest first, so RoundwisePage finds those by
+walking back from the end of the page towards the marker and stops once
+it has every round up to the current one; the older tabs are never
+scanned, let alone parsed.  With ``parse_roundwise(..., known_round=K)``
+the cost of a page late on counting day stays that of its newest tabs.
+"""
+
+import html as _html
+import re
+
+try:
+    from bs4 import BeautifulSoup
+
+    HAS_BS4 = True
+except ImportError:
+    HAS_BS4 = False
+
+ENGINES = ("fast", "bs4")
+
+# Content the tree builder never exposes as text: comments, scripts, styles.
+# Comments become an empty pseudo-tag so the text around them stays split.
+_HIDDEN_RE = re.compile(
+    rb"<!--.*?(?:-->|\Z)|(?i:<script\b[^>]*>).*?(?i:</script\s*>)|(?i:<style\b[^>]*>).*?(?i:</style\s*>)",
+    re.S,
+)
+# "<" outside the (?i:...) group lets the engine skip ahead to each "<"
+_HIDDEN_HINT_RE = re.compile(rb"<(?:!--|(?i:script|style)\b)")
+_TAG_RE = re.compile(rb"<[^>]*>")
+_TITLE_RE = re.compile(rb"(?i:<title(?:\s[^>]*)?>)(.*?)(?i:</title\s*>)", re.S)
+_TAB_ID_RE = re.compile(
+    rb"(?i:<div\b)[^>]*?(?<![\w-])(?i:id)\s*=\s*(?:\"tab(\d+)\"|'tab(\d+)'|tab(\d+)(?=[\s/>]))"
+)
+_CLASS_ATTR_RE = re.compile(rb"""(?<![\w-])(?i:class)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+_ROUND_RE = re.compile(r"(\d+)\s*/\s*(\d+)")
+# The round-status div's contents, straight from the raw bytes (peek_round_status)
+_ROUND_STATUS_RE = re.compile(
+    rb"<(?i:div\b)[^>]*?(?<![\w-])(?i:class)\s*=\s*[\"']?[^\"'>]*?(?<![\w-])round-status(?![\w-])[^>]*>"
+    rb"\s*Status as on Round,?((?:\s|<[^>]*>)*\d+(?:\s|<[^>]*>)*/(?:\s|<[^>]*>)*\d+)"
+)
+_ROUND_BYTES_RE = re.compile(rb"(\d+)\s*/\s*(\d+)")
+
+_open_close_cache: dict[bytes, re.Pattern] = {}
+
+
+def _open_close(tag: bytes) -> re.Pattern:
+    """Pattern matching ``<tag ...>`` (group 1 empty) or ``</tag>`` (group 1 '/')."""
+    pattern = _open_close_cache.get(tag)
+    if pattern is None:
+        pattern = re.compile(rb"(?i:<(/?)" + tag + rb")(?=[\s/>])[^>]*>")
+        _open_close_cache[tag] = pattern
+    return pattern
+
+
+def _text(fragment: bytes, strip: bool = False) -> str:
+    """BeautifulSoup ``get_text()`` / ``get_text(strip=True)`` for a fragment."""
+    parts = _TAG_RE.split(fragment)
+    if strip:
+        out = []
+        for p in parts:
+            s = _html.unescape(p.decode("utf-8", errors="replace")).strip()
+            if s:
+                out.append(s)
+        return "".join(out)
+    return "".join(_html.unescape(p.decode("utf-8", errors="replace")) for p in parts)
+
+
+class RoundwisePage:
+    """Regex scanner over the raw bytes of one Roundwise page."""
+
+    def __init__(self, body: bytes | str):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if _HIDDEN_HINT_RE.search(body):
+            body = _HIDDEN_RE.sub(lambda m: b"<!>" if m.group(0).startswith(b"<!--") else b"", body)
+        self.body = body
+        self._tabs: dict[int, int] | None = None
+        self._new_tabs: dict[int, int] = {}   # found by _tabs_after
+
+    # -- element helpers ----------------------------------------------------
+
+    def _element(self, tag: bytes, start: int = 0, end: int | None = None) -> tuple[int, int] | None:
+        """Inner (start, end) of the first ``<tag>`` element in body[start:end]."""
+        end = len(self.body) if end is None else end
+        pattern = _open_close(tag)
+        for m in pattern.finditer(self.body, start, end):
+            if not m.group(1):
+                return self._inner(pattern, m, end)
+        return None
+
+    def _elements(self, tag: bytes, start: int, end: int) -> list[tuple[int, int]]:
+        """Inner (start, end) of every ``<tag>`` element (nested ones too)."""
+        pattern = _open_close(tag)
+        return [
+            self._inner(pattern, m, end)
+            for m in pattern.finditer(self.body, start, end)
+            if not m.group(1)
+        ]
+
+    def _inner(self, pattern: re.Pattern, open_match: re.Match, end: int) -> tuple[int, int]:
+        if open_match.group(0).endswith(b"/>"):
+            return open_match.end(), open_match.end()
+        depth = 1
+        for m in pattern.finditer(self.body, open_match.end(), end):
+            if m.group(1):
+                depth -= 1
+                if depth == 0:
+                    return open_match.end(), m.start()
+            elif not m.group(0).endswith(b"/>"):
+                depth += 1
+        return open_match.end(), end  # unclosed: runs to the end, as in the tree
+
+    # -- the pieces the scraper reads ----------------------------------------
+
+    @property
+    def title(self) -> str:
+        """``soup.title.string`` (empty if missing or not a single string)."""
+        m = _TITLE_RE.search(self.body)
+        if not m or b"<" in m.group(1):
+            return ""
+        return _text(m.group(1))
+
+    @property
+    def heading(self) -> str | None:
+        """Text of ``h2 > span`` (or of the h2 itself); None if there is no h2."""
+        h2 = self._element(b"h2")
+        if h2 is None:
+            return None
+        span = self._element(b"span", *h2)
+        start, end = span if span is not None else h2
+        return _text(self.body[start:end])
+
+    @property
+    def round_status(self) -> tuple[int, int] | None:
+        """(current_round, total_rounds) from 'Status as on Round, X/Y'."""
+        div = self._round_status_div()
+        if div is not None:
+            m = _ROUND_RE.search(_text(self.body[div[0]:div[1]]))
+            return (int(m.group(1)), int(m.group(2))) if m else None
+
+        # No round-status div: look for the phrase in any single text node
+        pos = self.body.find(b"Status as on Round")
+        while pos != -1:
+            node_start = self.body.rfind(b">", 0, pos) + 1
+            node_end = self.body.find(b"<", pos)
+            node_end = len(self.body) if node_end == -1 else node_end
+            m = _ROUND_RE.search(_text(self.body[node_start:node_end]))
+            if m:
+                return int(m.group(1)), int(m.group(2))
+            pos = self.body.find(b"Status as on Round", node_end)
+        return None
+
+    def _round_status_div(self) -> tuple[int, int] | None:
+        pos = self.body.find(b"round-status")
+        pattern = _open_close(b"div")
+        while pos != -1:
+            tag_start = self.body.rfind(b"<", 0, pos)
+            m = pattern.match(self.body, tag_start)
+            if m and not m.group(1) and m.end() > pos:
+                attr = _CLASS_ATTR_RE.search(m.group(0))
+                classes = (attr.group(1) or attr.group(2) or attr.group(3)).split() if attr else []
+                if b"round-status" in classes:
+                    return self._inner(pattern, m, len(self.body))
+            pos = self.body.find(b"round-status", pos + 1)
+        return None
+
+    def tab_numbers(self, after: int = 0) -> list[int]:
+        """Round numbers of every ``tab{N}`` div (only N > ``after``), in page order."""
+        if after > 0:
+            return list(self._tabs_after(after))
+        return list(self._tab_index())
+
+    def _tabs_after(self, after: int) -> dict[int, int]:
+        """{N: div offset} of the tabs with N > after, without indexing the older ones."""
+        status = self.round_status
+        div = self._round_status_div()
+        if self._tabs is not None or status is None or div is None:
+            return {n: pos for n, pos in self._tab_index().items() if n > after}
+        wanted = set(range(after + 1, status[0] + 1))
+        found = {}
+        pos = len(self.body)
+        while not wanted <= found.keys():
+            pos = self.body.rfind(b"tab", div[1], pos)
+            if pos == -1:
+                break
+            pos = self.body.rfind(b"<", div[1], pos)
+            if pos == -1:
+                break
+            m = _TAB_ID_RE.match(self.body, pos)
+            if m:
+                digits = m.group(1) or m.group(2) or m.group(3)
+                if (digits[:1] != b"0" or len(digits) == 1) and int(digits) > after:
+                    found[int(digits)] = pos  # walking back, so the first div with an id wins
+        if status[0] > after and status[0] not in found:
+            # The current round's tab is not where it should be: read the whole page
+            return {n: pos for n, pos in self._tab_index().items() if n > after}
+        self._new_tabs.update(found)
+        return dict(sorted(found.items(), key=lambda item: item[1]))
+
+    def _tab_index(self) -> dict[int, int]:
+        if self._tabs is None:
+            self._tabs = {}
+            for m in _TAB_ID_RE.finditer(self.body):
+                digits = m.group(1) or m.group(2) or m.group(3)
+                if digits[:1] == b"0" and len(digits) > 1:
+                    continue  # "tab01" is not the id "tab1"
+                self._tabs.setdefault(int(digits), m.start())  # first div with the id wins
+        return self._tabs
+
+    def tab_rows(self, round_no: int) -> list[list[str]] | None:
+        """Cell texts (stripped) of every ``tr`` in the tab's first ``tbody``.
+
+        None if the tab div or its tbody is missing.
+        """
+        start = self._new_tabs.get(round_no)
+        if start is None:
+            start = self._tab_index().get(round_no)
+        if start is None:
+            return None
+        pattern = _open_close(b"div")
+        tab = self._inner(pattern, pattern.match(self.body, start), len(self.body))
+        return self._tbody_rows(*tab)
+
+    def table_rows(self) -> list[list[str]] | None:
+        """Cell texts (stripped) of every ``tr`` in the page's first ``tbody``.
+
+        This is the results table on a Constituencywise page.
+        """
+        return self._tbody_rows(0, len(self.body))
+
+    def _tbody_rows(self, start: int, end: int) -> list[list[str]] | None:
+        tbody = self._element(b"tbody", start, end)
+        if tbody is None:
+            return None
+        return [
+            [_text(self.body[cs:ce], strip=True) for cs, ce in self._elements(b"td", rs, re_)]
+            for rs, re_ in self._elements(b"tr", *tbody)
+        ]
+
+    def text_of(self, tag: str) -> str | None:
+        """Text of the first ``<tag>`` element; None if there is none."""
+        el = self._element(tag.encode("ascii"))
+        return None if el is None else _text(self.body[el[0]:el[1]])
+
+
+class Bs4RoundwisePage:
+    """The same properties as RoundwisePage, read from a BeautifulSoup tree."""
+
+    def __init__(self, body: bytes | str):
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        self.soup = BeautifulSoup(body, "html.parser")
+
+    @property
+    def title(self) -> str:
+        return (self.soup.title.string if self.soup.title else "") or ""
+
+    @property
+    def heading(self) -> str | None:
+        h2 = self.soup.find("h2")
+        if not h2:
+            return None
+        span = h2.find("span")
+        return span.get_text() if span else h2.get_text()
+
+    @property
+    def round_status(self) -> tuple[int, int] | None:
+        # The HTML has: <div class='round-status'> Status as on Round, <span>9</span>/26</div>
+        round_div = self.soup.find("div", class_="round-status")
+        if not round_div:
+            # Fallback: search all text
+            for el in self.soup.find_all(string=re.compile(r"Status as on Round")):
+                m = _ROUND_RE.search(el.strip())
+                if m:
+                    return int(m.group(1)), int(m.group(2))
+            return None
+        m = _ROUND_RE.search(round_div.get_text())
+        return (int(m.group(1)), int(m.group(2))) if m else None
+
+    def tab_numbers(self, after: int = 0) -> list[int]:
+        seen = {}
+        for div in self.soup.find_all("div", id=re.compile(r"^tab\d+$")):
+            seen.setdefault(int(div["id"][3:]), None)
+        return [n for n in seen if n > after]
+
+    def tab_rows(self, round_no: int) -> list[list[str]] | None:
+        tab_div = self.soup.find("div", id=f"tab{round_no}")
+        if not tab_div:
+            return None
+        return self._tbody_rows(tab_div)
+
+    def table_rows(self) -> list[list[str]] | None:
+        return self._tbody_rows(self.soup)
+
+    @staticmethod
+    def _tbody_rows(parent) -> list[list[str]] | None:
+        tbody = parent.find("tbody")
+        if not tbody:
+            return None
+        return [
+            [td.get_text(strip=True) for td in row.find_all("td")]
+            for row in tbody.find_all("tr")
+        ]
+
+    def text_of(self, tag: str) -> str | None:
+        el = self.soup.find(tag)
+        return None if el is None else el.get_text()
+
+
+class ParsedPage:
+    """
+    What the live scraper reads from a Roundwise page, read out eagerly.
+
+    Plain data behind the RoundwisePage interface, so a page can be parsed
+    in another process or interpreter (core.parse_pool) and only this
+    crosses back.  With ``known_round`` K only the tabs of rounds after K
+    are read, plus the current round's (and tab1 if that one is empty),
+    which the scraper always needs.
+    """
+
+    __slots__ = ("title", "heading", "round_status", "tabs")
+
+    def __init__(self, page, known_round: int = 0):
+        self.title = page.title
+        self.heading = page.heading
+        self.round_status = page.round_status
+        current = self.round_status[0] if self.round_status else 0
+        after = min(known_round, current - 1) if known_round > 0 else 0
+        self.tabs = {n: page.tab_rows(n) for n in page.tab_numbers(after)}
+        if after > 0 and not self.tabs.get(current):
+            self.tabs[1] = page.tab_rows(1)
+
+    def tab_numbers(self, after: int = 0) -> list[int]:
+        return [n for n in self.tabs if n > after]
+
+    def tab_rows(self, round_no: int) -> list[list[str]] | None:
+        return self.tabs.get(round_no)
+
+
+def peek_round_status(body: bytes) -> tuple[int, int] | None:
+    """
+    (current_round, total_rounds) read off the raw bytes of a Roundwise
+    page, without decoding or parsing it; None unless the page has the
+    usual ``<div class='round-status'> Status as on Round, <span>X</span>/Y``.
+    Only good for deciding that a page needs no parse: anything it cannot
+    read is left to the full parser.
+    """
+    m = _ROUND_STATUS_RE.search(body)
+    if m is None or _hidden_at(body, m.start()):
+        return None
+    m = _ROUND_BYTES_RE.search(_TAG_RE.sub(b"", m.group(1)))
+    return (int(m.group(1)), int(m.group(2))) if m else None
+
+
+def _hidden_at(body: bytes, pos: int) -> bool:
+    """Is ``pos`` inside a comment, script or style (as RoundwisePage strips them)?"""
+    start = 0
+    while (hint := _HIDDEN_HINT_RE.search(body, start, pos)) is not None:
+        block = _HIDDEN_RE.match(body, hint.start())
+        start = block.end() if block else hint.end()
+        if start > pos:
+            return True
+    return False
+
+
+def open_roundwise(body: bytes | str, engine: str = "fast"):
+    """Wrap a Roundwise page with the chosen parser engine ('fast' or 'bs4')."""
+    if engine == "bs4":
+        return Bs4RoundwisePage(body)
+    if engine == "fast":
+        return RoundwisePage(body)
+    raise ValueError(f"Unknown parser engine: {engine!r} (expected one of {ENGINES})")
+
+
+def parse_roundwise(body: bytes | str, engine: str = "fast", known_round: int = 0) -> ParsedPage:
+    """Parse a Roundwise page (the parse-stage job): completely, or only past ``known_round``."""
+    return ParsedPage(open_roundwise(body, engine), known_round)
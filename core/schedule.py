@@ -0,0 +1,220 @@
+"""
+Adaptive per-AC polling schedule for the live scraper.
+
+ECI publishes an AC's rounds at a fairly steady cadence (one round every
+~15-30 minutes, depending on the state and the counting centre).  Instead
+of re-fetching every open AC at a fixed interval, ``PollScheduler`` keeps a
+next-due time per AC in a heap:
+
+* the gap between rounds is estimated from when each round was first seen
+  (median of the AC's recent gaps, else the state's median, else a default);
+* an AC is polled just before its next round is expected (waiting at most
+  half the default gap, as the estimate can be well off), then
+  often while that round is overdue;
+* close races are polled twice as often;
+* ACs that have not started counting back off exponentially, to at most
+  half the default round gap, so a first round is never seen late by
+  more than that.
+
+``rounds_ac`` has no timestamps, so the times rounds were first seen are
+kept with the schedule in a small JSON file between runs.
+"""
+
+import heapq
+import json
+import os
+import statistics
+import time
+
+DEFAULT_ROUND_GAP = 20 * 60      # before any gap has been observed
+MIN_INTERVAL = 30                # never poll one AC more often than this
+MAX_INTERVAL = 15 * 60           # ...or less often than this
+NOT_STARTED_INTERVAL = 120       # first back-off step for ACs not counting yet
+CLOSE_RACE_MARGIN = 0.05         # lead / votes counted below this is a close race
+MAX_GAPS = 6                     # per-AC gap history used for the median
+
+
+def ac_key(state_code: str, ac_no: int) -> str:
+    return f"{state_code}-{ac_no}"
+
+
+def margin_ratio(candidates: list[dict]) -> float | None:
+    """Leader's lead over the runner-up as a share of votes counted."""
+    votes = sorted((c.get("votes", 0) for c in candidates), reverse=True)
+    if len(votes) < 2 or not sum(votes):
+        return None
+    return (votes[0] - votes[1]) / sum(votes)
+
+
+class PollScheduler:
+    """Priority queue of per-AC next-due times, persisted to ``path``."""
+
+    def __init__(self, path: str | None = None,
+                 default_gap: float = DEFAULT_ROUND_GAP,
+                 min_interval: float = MIN_INTERVAL,
+                 max_interval: float = MAX_INTERVAL,
+                 not_started_interval: float = NOT_STARTED_INTERVAL):
+        self.path = path
+        self.default_gap = default_gap
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.not_started_interval = not_started_interval
+        # "S22-12" -> {state_code, ac_no, round, total, changed_at, gaps,
+        #              misses, margin, next_due}
+        self._acs: dict[str, dict] = {}
+        self._heap: list[tuple[float, str]] = []
+        self._state_gaps: dict[str, float] | None = None
+
+    # -- choosing what to poll ----------------------------------------------
+
+    def select(self, queue: list[dict], now: float | None = None) -> list[dict]:
+        """The work-queue rows that are due now; ACs never seen are due."""
+        now = time.time() if now is None else now
+        due = []
+        for item in queue:
+            rec = self._acs.get(ac_key(item["state_code"], item["ac_no"]))
+            if rec is None or rec["next_due"] <= now:
+                due.append(item)
+        return due
+
+    def seconds_until_due(self, keys: set[str] | None = None, now: float | None = None) -> float | None:
+        """Seconds until the next AC is due (0 if one is overdue).
+
+        ``keys`` limits the search to those ACs (e.g. the current work
+        queue); None if nothing is scheduled.
+        """
+        now = time.time() if now is None else now
+        while self._heap:
+            due_at, key = self._heap[0]
+            rec = self._acs.get(key)
+            if rec is None or rec["next_due"] != due_at:
+                heapq.heappop(self._heap)  # stale entry
+                continue
+            if keys is not None and key not in keys:
+                break
+            return max(0.0, due_at - now)
+        if keys is None:
+            return None
+        dues = [self._acs[k]["next_due"] for k in keys if k in self._acs]
+        if len(dues) < len(keys):
+            return 0.0  # an AC we have never polled
+        return max(0.0, min(dues) - now) if dues else None
+
+    # -- learning from results ----------------------------------------------
+
+    def observe(self, state_code: str, ac_no: int, status: str,
+                current_round: int = 0, total_rounds: int = 0,
+                margin: float | None = None, now: float | None = None) -> float | None:
+        """Record one poll's outcome and schedule the AC's next poll.
+
+        ``status`` is the scraper's result status; UNCHANGED / ERROR keep the
+        known round.  Returns the next due time, or None once the AC is DONE.
+        """
+        now = time.time() if now is None else now
+        key = ac_key(state_code, ac_no)
+        if status == "DONE":
+            self._acs.pop(key, None)
+            self._state_gaps = None
+            return None
+
+        rec = self._acs.get(key)
+        if rec is None:
+            # First sight: we do not know when its current round appeared
+            rec = {"state_code": state_code, "ac_no": ac_no, "round": current_round,
+                   "total": total_rounds, "changed_at": None, "gaps": [],
+                   "misses": 0, "margin": margin, "next_due": now}
+            self._acs[key] = rec
+        elif status in ("LIVE", "NOT_YET_LIVE") and current_round > rec["round"]:
+            if rec["changed_at"] is not None:
+                per_round = (now - rec["changed_at"]) / (current_round - rec["round"])
+                rec["gaps"] = (rec["gaps"] + [per_round])[-MAX_GAPS:]
+                self._state_gaps = None
+            # Round 0 -> 1 is seen within one (back-off) poll: good enough
+            rec["changed_at"] = now
+            rec["round"] = current_round
+            rec["misses"] = 0  # the back-off is for ACs not counting yet
+        else:
+            rec["misses"] += 1
+        if total_rounds:
+            rec["total"] = total_rounds
+        if margin is not None:
+            rec["margin"] = margin
+
+        rec["next_due"] = now + self._interval(rec, now)
+        heapq.heappush(self._heap, (rec["next_due"], key))
+        return rec["next_due"]
+
+    def _interval(self, rec: dict, now: float) -> float:
+        if rec["round"] == 0:
+            # Not counting yet: 2, 4, 8, 10 minutes (half the default gap)...
+            interval = min(self.not_started_interval * 2 ** min(rec["misses"], 6),
+                           self.default_gap / 2)
+        else:
+            gap = self.round_gap(rec)
+            if rec["changed_at"] is None:
+                interval = gap / 4
+            else:
+                expected = rec["changed_at"] + gap
+                lead = 0.1 * gap
+                if now < expected - lead:
+                    # Just before it is due; a borrowed or noisy estimate can
+                    # be far too long, so check in at least every default gap/2
+                    interval = min(expected - lead - now, self.default_gap / 2)
+                else:
+                    interval = gap / 6  # due or overdue: keep checking
+            if rec["margin"] is not None and rec["margin"] < CLOSE_RACE_MARGIN:
+                interval /= 2
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def round_gap(self, rec: dict) -> float:
+        """Expected seconds between this AC's rounds."""
+        if rec["gaps"]:
+            return statistics.median(rec["gaps"])
+        if self._state_gaps is None:
+            by_state: dict[str, list[float]] = {}
+            for other in self._acs.values():
+                if other["gaps"]:
+                    by_state.setdefault(other["state_code"], []).append(
+                        statistics.median(other["gaps"]))
+            self._state_gaps = {s: statistics.median(g) for s, g in by_state.items()}
+        return self._state_gaps.get(rec["state_code"], self.default_gap)
+
+    # -- persistence ----------------------------------------------------------
+
+    def load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._acs = json.load(f).get("acs", {})
+        except (OSError, ValueError):
+            self._acs = {}
+        self._heap = [(rec["next_due"], key) for key, rec in self._acs.items()]
+        heapq.heapify(self._heap)
+        self._state_gaps = None
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"acs": self._acs}, f)
+        os.replace(tmp, self.path)
+
+    def stats(self, now: float | None = None) -> dict:
+        now = time.time() if now is None else now
+        recs = list(self._acs.values())
+        return {
+            "tracked": len(recs),
+            "due_now": sum(1 for r in recs if r["next_due"] <= now),
+            "counting": sum(1 for r in recs if r["round"] > 0),
+            "close_races": sum(1 for r in recs
+                               if r["margin"] is not None and r["margin"] < CLOSE_RACE_MARGIN),
+            "median_gap_s": round(statistics.median(
+                [statistics.median(r["gaps"]) for r in recs if r["gaps"]]), 1)
+            if any(r["gaps"] for r in recs) else None,
+        }
+
+    def __len__(self) -> int:
+        return len(self._acs)
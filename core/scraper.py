@@ -1,13 +1,38 @@
 """Core scraping functions for ECI results."""
 
+import os
 import re
 import time
 import threading
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from core.fetch import get_fetcher
+from core.parser import open_roundwise
+
+# Where ECI result pages are fetched from.  Point ECI_BASE_URL (or
+# set_base_url / --base-url) at a core.standin server to rehearse offline.
+ECI_BASE_URL = "https://results.eci.gov.in"
+BASE_URL = os.environ.get("ECI_BASE_URL", ECI_BASE_URL).rstrip("/")
+
+
+def set_base_url(url: str | None) -> None:
+    """Fetch ECI pages from ``url`` instead (None restores the live site)."""
+    global BASE_URL
+    BASE_URL = (url or ECI_BASE_URL).rstrip("/")
+
+
+def eci_url(election_identifier: str, page: str) -> str:
+    """URL of ``page`` (e.g. "index.htm") in an election's results folder."""
+    return f"{BASE_URL}/{election_identifier}/{page}"
+
 
 def parse_partywise_url(url: str) -> tuple[str, str]:
     """
@@ -15,6 +40,8 @@ def parse_partywise_url(url: str) -> tuple[str, str]:
     
     Expected format: https://results.eci.gov.in/<election_identifier>/partywiseresult-<state_code>.htm
     Example: https://results.eci.gov.in/ResultAcGenMay2026/partywiseresult-S22.htm
+    Any other host (e.g. a local stand-in) is accepted; pages are still
+    fetched from BASE_URL.
     
     Returns:
         tuple of (election_identifier, state_code)
@@ -22,7 +49,7 @@ def parse_partywise_url(url: str) -> tuple[str, str]:
     Raises:
         ValueError: If the URL doesn't match the expected format
     """
-    pattern = r'^https://results\.eci\.gov\.in/([^/]+)/partywiseresult-([A-Z]\d+)\.htm$'
+    pattern = r'^https?://[^/]+(?:/[^/]+)*?/([^/]+)/partywiseresult-([A-Z]\d+)\.htm$'
     match = re.match(pattern, url)
     if not match:
         raise ValueError(
@@ -38,7 +65,16 @@ def build_constituency_url(election_identifier: str, state_code: str, constituen
     
     Format: https://results.eci.gov.in/<election_identifier>/Constituencywise<state_code><constituency_code>.htm
     """
-    return f"https://results.eci.gov.in/{election_identifier}/Constituencywise{state_code}{constituency_code}.htm"
+    return eci_url(election_identifier, f"Constituencywise{state_code}{constituency_code}.htm")
+
+
+def build_partywise_url(election_identifier: str, state_code: str) -> str:
+    """
+    Build the party-wise results URL (seats won/leading per party).
+    
+    Format: https://results.eci.gov.in/<election_identifier>/partywiseresult-<state_code>.htm
+    """
+    return eci_url(election_identifier, f"partywiseresult-{state_code}.htm")
 
 
 def build_roundwise_url(election_identifier: str, state_code: str, constituency_code: int) -> str:
@@ -48,7 +84,7 @@ def build_roundwise_url(election_identifier: str, state_code: str, constituency_
     Format: https://results.eci.gov.in/<election_identifier>/Roundwise<state_code><constituency_code>.htm
     Example: https://results.eci.gov.in/ResultAcGenMay2026/RoundwiseU071.htm
     """
-    return f"https://results.eci.gov.in/{election_identifier}/Roundwise{state_code}{constituency_code}.htm"
+    return eci_url(election_identifier, f"Roundwise{state_code}{constituency_code}.htm")
 
 
 STATE_CODES = {
@@ -100,8 +136,94 @@ def get_state_name(state_code: str) -> str:
     return STATE_NAMES.get(state_code, state_code)
 
 
+# ---------------------------------------------------------------------------
+# DOM snapshot
+# ---------------------------------------------------------------------------
+# Every find_element / .text is a WebDriver HTTP round trip, one per cell
+# when a page is read cell by cell.  _DOM_SNAPSHOT_JS serialises everything
+# the extractors read in one execute_script call instead.  The time saved in
+# Chrome has not been measured (bench.py extract); tests/test_dom_snapshot.py
+# checks that both paths return the same results.
+# innerText gives what Selenium's .text gives for visible cells and falls
+# back to textContent for the hidden (display:none) round tabs.
+
+_DOM_SNAPSHOT_JS = """
+const text = el => (el ? (el.innerText || el.textContent || '') : '').trim();
+const rows = tbody => tbody
+    ? Array.from(tbody.querySelectorAll('tr'), tr => Array.from(tr.querySelectorAll('td'), text))
+    : null;
+const h2 = document.querySelector('h2');
+const span = h2 ? h2.querySelector('span') : null;
+const tabs = {};
+document.querySelectorAll('div[id^="tab"]').forEach(div => {
+    const m = /^tab(\\d+)$/.exec(div.id);
+    if (m && !(m[1] in tabs)) tabs[m[1]] = rows(div.querySelector('tbody'));
+});
+return {
+    title: document.title,
+    h1: text(document.querySelector('h1')),
+    h2: text(h2),
+    h2_span: span ? text(span) : null,
+    round_status: text(document.querySelector('div.round-status')),
+    tabs: tabs,
+    table: rows(document.querySelector('tbody')),
+};
+"""
+
+
+def dom_snapshot(driver) -> dict | None:
+    """
+    Everything the extractors read from the loaded page, in one round trip.
+
+    Returns a dict with title, h1, h2, h2_span (None without a span),
+    round_status, tabs ({round_no: rows or None}) and table (rows of the
+    first tbody, or None), where rows are lists of cell texts.  Returns
+    None if the script cannot run, so callers use the per-element path.
+    """
+    try:
+        snap = driver.execute_script(_DOM_SNAPSHOT_JS)
+    except WebDriverException:
+        return None
+    if not isinstance(snap, dict):
+        return None
+    snap["tabs"] = {int(k): v for k, v in (snap.get("tabs") or {}).items()}
+    return snap
+
+
+def _split_heading(full_text: str) -> dict | None:
+    """constituency_no / constituency from '12 - Name (State)'; None if malformed."""
+    parts = full_text.split(" - ", 1)
+    if len(parts) < 2:
+        return None
+    state_match = re.search(r"\(([^)]+)\)\s*$", parts[1])
+    if state_match:
+        constituency_name = parts[1][:state_match.start()].strip()
+    else:
+        constituency_name = parts[1]
+    return {"constituency_no": parts[0].strip(), "constituency": constituency_name}
+
+
 def extract_results(driver) -> dict:
     """Extract constituency results from a constituency page."""
+    try:
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, 'h2')))
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, 'tbody')))
+    except TimeoutException as e:
+        print(f"Error extracting results: {e}")
+        return {}
+
+    snap = dom_snapshot(driver)
+    info = _split_heading(snap["h2_span"]) if snap and snap["h2_span"] is not None else None
+    if info is None or snap["table"] is None:
+        return _extract_results_elements(driver)
+
+    fieldnames = ["serial_no", "candidate", "party", "evm_votes", "postal_votes"]
+    info["voting_tally"] = [dict(zip(fieldnames, row)) for row in snap["table"]]
+    return info
+
+
+def _extract_results_elements(driver) -> dict:
+    """extract_results, one WebDriver call per element (fallback)."""
     results = {}
     try:
         WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, 'h2')))
@@ -131,13 +253,38 @@ def extract_results(driver) -> dict:
     return results
 
 
-def extract_roundwise_results(driver, round_num: int, constituency_info: dict = None) -> dict:
+def extract_roundwise_results(driver, round_num: int, constituency_info: dict = None,
+                              snapshot: dict = None) -> dict:
     """
     Extract round-wise results from a round-wise page.
     
     Validates that Previous Rounds + Current Round = Total.
     Issues warnings if validation fails.
+
+    Reads the round from ``snapshot`` (a dom_snapshot of the page, taken
+    here if not given) without clicking its button; pages without
+    ``tab<N>`` divs go through the per-element path.
     """
+    snap = snapshot or dom_snapshot(driver)
+    if snap and snap["tabs"] and snap["h2_span"] is not None:
+        if constituency_info is None or round_num == 1:
+            info = _split_heading(snap["h2_span"])
+        else:
+            info = constituency_info
+        if info is not None:
+            return {
+                "constituency_no": info.get("constituency_no", ""),
+                "constituency": info.get("constituency", "Unknown"),
+                "round_tally": _tally_from_cells(snap["tabs"].get(round_num) or []),
+                "round_num": round_num,
+            }
+    return _extract_roundwise_results_elements(driver, round_num, constituency_info)
+
+
+def _extract_roundwise_results_elements(driver, round_num: int,
+                                        constituency_info: dict = None) -> dict:
+    """extract_roundwise_results, clicking the round button and reading
+    each cell with its own WebDriver call (fallback)."""
     results = {"constituency_no": "", "constituency": "Unknown", "round_tally": []}
     try:
         if constituency_info is None or round_num == 1:
@@ -239,8 +386,39 @@ def extract_all_roundwise_rounds(driver) -> dict:
     Returns dict with keys: constituency_no, constituency, rounds.
     ``rounds`` is a list of ``{"round": int, "tally": [...]}`` sorted by
     round number.
+
+    The whole page is read with one dom_snapshot call; pages without
+    ``tab<N>`` divs go through the per-element path.
     """
     results = {"constituency_no": "", "constituency": "Unknown", "rounds": []}
+    try:
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, "h2"))
+        )
+    except TimeoutException:
+        return results
+
+    snap = dom_snapshot(driver)
+    if not snap or not snap["tabs"]:
+        return _extract_all_roundwise_rounds_elements(driver)
+    if snap["h2_span"] is None:
+        return results
+    info = _split_heading(snap["h2_span"])
+    if info is None:
+        return _extract_all_roundwise_rounds_elements(driver)
+
+    results.update(info)
+    for round_num, rows in snap["tabs"].items():
+        tally = _tally_from_cells(rows or [])
+        if tally:
+            results["rounds"].append({"round": round_num, "tally": tally})
+    results["rounds"].sort(key=lambda r: r["round"])
+    return results
+
+
+def _extract_all_roundwise_rounds_elements(driver) -> dict:
+    """extract_all_roundwise_rounds, one WebDriver call per element (fallback)."""
+    results = {"constituency_no": "", "constituency": "Unknown", "rounds": []}
 
     try:
         WebDriverWait(driver, 10).until(
@@ -317,32 +495,39 @@ def extract_all_roundwise_rounds(driver) -> dict:
 
 def _extract_tally_from_element(element) -> list:
     """Extract the candidate tally table from a single DOM element (tab div)."""
-    tally = []
     try:
         tbody = element.find_element(By.TAG_NAME, "tbody")
         rows = tbody.find_elements(By.TAG_NAME, "tr")
     except NoSuchElementException:
-        return tally
+        return []
 
+    cell_texts = []
     for row in rows:
         try:
-            cells = row.find_elements(By.TAG_NAME, "td")
+            cell_texts.append([td.text for td in row.find_elements(By.TAG_NAME, "td")])
         except StaleElementReferenceException:
             continue
+    return _tally_from_cells(cell_texts)
+
+
+def _tally_from_cells(rows: list[list[str]]) -> list:
+    """Build round-tally dicts from the cell texts of a round's table rows."""
+    tally = []
+    for cells in rows:
         if len(cells) < 4:
             continue
 
-        candidate_name = cells[0].text.strip()
+        candidate_name = cells[0].strip()
         if not candidate_name or candidate_name.lower() == "total":
             continue
 
         candidate_data = {
             "serial_no": str(len(tally) + 1),
             "candidate": candidate_name,
-            "party": cells[1].text.strip(),
-            "votes_brought_forward": cells[2].text.strip(),
-            "current_round": cells[3].text.strip(),
-            "total": cells[4].text.strip() if len(cells) > 4 else cells[3].text.strip(),
+            "party": cells[1].strip(),
+            "votes_brought_forward": cells[2].strip(),
+            "current_round": cells[3].strip(),
+            "total": cells[4].strip() if len(cells) > 4 else cells[3].strip(),
         }
 
         try:
@@ -386,12 +571,28 @@ def _extract_constituency_info(driver) -> dict:
     return info
 
 
+_ROUND_STATUS_RE = re.compile(r"(\d+)\s*/\s*(\d+)")
+
+
+def _counting_status(text: str | None) -> tuple[int, int]:
+    """(current_round, total_rounds) from "Status as on Round, X/Y"; (0, 0) if absent."""
+    m = _ROUND_STATUS_RE.search(text or "")
+    return (int(m.group(1)), int(m.group(2))) if m else (0, 0)
+
+
+def _counting_done(result: dict) -> bool:
+    return 0 < result["total_rounds"] == result["current_round"]
+
+
 def scrape_ac_rounds_core(driver, election_identifier: str, state_code: str,
-                          ac_no: int, start_round: int = 1) -> dict:
+                          ac_no: int, start_round: int = 1, postal: bool = True) -> dict:
     """
     Core function to scrape all rounds for a single AC plus postal votes.
 
     This is the shared logic used by both /scrape/ac-rounds and /scrape/all-rounds.
+    ``data`` carries the page's current_round / total_rounds; with
+    ``postal`` False the Constituencywise page (postal votes) is only
+    loaded once counting is complete (current_round == total_rounds).
 
     During a live election the page grows progressively as new rounds are
     counted.  Each invocation picks up whatever rounds are available;
@@ -401,7 +602,8 @@ def scrape_ac_rounds_core(driver, election_identifier: str, state_code: str,
     adds ~5s startup overhead that negates any parallel-clicking gain).
     Concurrency comes from the client running multiple ACs in parallel.
     """
-    result = {"ac_no": ac_no, "rounds": [], "constituency": "", "postal_votes": []}
+    result = {"ac_no": ac_no, "rounds": [], "constituency": "", "postal_votes": [],
+              "current_round": 0, "total_rounds": 0}
 
     try:
         roundwise_url = build_roundwise_url(election_identifier, state_code, ac_no)
@@ -410,13 +612,26 @@ def scrape_ac_rounds_core(driver, election_identifier: str, state_code: str,
         if "404" in driver.title:
             return {"status": "done"}
 
+        # --- One snapshot of the page: heading and every round's table ---
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, "h2")))
+        except TimeoutException:
+            pass
+        snap = dom_snapshot(driver)
+
         # --- Constituency info (from h2) ---
-        constituency_info = _extract_constituency_info(driver)
+        constituency_info = None
+        if snap and snap["h2_span"] is not None:
+            constituency_info = _split_heading(snap["h2_span"])
+        if constituency_info is None:
+            constituency_info = _extract_constituency_info(driver)
         result["constituency"] = constituency_info.get("constituency", "")
+        if snap:
+            result["current_round"], result["total_rounds"] = _counting_status(snap["round_status"])
 
-        # --- Round extraction: click through each round button ---
+        # --- Round extraction: every tab is already in the snapshot ---
         for round_num in range(max(start_round, 1), 50):
-            rr = extract_roundwise_results(driver, round_num, constituency_info)
+            rr = extract_roundwise_results(driver, round_num, constituency_info, snap)
             if not rr.get("round_tally"):
                 break
             result["rounds"].append({
@@ -425,11 +640,12 @@ def scrape_ac_rounds_core(driver, election_identifier: str, state_code: str,
             })
 
         # --- Postal votes from constituency page ---
-        constituency_url = build_constituency_url(election_identifier, state_code, ac_no)
-        driver.get(constituency_url)
-        final_result = extract_results(driver)
-        result["constituency"] = final_result.get("constituency", result["constituency"])
-        result["postal_votes"] = final_result.get("voting_tally", [])
+        if postal or _counting_done(result):
+            constituency_url = build_constituency_url(election_identifier, state_code, ac_no)
+            driver.get(constituency_url)
+            final_result = extract_results(driver)
+            result["constituency"] = final_result.get("constituency", result["constituency"])
+            result["postal_votes"] = final_result.get("voting_tally", [])
 
         return {"status": "success", "data": result}
 
@@ -437,12 +653,300 @@ def scrape_ac_rounds_core(driver, election_identifier: str, state_code: str,
         return {"status": "error", "error": str(e)}
 
 
+# ---------------------------------------------------------------------------
+# HTTP engine
+# ---------------------------------------------------------------------------
+# ECI pages are server-rendered: every round's table is already in the
+# Roundwise HTML (the round buttons only toggle CSS), so a plain GET plus
+# core.parser returns the same data as driving Chrome, without a browser
+# start-up or a 0.2s sleep per round button.  Chrome is only used when the
+# HTTP path fails — a blocked request, a timeout, or markup the parser does
+# not recognise.
+
+ENGINES = ("http", "chrome")
+PAGE_TIMEOUT = 15
+
+
+class _HttpFailure(Exception):
+    """A page could not be fetched or read over plain HTTP."""
+
+
+def _fetch_pages(urls: list[str], fetcher=None) -> dict:
+    """
+    Fetch ECI pages concurrently and wrap each in a RoundwisePage.
+
+    Returns {url: page}, with None for pages that do not exist (404).
+    Raises _HttpFailure if any page could not be fetched or read.
+    """
+    fetcher = fetcher or get_fetcher()
+    pages = {}
+    for url, fetched in fetcher.fetch_many(urls, timeout=PAGE_TIMEOUT).items():
+        if not fetched.ok:
+            raise _HttpFailure(f"{url}: {fetched.error}")
+        if fetched.status == 404:
+            pages[url] = None
+            continue
+        if fetched.status != 200 or b"Access Denied" in fetched.body[:500]:
+            raise _HttpFailure(f"{url}: HTTP {fetched.status}")
+        page = open_roundwise(fetched.body)
+        if "404" in page.title:
+            pages[url] = None
+        elif page.heading is None:
+            raise _HttpFailure(f"{url}: no constituency heading in page")
+        else:
+            pages[url] = page
+    return pages
+
+
+def _browser_fetcher(pool=None):
+    """fetch() inside ``pool``'s Chrome drivers (core.browser.BrowserFetcher)."""
+    from core.browser import get_driver_pool
+    return (pool or get_driver_pool()).fetcher()
+
+
+def _fetch_tiers(fetcher, pool) -> list[tuple[str, object]]:
+    """Fetchers to try before loading pages in Chrome: ``fetcher`` (None: skip), then fetch() in Chrome."""
+    tiers = [("HTTP", fetcher)] if fetcher is not None else []
+    return tiers + [("In-browser", _browser_fetcher(pool))]
+
+
+def _heading_info(page) -> dict:
+    """constituency_no / constituency from the page's ``h2 > span``."""
+    full_text = " ".join(page.heading.split())
+    info = _split_heading(full_text)
+    if info is None:
+        raise _HttpFailure(f"unexpected constituency heading: {full_text!r}")
+    return info
+
+
+def parse_constituency_page(page) -> dict:
+    """The ``extract_results`` dict, read from a fetched Constituencywise page."""
+    results = _heading_info(page)
+    fieldnames = ["serial_no", "candidate", "party", "evm_votes", "postal_votes"]
+    results["voting_tally"] = [dict(zip(fieldnames, row)) for row in page.table_rows() or []]
+    return results
+
+
+def scrape_ac_rounds_http(election_identifier: str, state_code: str, ac_no: int,
+                          start_round: int = 1, fetcher=None, postal: bool = True) -> dict:
+    """
+    ``scrape_ac_rounds_core`` over plain HTTP.
+
+    The Roundwise and Constituencywise (postal votes) pages are fetched
+    concurrently and every round is read from its pre-rendered ``tab<N>``
+    table.  Returns the same dicts as the Chrome version; raises
+    _HttpFailure when the caller should fall back to Chrome.
+    """
+    roundwise_url = build_roundwise_url(election_identifier, state_code, ac_no)
+    constituency_url = build_constituency_url(election_identifier, state_code, ac_no)
+    pages = _fetch_pages([roundwise_url, constituency_url] if postal else [roundwise_url], fetcher)
+
+    roundwise = pages[roundwise_url]
+    if roundwise is None:
+        return {"status": "done"}
+
+    result = {"ac_no": ac_no, "rounds": [], "constituency": "", "postal_votes": [],
+              "current_round": 0, "total_rounds": 0}
+    result["constituency"] = _heading_info(roundwise)["constituency"]
+    result["current_round"], result["total_rounds"] = roundwise.round_status or (0, 0)
+
+    published = set(roundwise.tab_numbers(after=max(start_round, 1) - 1))
+    for round_num in range(max(start_round, 1), 50):
+        if round_num not in published:
+            break
+        tally = _tally_from_cells(roundwise.tab_rows(round_num) or [])
+        if not tally:
+            break
+        result["rounds"].append({"round": round_num, "tally": tally})
+
+    if not postal and _counting_done(result):
+        pages.update(_fetch_pages([constituency_url], fetcher))
+    constituency = pages.get(constituency_url)
+    if constituency is not None:
+        final_result = parse_constituency_page(constituency)
+        result["constituency"] = final_result.get("constituency") or result["constituency"]
+        result["postal_votes"] = final_result["voting_tally"]
+
+    return {"status": "success", "data": result}
+
+
+def scrape_ac_rounds(election_identifier: str, state_code: str, ac_no: int,
+                     start_round: int = 1, pool=None, engine: str = "http",
+                     fetcher=None, postal: bool = True) -> dict:
+    """
+    Scrape all rounds for a single AC plus postal votes, HTTP first.
+
+    Only rounds from ``start_round`` on are returned; with ``postal`` False
+    postal votes are only read once the AC has finished counting.
+
+    If the HTTP path fails (or straight away with engine="chrome") the
+    same pages are fetched with fetch() inside Chrome, and only if that
+    fails too are they loaded in full (``scrape_ac_rounds_core``), on
+    drivers leased from ``pool`` (default: the shared core.browser pool).
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine!r} (expected one of {ENGINES})")
+    if engine == "http":
+        try:
+            return scrape_ac_rounds_http(election_identifier, state_code, ac_no,
+                                         start_round, fetcher, postal)
+        except _HttpFailure as e:
+            print(f"AC {ac_no}: HTTP scrape failed ({e}), falling back to Chrome")
+    try:
+        return scrape_ac_rounds_http(election_identifier, state_code, ac_no,
+                                     start_round, _browser_fetcher(pool), postal)
+    except _HttpFailure as e:
+        print(f"AC {ac_no}: in-browser fetch failed ({e}), loading the pages")
+
+    from core.browser import get_driver_pool
+    with (pool or get_driver_pool()).lease(pages=2) as driver:
+        return scrape_ac_rounds_core(driver, election_identifier, state_code,
+                                     ac_no, start_round, postal)
+
+
+def _constituency_results(url: str, pool, fetcher=None) -> dict | None:
+    """
+    ``extract_results`` for one Constituencywise URL, HTTP first.
+
+    Returns None when the page does not exist (404).  ``fetcher`` None
+    means Chrome only: fetch() inside it first, then a full page load.
+    """
+    for how, page_fetcher in _fetch_tiers(fetcher, pool):
+        try:
+            page = _fetch_pages([url], page_fetcher)[url]
+            return None if page is None else parse_constituency_page(page)
+        except _HttpFailure as e:
+            print(f"{how} fetch failed ({e}), falling back to Chrome")
+
+    with pool.lease() as driver:
+        driver.get(url)
+        if "404" in driver.title:
+            return None
+        return extract_results(driver)
+
+
+def election_headings(election_identifier: str, state_code: str, pool=None,
+                      engine: str = "http", fetcher=None) -> tuple[str, str]:
+    """
+    (h1, h2) texts of the first Constituencywise page, e.g.
+    ("General Election to Assembly Constituencies: Trends & Results May-2026",
+     "Assembly Constituency 1 - Gummidipoondi (Tamil Nadu)").
+    """
+    url = build_constituency_url(election_identifier, state_code, 1)
+    if engine == "http":
+        try:
+            page = _fetch_pages([url], fetcher)[url]
+            if page is not None and page.text_of("h1") is not None:
+                return (" ".join(page.text_of("h1").split()),
+                        " ".join(page.text_of("h2").split()))
+        except _HttpFailure as e:
+            print(f"HTTP fetch failed ({e}), falling back to Chrome")
+
+    from core.browser import get_driver_pool
+    with (pool or get_driver_pool()).lease() as driver:
+        driver.get(url)
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.TAG_NAME, 'h1')))
+        return (driver.find_element(By.TAG_NAME, 'h1').text,
+                driver.find_element(By.TAG_NAME, 'h2').text)
+
+
+# ---------------------------------------------------------------------------
+# AC range
+# ---------------------------------------------------------------------------
+# A state's ACs are numbered 1..assembly_seats (states.assembly_seats, from
+# data/states.csv).  Walking pages until the first 404 costs a load per AC
+# past the end and stops early at a single missing page, so the seat count
+# is taken as given and only confirmed: the last seat's page and AC_PROBE
+# pages past it are checked in one batch.  If the count is off, or not
+# known, the last AC is found by galloping / bisection over windows of
+# AC_PROBE pages, so a hole shorter than that does not end the search.
+
+AC_PROBE = 3    # pages checked past the seat count / per bisection step
+MAX_AC = 1000   # no state has more ACs (UP: 403)
+
+
+def _pages_exist(urls: list[str], pool=None, fetcher=None) -> dict[str, bool]:
+    """{url: the page exists (is not a 404)}, HTTP first; ``fetcher`` None means Chrome."""
+    for how, page_fetcher in _fetch_tiers(fetcher, pool):
+        try:
+            return {url: page is not None for url, page in _fetch_pages(urls, page_fetcher).items()}
+        except _HttpFailure as e:
+            print(f"{how} probe failed ({e}), falling back to Chrome")
+
+    from core.browser import get_driver_pool
+    exists = {}
+    with (pool or get_driver_pool()).lease(pages=len(urls)) as driver:
+        for url in urls:
+            driver.get(url)
+            exists[url] = "404" not in driver.title
+    return exists
+
+
+def last_ac(seats: int | None, exists, probe: int = AC_PROBE, limit: int = MAX_AC) -> int:
+    """
+    Highest AC number with a page (0 if none).
+
+    ``exists(numbers)`` returns the subset of AC numbers whose pages exist.
+    When ``seats`` is right this costs one call for probe+1 pages.
+    """
+    def window(n):
+        return exists(range(n, min(n + probe, limit + 1)))
+
+    lo, hi = 0, None    # window(lo) has a page (0: sentinel), window(hi) none
+    if seats:
+        found = exists(range(seats, min(seats + probe, limit) + 1))
+        if found:
+            last = max(found)
+            while last > seats and last < limit:
+                # More ACs than seats (e.g. after delimitation): keep probing
+                more = window(last + 1)
+                if not more:
+                    break
+                last = max(more)
+            return last
+        hi = seats
+    else:
+        n = 1
+        while n <= limit and window(n):
+            lo, n = n, n * 2
+        hi = min(n, limit + 1)
+
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if window(mid):
+            lo = mid
+        else:
+            hi = mid
+    return max(window(lo), default=0) if lo else 0
+
+
+def ac_numbers(election_identifier: str, state_code: str, seats: int | None = None,
+               build_url=build_constituency_url, pool=None, fetcher=None) -> list[int]:
+    """
+    AC numbers of a state, 1..last_ac, confirmed against ``build_url`` pages.
+
+    ``seats`` is the expected count (db_utils.get_assembly_seats); ``fetcher``
+    None means Chrome only.  Numbers in the range whose page is missing are
+    still listed: callers treat a 404 there as one missing AC.
+    """
+    def exists(numbers):
+        urls = {build_url(election_identifier, state_code, n): n for n in numbers}
+        found = _pages_exist(list(urls), pool, fetcher)
+        return {urls[url] for url, ok in found.items() if ok}
+
+    return list(range(1, last_ac(seats, exists) + 1))
+
+
 def scrape_constituency_sync(election_identifier: str, state_code: str,
-                              limit: int = None, respect_mode: bool = False) -> dict:
+                              limit: int = None, respect_mode: bool = False,
+                              pool=None) -> dict:
     """Synchronous single-threaded scrape of constituency results."""
-    from core.browser import create_chrome_driver
-    
-    driver = create_chrome_driver()
+    from core.browser import get_driver_pool
+
+    pool = pool or get_driver_pool()
+    driver = pool.checkout()
+    pages = 0
+    broken = False
     results = {
         "constituencywise_results": [],
         "election_year": "",
@@ -455,7 +959,8 @@ def scrape_constituency_sync(election_identifier: str, state_code: str,
         while True:
             url = build_constituency_url(election_identifier, state_code, seq_no)
             driver.get(url)
-            
+            pages += 1
+
             if "404" in driver.title:
                 break
             
@@ -476,46 +981,50 @@ def scrape_constituency_sync(election_identifier: str, state_code: str,
             
     except Exception as e:
         print(f"Scraping error: {e}")
+        broken = not isinstance(e, (NoSuchElementException, TimeoutException))
     finally:
-        driver.quit()
+        pool.checkin(driver, pages=pages, broken=broken)
     
     return results
 
 def scrape_worker(election_identifier: str, state_code: str,
                   result_list: list, state: dict, lock: threading.Lock,
-                  respect_mode: bool = False):
-    """Reusable worker that picks up AC numbers until end of results.
+                  respect_mode: bool = False, engine: str = "http", pool=None):
+    """Reusable worker that picks up AC numbers until none are left.
 
     Args:
         election_identifier: e.g. "ResultAcGenMay2026"
         state_code: e.g. "S22"
         result_list: shared list to append results to
-        state: shared dict with keys 'current' (int) and 'end_of_results' (bool)
+        state: shared dict with keys 'pending' (list of AC numbers still to
+            scrape, e.g. from ac_numbers) and 'missing' (list the AC numbers
+            whose page was a 404 are appended to)
         lock: threading.Lock for shared state
         respect_mode: if True, pause every 10 URLs
+        engine: "http" (plain HTTP, Chrome only as fallback) or "chrome"
+        pool: core.browser.DriverPool for Chrome pages (default: shared pool)
     """
-    from core.browser import create_chrome_driver
-    driver = create_chrome_driver()
+    from core.browser import get_driver_pool
+    pool = pool or get_driver_pool()
+    fetcher = get_fetcher() if engine == "http" else None
 
     try:
         while True:
             with lock:
-                if state.get("end_of_results"):
+                if not state["pending"]:
                     break
-                seq_no = state["current"]
-                state["current"] += 1
+                seq_no = state["pending"].pop(0)
 
             url = build_constituency_url(election_identifier, state_code, seq_no)
-            driver.get(url)
+            result = _constituency_results(url, pool, fetcher)
 
-            if "404" in driver.title:
+            if result is None:
+                # One missing page is one missing AC, not the end of the state
                 with lock:
-                    if not state.get("end_of_results"):
-                        state["end_of_results"] = True
-                        print(f" {seq_no:03d}-STOP.")
-                break
+                    state["missing"].append(seq_no)
+                    print(f" {seq_no:03d}-MISSING.")
+                continue
 
-            result = extract_results(driver)
             if result:
                 with lock:
                     result_list.append(result)
@@ -532,5 +1041,3 @@ def scrape_worker(election_identifier: str, state_code: str,
     except (NoSuchElementException, TimeoutException, AssertionError) as e:
         with lock:
             print(f"Worker error: {e}")
-    finally:
-        driver.quit()
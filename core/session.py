@@ -0,0 +1,168 @@
+"""
+Browser-to-HTTP session handoff.
+
+Akamai decides per client whether to let a request through, partly from
+cookies its JavaScript sets in a real browser.  A pooled Chrome that has
+loaded one ECI page has those cookies; the curl path starts from nothing
+and, once it is being denied, stays denied.
+
+A ``SessionBroker`` set as a fetcher's ``session`` (the shared fetcher
+from core.fetch.get_fetcher has one) watches the outcome of every request
+per host.  When DENIALS_TO_REFRESH requests in a row are denied it has a
+Chrome driver load the page once, in the background, and takes its
+cookies; from then on every HTTP request to that host carries them.  A
+session is renewed when one of its cookies expires, when it is
+MAX_SESSION_AGE old, or when denials come back, but at most once per
+MIN_REFRESH_INTERVAL per host.  Chrome only renews sessions; the pages
+themselves stay on the cheap HTTP path.
+
+The requests keep libcurl's own User-Agent: a Chrome User-Agent on top of
+curl's TLS fingerprint is exactly the mismatch Akamai looks for.
+ECI_SESSION_USER_AGENT=1 sends Chrome's anyway, for a server that checks
+the User-Agent against the cookies and not the fingerprint.
+
+ECI_SESSION_HANDOFF=0 turns the handoff off.
+"""
+
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+from core import throttle
+
+DENIALS_TO_REFRESH = 3
+MIN_REFRESH_INTERVAL = 60.0   # seconds between refreshes of one host
+MAX_SESSION_AGE = 15 * 60.0   # renew even if the cookies say they last longer
+SESSION_HANDOFF = os.environ.get("ECI_SESSION_HANDOFF", "1") != "0"
+SESSION_USER_AGENT = os.environ.get("ECI_SESSION_USER_AGENT", "0") == "1"
+
+
+class SessionBroker:
+    """Per-host cookies (and optionally User-Agent) harvested from Chrome, for HTTP fetchers."""
+
+    def __init__(self, pool=None, denials: int = DENIALS_TO_REFRESH,
+                 min_interval: float = MIN_REFRESH_INTERVAL,
+                 max_age: float = MAX_SESSION_AGE,
+                 user_agent: bool = SESSION_USER_AGENT):
+        self.pool = pool            # core.browser.DriverPool (default: the shared pool)
+        self.user_agent = user_agent  # also send Chrome's User-Agent
+        self.denials = denials
+        self.min_interval = min_interval
+        self.max_age = max_age
+        self._sessions: dict[str, dict] = {}
+        self._denied: dict[str, int] = {}
+        self._refreshing: set[str] = set()
+        self._last_refresh: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {"refreshes": 0, "refresh_failures": 0, "expired": 0}
+
+    # -- fetcher hooks ------------------------------------------------------
+
+    def headers(self, url: str) -> dict:
+        """Cookie headers for ``url`` (and User-Agent with ``user_agent``); {} if no session."""
+        host = urlsplit(url).netloc
+        now = time.time()
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                return {}
+            cookies = {name: value for name, (value, expires) in session["cookies"].items()
+                       if expires is None or expires > now}
+            stale = (len(cookies) < len(session["cookies"])
+                     or time.monotonic() - session["created"] > self.max_age)
+        if stale:
+            self._refresh_soon(url, "expired")
+        headers = {}
+        if self.user_agent and session["user_agent"]:
+            headers["User-Agent"] = session["user_agent"]
+        if cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in cookies.items())
+        return headers
+
+    def report(self, url: str, result_outcome: str) -> None:
+        """Outcome (core.throttle) of a request sent with ``headers(url)``."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if result_outcome == throttle.DENIED:
+                self._denied[host] = self._denied.get(host, 0) + 1
+                blocked = self._denied[host] >= self.denials
+            else:
+                if result_outcome == throttle.OK:
+                    self._denied[host] = 0
+                blocked = False
+        if blocked:
+            self._refresh_soon(url)
+
+    # -- refreshing ---------------------------------------------------------
+
+    def refresh(self, url: str) -> bool:
+        """Load ``url`` in Chrome and take over its session; False if that failed."""
+        host = urlsplit(url).netloc
+        try:
+            from core.browser import get_driver_pool
+
+            with (self.pool or get_driver_pool()).lease() as driver:
+                driver.get(url)
+                cookies = driver.get_cookies()
+                user_agent = driver.execute_script("return navigator.userAgent")
+        except Exception:
+            with self._lock:
+                self._stats["refresh_failures"] += 1
+            return False
+        with self._lock:
+            self._sessions[host] = {
+                "cookies": {c["name"]: (c["value"], c.get("expiry")) for c in cookies},
+                "user_agent": user_agent,
+                "created": time.monotonic(),
+            }
+            self._denied[host] = 0
+            self._stats["refreshes"] += 1
+        return True
+
+    def _refresh_soon(self, url: str, reason: str | None = None) -> None:
+        """``refresh`` in the background, unless one is running or ran too recently."""
+        host = urlsplit(url).netloc
+        now = time.monotonic()
+        with self._lock:
+            last = self._last_refresh.get(host, -self.min_interval)
+            if host in self._refreshing or now - last < self.min_interval:
+                return
+            self._refreshing.add(host)
+            self._last_refresh[host] = now
+            if reason == "expired":
+                self._stats["expired"] += 1
+
+        def run():
+            try:
+                self.refresh(url)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(host)
+
+        threading.Thread(target=run, name="session-refresh", daemon=True).start()
+
+    def stats(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            return {
+                **self._stats,
+                "hosts": {
+                    host: {"cookies": len(s["cookies"]), "age_s": round(now - s["created"], 1),
+                           "denied": self._denied.get(host, 0)}
+                    for host, s in self._sessions.items()
+                },
+            }
+
+
+_broker: SessionBroker | None = None
+_broker_lock = threading.Lock()
+
+
+def get_session_broker() -> SessionBroker:
+    """The process-wide broker; its drivers come from the shared pool unless ``pool`` is set."""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = SessionBroker()
+        return _broker
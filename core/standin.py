@@ -0,0 +1,678 @@
+"""
+Local stand-in for results.eci.gov.in.
+
+Serves Roundwise and Constituencywise pages in ECI's markup from a local HTTP server so that the
+fetch and parse paths can be exercised (and benchmarked) without touching
+the live site.  A ``ThrottlePolicy`` makes it push back like ECI's CDN.
+
+``DbSite`` replays a counting day from an existing ``rounds_ac`` database
+(Roundwise, Constituencywise and partywise pages), releasing each AC's
+rounds progressively at a configurable speed; a ``FaultPolicy`` adds
+latency, 404s, Access Denied pages and truncated HTML.  Run it with::
+
+    python -m core.standin --db data/election_results.db --speed 60
+
+and point the scrapers at it with ``--base-url`` / ``ECI_BASE_URL``.
+"""
+
+import gzip
+import hashlib
+import html
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROUNDWISE_PATH = re.compile(r"^/([^/]+)/Roundwise([A-Z]\d{2})(\d+)\.htm$")
+CONSTITUENCYWISE_PATH = re.compile(r"^/([^/]+)/Constituencywise([A-Z]\d{2})(\d+)\.htm$")
+PARTYWISE_PATH = re.compile(r"^/([^/]+)/partywiseresult-([A-Z]\d{2})\.htm$")
+PARTYWISE_WIN_PATH = re.compile(r"^/([^/]+)/partywisewinresult-(\d+)([A-Z]\d{2})\.htm$")
+STATUS_PATH = "/_standin/status"
+
+PARTIES = ["BJP", "INC", "DMK", "AIADMK", "AITC", "CPI(M)", "TVK", "PMK", "IND", "BSP"]
+
+
+def synthetic_rounds(n_candidates: int, n_rounds: int, seed: int = 0) -> list[list[dict]]:
+    """Build cumulative per-round tallies for a made-up AC.
+
+    Returns one list per round of
+    ``{candidate, party, brought_forward, current_round, total}`` dicts.
+    """
+    rng = random.Random(seed)
+    names = [f"CANDIDATE {seed}-{i + 1}" for i in range(n_candidates)]
+    parties = [PARTIES[i % len(PARTIES)] for i in range(n_candidates)]
+    weights = [rng.random() ** 2 for _ in range(n_candidates)]
+    totals = [0] * n_candidates
+    rounds = []
+    for _ in range(n_rounds):
+        tally = []
+        for i in range(n_candidates):
+            gained = int(weights[i] * rng.randint(800, 4000))
+            tally.append({
+                "candidate": names[i],
+                "party": parties[i],
+                "brought_forward": totals[i],
+                "current_round": gained,
+                "total": totals[i] + gained,
+            })
+            totals[i] += gained
+        rounds.append(tally)
+    return rounds
+
+
+def render_roundwise(ac_no: int, ac_name: str, state_name: str,
+                     rounds: list[list[dict]], total_rounds: int) -> str:
+    """Render a Roundwise page with one ``tab{N}`` div per published round."""
+    current = len(rounds)
+    buttons = "".join(
+        f'<button class="tablinks" onclick="openRound(event, \'tab{n}\')">R{n}</button>'
+        for n in range(1, current + 1)
+    )
+    tabs = []
+    for n, tally in enumerate(rounds, start=1):
+        rows = "".join(
+            "<tr>"
+            f"<td>{html.escape(c['candidate'])}</td>"
+            f"<td>{html.escape(c['party'])}</td>"
+            f"<td>{c['brought_forward']}</td>"
+            f"<td>{c['current_round']}</td>"
+            f"<td>{c['total']}</td>"
+            "</tr>"
+            for c in tally
+        )
+        display = "block" if n == current else "none"
+        tabs.append(
+            f'<div id="tab{n}" class="tabcontent" style="display:{display}">\n'
+            f'<table class="table table-striped table-bordered">\n'
+            f"<thead><tr><th colspan=\"5\">Round {n}</th></tr>\n"
+            "<tr><th>Candidate</th><th>Party</th><th>Votes Brought Forward</th>"
+            "<th>Current Round</th><th>Total</th></tr></thead>\n"
+            f"<tbody>{rows}</tbody>\n</table>\n</div>"
+        )
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n"
+        "<meta charset=\"utf-8\">\n"
+        "<title>Election Commission of India</title>\n"
+        "</head>\n<body>\n<div class=\"container\">\n"
+        "<h1>General Election to Assembly Constituencies: Trends &amp; Results May-2026</h1>\n"
+        f"<h2>Assembly Constituency <span>{ac_no} - {html.escape(ac_name)} ({html.escape(state_name)})</span></h2>\n"
+        f"<div class='round-status'> Status as on Round, <span>{current}</span>/{total_rounds}</div>\n"
+        f"<div class=\"tab\">{buttons}</div>\n"
+        + "\n".join(tabs)
+        + "\n</div>\n</body>\n</html>\n"
+    )
+
+
+def render_constituencywise(ac_no: int, ac_name: str, state_name: str,
+                            tally: list[dict], postal_seed: int = 0) -> str:
+    """Render a Constituencywise page (EVM + postal votes) from a final tally."""
+    rng = random.Random(postal_seed)
+    rows, totals = [], [0, 0, 0]
+    for i, c in enumerate(tally, start=1):
+        postal = rng.randint(0, max(c["total"] // 100, 1))
+        votes = (c["total"], postal, c["total"] + postal)
+        totals = [a + b for a, b in zip(totals, votes)]
+        rows.append(
+            f"<tr><td>{i}</td><td>{html.escape(c['candidate'])}</td>"
+            f"<td>{html.escape(c['party'])}</td>"
+            + "".join(f"<td>{v}</td>" for v in votes)
+            + "<td>0.00</td></tr>"
+        )
+    rows.append("<tr><td></td><td>Total</td><td></td>"
+                + "".join(f"<td>{v}</td>" for v in totals) + "<td></td></tr>")
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n"
+        "<meta charset=\"utf-8\">\n"
+        "<title>Election Commission of India</title>\n"
+        "</head>\n<body>\n<div class=\"container\">\n"
+        "<h1>General Election to Assembly Constituencies: Trends &amp; Results May-2026</h1>\n"
+        f"<h2>Assembly Constituency <span>{ac_no} - {html.escape(ac_name)} ({html.escape(state_name)})</span></h2>\n"
+        "<table class=\"table table-striped table-bordered\">\n"
+        "<thead><tr><th>S.N.</th><th>Candidate</th><th>Party</th><th>EVM Votes</th>"
+        "<th>Postal Votes</th><th>Total Votes</th><th>% of Votes</th></tr></thead>\n"
+        f"<tbody>{''.join(rows)}</tbody>\n</table>\n</div>\n</body>\n</html>\n"
+    )
+
+
+def _page(title_h1: str, h2: str, content: str) -> str:
+    return (
+        "<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n"
+        "<meta charset=\"utf-8\">\n"
+        "<title>Election Commission of India</title>\n"
+        "</head>\n<body>\n<div class=\"container\">\n"
+        f"<h1>{title_h1}</h1>\n<h2>{h2}</h2>\n{content}\n</div>\n</body>\n</html>\n"
+    )
+
+
+_H1 = "General Election to Assembly Constituencies: Trends &amp; Results May-2026"
+
+
+def render_partywise(state_code: str, state_name: str, parties: list[dict]) -> str:
+    """Render a partywise page: ``{party, party_id, won, leading}`` per party.
+
+    The Won count links to that party's partywisewinresult page, as on ECI.
+    """
+    rows = "".join(
+        f"<tr><td>{html.escape(p['party'])}</td>"
+        f"<td><a href=\"partywisewinresult-{p['party_id']}{state_code}.htm\">{p['won']}</a></td>"
+        f"<td>{p['leading']}</td><td>{p['won'] + p['leading']}</td></tr>"
+        for p in parties
+    )
+    total = [sum(p[k] for p in parties) for k in ("won", "leading")]
+    return _page(
+        _H1, f"Party Wise Results Status <span>{html.escape(state_name)}</span>",
+        "<table class=\"table\">\n<thead><tr><th>Party</th><th>Won</th><th>Leading</th>"
+        f"<th>Total</th></tr></thead>\n<tbody>{rows}</tbody>\n"
+        f"<tfoot><tr><td>Total</td><td>{total[0]}</td><td>{total[1]}</td>"
+        f"<td>{sum(total)}</td></tr></tfoot>\n</table>",
+    )
+
+
+def render_partywise_win(state_code: str, state_name: str, party: str,
+                         winners: list[dict]) -> str:
+    """Render a partywisewinresult page: ``{ac_no, ac_name, candidate, votes, margin}``."""
+    rows = "".join(
+        f"<tr><td>{i}</td>"
+        f"<td><a href=\"candidateswise-{state_code}{w['ac_no']}.htm\">"
+        f"{html.escape(w['ac_name'])}({w['ac_no']})</a></td>"
+        f"<td>{html.escape(w['candidate'])}</td><td>{w['votes']}</td><td>{w['margin']}</td></tr>"
+        for i, w in enumerate(winners, start=1)
+    )
+    return _page(
+        _H1, f"Winning Candidates <span>{html.escape(party)} - {html.escape(state_name)}</span>",
+        "<table class=\"table\">\n<thead><tr><th>S.No</th><th>Assembly Constituency</th>"
+        "<th>Winning Candidate</th><th>Total Votes</th><th>Margin</th></tr></thead>\n"
+        f"<tbody>{rows}</tbody>\n</table>",
+    )
+
+
+ACCESS_DENIED = (
+    b"<HTML><HEAD>\n<TITLE>Access Denied</TITLE>\n</HEAD><BODY>\n<H1>Access Denied</H1>\n"
+    b"You don't have permission to access this page on this server.<P>\n</BODY>\n</HTML>\n"
+)
+
+
+class ThrottlePolicy:
+    """Akamai-style limits for the stand-in.
+
+    Requests beyond ``max_in_flight`` at once, or beyond ``max_rate`` in
+    any one-second window, get a 403 Access Denied page; going over the
+    rate also blocks every request for ``penalty`` seconds.  Latency grows
+    with the number of requests in flight.
+    """
+
+    def __init__(self, max_rate: float = 40.0, max_in_flight: int = 6,
+                 base_latency: float = 0.02, latency_per_request: float = 0.02,
+                 penalty: float = 1.0):
+        self.max_rate = max_rate
+        self.max_in_flight = max_in_flight
+        self.base_latency = base_latency
+        self.latency_per_request = latency_per_request
+        self.penalty = penalty
+        self.served = 0
+        self.denied = 0
+        self._window: deque[float] = deque()
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def admit(self) -> float | None:
+        """Seconds of latency to add, or None to deny the request."""
+        with self._lock:
+            now = time.monotonic()
+            while self._window and self._window[0] <= now - 1.0:
+                self._window.popleft()
+            if now < self._blocked_until or self._in_flight >= self.max_in_flight:
+                self.denied += 1
+                return None
+            if len(self._window) >= self.max_rate:
+                self._blocked_until = now + self.penalty
+                self.denied += 1
+                return None
+            self._window.append(now)
+            self._in_flight += 1
+            self.served += 1
+            return self.base_latency + self.latency_per_request * self._in_flight
+
+    def done(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+
+class FaultPolicy:
+    """Random latency and failures, drawn independently for each request.
+
+    ``latency`` is a (min, max) range in seconds; ``not_found``, ``denied``
+    and ``truncated`` are the shares of requests answered with a 404, a 403
+    Access Denied page, or a 200 whose HTML is cut off part-way.
+    """
+
+    def __init__(self, latency: tuple[float, float] = (0.0, 0.0), not_found: float = 0.0,
+                 denied: float = 0.0, truncated: float = 0.0, seed: int | None = None):
+        self.latency = latency
+        self.not_found = not_found
+        self.denied = denied
+        self.truncated = truncated
+        self.counts = {"not_found": 0, "denied": 0, "truncated": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> tuple[float, str | None]:
+        """(seconds of latency, fault name or None)."""
+        with self._lock:
+            delay = self._rng.uniform(*self.latency)
+            roll = self._rng.random()
+            fault = None
+            for name in ("not_found", "denied", "truncated"):
+                share = getattr(self, name)
+                if roll < share:
+                    fault = name
+                    self.counts[name] += 1
+                    break
+                roll -= share
+            return delay, fault
+
+    def cut(self, body: bytes) -> bytes:
+        with self._lock:
+            return body[: int(len(body) * self._rng.uniform(0.2, 0.9))]
+
+
+NOT_FOUND = b"<html><head><title>404 Not Found</title></head><body></body></html>"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        if self.path == STATUS_PATH and hasattr(self.server.site, "status"):
+            body = json.dumps(self.server.site.status()).encode("utf-8")
+            self._send(200, body, content_type="application/json")
+            return
+        policy = self.server.throttle
+        if policy is None:
+            self._faulty()
+            return
+        latency = policy.admit()
+        if latency is None:
+            self._send(403, ACCESS_DENIED)
+            return
+        try:
+            time.sleep(latency)
+            self._faulty()
+        finally:
+            policy.done()
+
+    def _faulty(self):
+        faults = self.server.faults
+        if faults is None:
+            self._serve()
+            return
+        delay, fault = faults.draw()
+        if delay:
+            time.sleep(delay)
+        if fault == "not_found":
+            self._send(404, NOT_FOUND)
+        elif fault == "denied":
+            self._send(403, ACCESS_DENIED)
+        else:
+            self._serve(truncate=fault == "truncated")
+
+    def _serve(self, truncate: bool = False):
+        page = self.server.site.render(self.path)
+        if page is None:
+            self._send(404, NOT_FOUND)
+            return
+        body = page.encode("utf-8")
+        if truncate:
+            self._send(200, self.server.faults.cut(body))
+            return
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(200, body, etag)
+
+    def _send(self, status: int, body: bytes, etag: str | None = None,
+              content_type: str = "text/html; charset=utf-8"):
+        encoding = None
+        if "gzip" in (self.headers.get("Accept-Encoding") or ""):
+            body = gzip.compress(body, compresslevel=5)
+            encoding = "gzip"
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class SyntheticSite:
+    """Every ``Roundwise{state}{ac}.htm`` / ``Constituencywise{state}{ac}.htm``
+    URL maps to a generated AC page."""
+
+    def __init__(self, n_candidates: int = 12, n_rounds: int = 20, total_rounds: int = 24):
+        self.n_candidates = n_candidates
+        self.n_rounds = n_rounds
+        self.total_rounds = total_rounds
+        self._cache: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def render(self, path: str) -> str | None:
+        m = ROUNDWISE_PATH.match(path) or CONSTITUENCYWISE_PATH.match(path)
+        if not m:
+            return None
+        with self._lock:
+            if path not in self._cache:
+                ac_no = int(m.group(3))
+                rounds = synthetic_rounds(self.n_candidates, self.n_rounds, seed=ac_no)
+                if m.re is ROUNDWISE_PATH:
+                    page = render_roundwise(ac_no, f"CONSTITUENCY {ac_no}", "Stand-in State",
+                                            rounds, self.total_rounds)
+                else:
+                    page = render_constituencywise(ac_no, f"CONSTITUENCY {ac_no}", "Stand-in State",
+                                                   rounds[-1] if rounds else [], postal_seed=ac_no)
+                self._cache[path] = page
+            return self._cache[path]
+
+
+def load_rounds(database_url: str) -> tuple[list[dict], dict[str, str]]:
+    """``rounds_ac`` rows and {state_code: state_name} from a SQLite file or
+    PostgreSQL URL (read only)."""
+    if database_url.startswith(("postgresql://", "postgres://")):
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+
+        conn = psycopg2.connect(database_url)
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+    else:
+        conn = sqlite3.connect(f"file:{database_url}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        cur = conn.cursor()
+    try:
+        cur.execute("SELECT state_code, ac_no, ac_name, round_no, candidate, party_abv, votes "
+                    "FROM rounds_ac")
+        rows = [dict(r) for r in cur.fetchall()]
+        cur.execute("SELECT state_code, state_name FROM states")
+        names = {r["state_code"]: r["state_name"] for r in cur.fetchall()}
+    finally:
+        conn.close()
+    return rows, names
+
+
+class DbSite:
+    """Counting day replayed from ``rounds_ac`` rows.
+
+    Every AC with counting rounds in the data gets its own start offset and
+    round cadence (``round_gap`` seconds, +/-25%), in simulated time that
+    runs ``speed`` times faster than the wall clock.  Until an AC's first
+    round is out its Roundwise page shows round 0; once its last round is
+    out it counts as won on the partywise pages.  The final/postal round
+    (999) is not replayed.
+    """
+
+    def __init__(self, rows: list[dict], state_names: dict[str, str] | None = None,
+                 speed: float = 60.0, round_gap: float = 20 * 60, seed: int = 0):
+        self.speed = speed
+        self.round_gap = round_gap
+        self.state_names = state_names or {}
+        rng = random.Random(seed)
+
+        by_round: dict[tuple[str, int], dict[int, list[dict]]] = {}
+        names: dict[tuple[str, int], str] = {}
+        for row in rows:
+            if row["round_no"] == 999:
+                continue
+            key = (row["state_code"], row["ac_no"])
+            by_round.setdefault(key, {}).setdefault(row["round_no"], []).append(row)
+            names[key] = row["ac_name"] or names.get(key) or f"AC-{row['ac_no']}"
+
+        # (state_code, ac_no) -> {name, rounds: [tally, ...], offset, gap}
+        self._acs: dict[tuple[str, int], dict] = {}
+        for key in sorted(by_round):
+            previous: dict[tuple[str, str], int] = {}
+            rounds = []
+            # Rounds missing from the data are closed up: the page shows 1..n
+            for round_no in sorted(by_round[key]):
+                tally = []
+                for r in sorted(by_round[key][round_no], key=lambda r: -r["votes"]):
+                    bf = previous.get((r["candidate"], r["party_abv"]), 0)
+                    tally.append({"candidate": r["candidate"], "party": r["party_abv"],
+                                  "brought_forward": bf,
+                                  "current_round": max(r["votes"] - bf, 0),
+                                  "total": r["votes"]})
+                previous = {(c["candidate"], c["party"]): c["total"] for c in tally}
+                rounds.append(tally)
+            self._acs[key] = {"name": names[key], "rounds": rounds,
+                              "offset": rng.uniform(0, round_gap),
+                              "gap": round_gap * rng.uniform(0.75, 1.25)}
+        parties = sorted({c["party"] for ac in self._acs.values()
+                          for tally in ac["rounds"] for c in tally})
+        self._party_ids = {party: 100 + i for i, party in enumerate(parties)}
+        self._parties_by_id = {i: party for party, i in self._party_ids.items()}
+        self._cache: dict[tuple[str, int], str] = {}
+        self._lock = threading.Lock()
+        self._t0 = time.monotonic()
+        self._t0_wall = time.time()
+
+    @classmethod
+    def from_database(cls, database_url: str, **kwargs) -> "DbSite":
+        rows, names = load_rounds(database_url)
+        return cls(rows, names, **kwargs)
+
+    def restart(self) -> None:
+        """Start counting day over from the first round."""
+        with self._lock:
+            self._t0, self._t0_wall = time.monotonic(), time.time()
+
+    def _sim_now(self) -> float:
+        return (time.monotonic() - self._t0) * self.speed
+
+    def released(self, ac: dict, sim_now: float | None = None) -> int:
+        """Rounds of ``ac`` published so far."""
+        sim_now = self._sim_now() if sim_now is None else sim_now
+        if sim_now < ac["offset"]:
+            return 0
+        return min(len(ac["rounds"]), 1 + int((sim_now - ac["offset"]) / ac["gap"]))
+
+    def _state_name(self, state_code: str) -> str:
+        return self.state_names.get(state_code, state_code)
+
+    def _cached(self, path: str, n: int, render) -> str:
+        with self._lock:
+            page = self._cache.get((path, n))
+        if page is None:
+            page = render()
+            with self._lock:
+                self._cache[(path, n)] = page
+        return page
+
+    def render(self, path: str) -> str | None:
+        m = ROUNDWISE_PATH.match(path) or CONSTITUENCYWISE_PATH.match(path)
+        if m:
+            state_code, ac_no = m.group(2), int(m.group(3))
+            ac = self._acs.get((state_code, ac_no))
+            if ac is None:
+                return None
+            n = self.released(ac)
+            state_name = self._state_name(state_code)
+            if m.re is ROUNDWISE_PATH:
+                return self._cached(path, n, lambda: render_roundwise(
+                    ac_no, ac["name"], state_name, ac["rounds"][:n], len(ac["rounds"])))
+            if not n:
+                return None
+            return self._cached(path, n, lambda: render_constituencywise(
+                ac_no, ac["name"], state_name, ac["rounds"][n - 1], postal_seed=ac_no))
+
+        m = PARTYWISE_PATH.match(path)
+        if m:
+            state_code = m.group(2)
+            results = self._results(state_code)
+            if not results:
+                return None
+            counts: dict[str, dict] = {}
+            for won, tally in results.values():
+                party = tally[0]["party"]
+                entry = counts.setdefault(party, {"party": party, "party_id": self._party_ids[party],
+                                                  "won": 0, "leading": 0})
+                entry["won" if won else "leading"] += 1
+            parties = sorted(counts.values(), key=lambda p: (-p["won"] - p["leading"], p["party"]))
+            return render_partywise(state_code, self._state_name(state_code), parties)
+
+        m = PARTYWISE_WIN_PATH.match(path)
+        if m:
+            party = self._parties_by_id.get(int(m.group(2)))
+            state_code = m.group(3)
+            if party is None:
+                return None
+            winners = [
+                {"ac_no": ac_no, "ac_name": self._acs[(state_code, ac_no)]["name"],
+                 "candidate": tally[0]["candidate"], "votes": tally[0]["total"],
+                 "margin": tally[0]["total"] - (tally[1]["total"] if len(tally) > 1 else 0)}
+                for ac_no, (won, tally) in sorted(self._results(state_code).items())
+                if won and tally[0]["party"] == party
+            ]
+            return render_partywise_win(state_code, self._state_name(state_code), party, winners)
+        return None
+
+    def _results(self, state_code: str) -> dict[int, tuple[bool, list[dict]]]:
+        """{ac_no: (declared, latest tally)} for the state's ACs counting so far."""
+        sim_now = self._sim_now()
+        results = {}
+        for (code, ac_no), ac in self._acs.items():
+            if code != state_code:
+                continue
+            n = self.released(ac, sim_now)
+            if n and ac["rounds"][n - 1]:
+                results[ac_no] = (n == len(ac["rounds"]), ac["rounds"][n - 1])
+        return results
+
+    def status(self) -> dict:
+        """What has been published so far, for measuring scraper freshness.
+
+        ``released`` maps "S22-12" to [rounds out, total rounds, wall-clock
+        time the latest of them came out (ISO 8601, None before round 1)].
+        """
+        sim_now = self._sim_now()
+        released = {}
+        for (state_code, ac_no), ac in self._acs.items():
+            n = self.released(ac, sim_now)
+            at = None
+            if n:
+                at = datetime.fromtimestamp(
+                    self._t0_wall + (ac["offset"] + (n - 1) * ac["gap"]) / self.speed,
+                    timezone.utc).isoformat()
+            released[f"{state_code}-{ac_no}"] = [n, len(ac["rounds"]), at]
+        return {
+            "speed": self.speed,
+            "round_gap_s": self.round_gap,
+            "simulated_s": round(sim_now, 1),
+            "acs": len(self._acs),
+            "rounds_released": sum(r[0] for r in released.values()),
+            "rounds_total": sum(r[1] for r in released.values()),
+            "declared": sum(1 for r in released.values() if r[0] == r[1]),
+            "released": released,
+        }
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128  # the default of 5 drops SYNs under fan-out
+
+
+class StandinServer:
+    """Threaded HTTP server on localhost; use as a context manager."""
+
+    def __init__(self, site=None, host: str = "127.0.0.1", port: int = 0,
+                 throttle: ThrottlePolicy | None = None, faults: FaultPolicy | None = None):
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.site = site or SyntheticSite()
+        self._httpd.throttle = throttle
+        self._httpd.faults = faults
+        self._thread = threading.Thread(target=self._httpd.serve_forever,
+                                        name="standin", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StandinServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    import argparse
+    import os
+
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for results.eci.gov.in, replaying rounds_ac from a database")
+    parser.add_argument("--db", default=os.environ.get("DATABASE_URL", "data/election_results.db"),
+                        help="SQLite file or PostgreSQL URL holding rounds_ac (read only)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--speed", type=float, default=60.0,
+                        help="Simulated seconds per wall-clock second (default: 60)")
+    parser.add_argument("--round-minutes", type=float, default=20.0,
+                        help="Simulated minutes between an AC's rounds (default: 20, +/-25%%)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, nargs=2, default=(0.0, 0.0), metavar=("MIN", "MAX"),
+                        help="Extra seconds per response, drawn uniformly")
+    parser.add_argument("--not-found", type=float, default=0.0, help="Share of responses that 404")
+    parser.add_argument("--denied", type=float, default=0.0,
+                        help="Share of responses that are 403 Access Denied")
+    parser.add_argument("--truncated", type=float, default=0.0,
+                        help="Share of responses with the HTML cut off")
+    parser.add_argument("--max-rate", type=float, default=0.0,
+                        help="Deny requests above this many per second (0: no limit)")
+    parser.add_argument("--max-in-flight", type=int, default=32)
+    args = parser.parse_args()
+
+    site = DbSite.from_database(args.db, speed=args.speed, round_gap=args.round_minutes * 60,
+                                seed=args.seed)
+    faults = None
+    if args.latency[1] or args.not_found or args.denied or args.truncated:
+        faults = FaultPolicy(tuple(args.latency), args.not_found, args.denied, args.truncated,
+                             seed=args.seed)
+    throttle = ThrottlePolicy(args.max_rate, args.max_in_flight) if args.max_rate else None
+    server = StandinServer(site, args.host, args.port, throttle=throttle, faults=faults)
+    status = site.status()
+    print(f"Stand-in ECI site at {server.base_url} — {status['acs']} ACs, "
+          f"{status['rounds_total']} rounds, x{args.speed:g} speed")
+    print(f"  scrapers: --base-url {server.base_url}  (or ECI_BASE_URL={server.base_url})")
+    print(f"  progress: {server.base_url}{STATUS_PATH}")
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
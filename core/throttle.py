@@ -0,0 +1,171 @@
+"""
+Adaptive request rate and concurrency for fetches to results.eci.gov.in.
+
+Instead of a fixed worker count and a random sleep after every page, all
+fetches go through one ``AimdController``:
+
+* a token bucket caps the request rate (requests/s);
+* a limit caps requests in flight;
+* both grow additively while responses come back fast and clean, and are
+  cut multiplicatively when ECI answers slowly, with Access Denied /
+  429 / 503, or times out (additive-increase / multiplicative-decrease,
+  as in TCP congestion control).
+
+So the scraper settles at the fastest rate ECI tolerates at the moment,
+backs off within one round trip when it pushes back, and creeps up again.
+"""
+
+import threading
+import time
+
+DEFAULT_RATE = 8.0          # requests/s to start with
+MIN_RATE = 0.5
+MAX_RATE = 50.0
+RATE_INCREASE = 1.0         # req/s gained per second of clean traffic
+DEFAULT_CONCURRENCY = 4     # requests in flight to start with
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 16
+TARGET_LATENCY = 2.0        # seconds; slower responses count as congestion
+DENIED_FACTOR = 0.5         # cut on Access Denied / 429 / 503 / timeout
+SLOW_FACTOR = 0.8           # gentler cut on slow responses
+DECREASE_COOLDOWN = 1.0     # at most one cut per this many seconds
+
+OK = "ok"
+SLOW = "slow"
+DENIED = "denied"
+TIMEOUT = "timeout"
+ERROR = "error"
+OUTCOMES = (OK, SLOW, DENIED, TIMEOUT, ERROR)
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``burst`` defaults to one second of tokens."""
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self._tokens = self.burst
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = rate
+            self.burst = max(1.0, rate)
+            self._tokens = min(self._tokens, self.burst)
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Take one token, waiting for it; False if ``timeout`` runs out first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class AimdController:
+    """Shared rate + concurrency limit, adapted from response outcomes.
+
+    Callers ``acquire()`` before a request and ``release(outcome, latency)``
+    after it, with ``outcome`` one of OK, SLOW, DENIED, TIMEOUT, ERROR
+    (SLOW is also inferred from ``latency`` above ``target_latency``).
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 min_rate: float = MIN_RATE, max_rate: float = MAX_RATE,
+                 min_concurrency: int = MIN_CONCURRENCY,
+                 max_concurrency: int = MAX_CONCURRENCY,
+                 target_latency: float = TARGET_LATENCY):
+        self.bucket = TokenBucket(rate)
+        self.limit = float(concurrency)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+        self._stats = {outcome: 0 for outcome in OUTCOMES}
+        self._stats.update({"decreases": 0, "wait_s": 0.0})
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Wait for a free in-flight slot and a rate token."""
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            self._in_flight += 1
+        remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+        if not self.bucket.acquire(remaining):
+            with self._cond:
+                self._in_flight -= 1
+                self._cond.notify()
+            return False
+        with self._cond:
+            self._stats["wait_s"] += time.monotonic() - started
+        return True
+
+    def release(self, outcome: str, latency: float) -> None:
+        """Report how a request went and adapt the limits."""
+        if outcome == OK and latency > self.target_latency:
+            outcome = SLOW
+        with self._cond:
+            self._in_flight -= 1
+            self._stats[outcome] += 1
+            rate = self.bucket.rate
+            if outcome == OK:
+                # +1 in flight per window of `limit` clean responses,
+                # +RATE_INCREASE req/s per second of clean traffic
+                self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+                rate = min(self.max_rate, rate + RATE_INCREASE / rate)
+            elif outcome in (SLOW, DENIED, TIMEOUT):
+                now = time.monotonic()
+                if now - self._last_decrease >= DECREASE_COOLDOWN:
+                    factor = SLOW_FACTOR if outcome == SLOW else DENIED_FACTOR
+                    self.limit = max(self.min_concurrency, self.limit * factor)
+                    rate = max(self.min_rate, rate * factor)
+                    self._last_decrease = now
+                    self._stats["decreases"] += 1
+            self._cond.notify_all()
+        if rate != self.bucket.rate:
+            self.bucket.set_rate(rate)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "rate": round(self.bucket.rate, 2),
+                "concurrency": int(self.limit),
+                "in_flight": self._in_flight,
+                **{k: (round(v, 2) if isinstance(v, float) else v) for k, v in self._stats.items()},
+            }
+
+
+_controller: AimdController | None = None
+_controller_lock = threading.Lock()
+
+
+def get_controller() -> AimdController:
+    """The process-wide controller shared by every fetcher."""
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = AimdController()
+        return _controller
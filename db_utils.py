@@ -373,9 +373,10 @@ def get_work_queue() -> list[dict]:
     cur = _cursor(conn)
     try:
         cur.execute("""
-            SELECT cs.state_code, cs.ac_no, cs.ac_name,
-                   cs.status, cs.current_round, cs.total_rounds
+            SELECT cs.state_code, COALESCE(s.state_name, cs.state_code) AS state_name,
+                   cs.ac_no, cs.ac_name, cs.status, cs.current_round, cs.total_rounds
             FROM constituency_status cs
+            LEFT JOIN states s ON s.state_code = cs.state_code
             WHERE cs.status NOT IN ('DONE', 'ERROR')
             ORDER BY CASE cs.status WHEN 'LIVE' THEN 0 ELSE 1 END,
                      cs.state_code, cs.ac_no
@@ -385,6 +386,102 @@ def get_work_queue() -> list[dict]:
         conn.close()
 
 
+def get_ingested_rounds() -> dict[tuple[str, int], set[int]]:
+    """Counting rounds already in rounds_ac: {(state_code, ac_no): {round_no, ...}}.
+
+    The postal/final round (999) is excluded.
+    """
+    conn = _connect()
+    cur = _cursor(conn)
+    try:
+        cur.execute("""
+            SELECT DISTINCT state_code, ac_no, round_no
+            FROM rounds_ac
+            WHERE round_no <> 999
+        """)
+        ingested: dict[tuple[str, int], set[int]] = {}
+        for row in cur.fetchall():
+            ingested.setdefault((row["state_code"], row["ac_no"]), set()).add(row["round_no"])
+        return ingested
+    finally:
+        conn.close()
+
+
+def get_ac_checkpoints(state_code: str) -> dict[int, dict]:
+    """Where each AC of a state stands: {ac_no: {status, total_rounds, last_round, postal}}.
+
+    last_round is the highest counting round in rounds_ac (0 if none);
+    postal says whether the postal/final round (999) is stored.
+    """
+    p = _placeholder()
+    conn = _connect()
+    cur = _cursor(conn)
+    try:
+        cur.execute(
+            f"""SELECT cs.ac_no, cs.status, cs.total_rounds,
+                       COALESCE(r.last_round, 0) AS last_round,
+                       COALESCE(r.postal, 0) AS postal
+                FROM constituency_status cs
+                LEFT JOIN (
+                    SELECT ac_no,
+                           MAX(CASE WHEN round_no <> 999 THEN round_no END) AS last_round,
+                           MAX(CASE WHEN round_no = 999 THEN 1 ELSE 0 END) AS postal
+                    FROM rounds_ac
+                    WHERE state_code = {p}
+                    GROUP BY ac_no
+                ) r ON r.ac_no = cs.ac_no
+                WHERE cs.state_code = {p}""",
+            (state_code, state_code),
+        )
+        return {
+            row["ac_no"]: {
+                "status": row["status"],
+                "total_rounds": row["total_rounds"] or 0,
+                "last_round": row["last_round"],
+                "postal": bool(row["postal"]),
+            }
+            for row in cur.fetchall()
+        }
+    finally:
+        conn.close()
+
+
+def get_latest_leaders(state_codes: list[str]) -> list[dict]:
+    """Leader of each AC in its latest round, for all ``state_codes`` in one query.
+
+    Rows: state_code, ac_no, party_abv, votes.
+    """
+    if not state_codes:
+        return []
+    if IS_PG:
+        where, params = "state_code = ANY(%s)", (list(state_codes),)
+    else:
+        where = f"state_code IN ({','.join(['?'] * len(state_codes))})"
+        params = tuple(state_codes)
+    conn = _connect()
+    cur = _cursor(conn)
+    try:
+        cur.execute(f"""
+            WITH latest AS (
+                SELECT state_code, ac_no, MAX(round_no) AS round_no
+                FROM rounds_ac
+                WHERE {where}
+                GROUP BY state_code, ac_no
+            ), ranked AS (
+                SELECT r.state_code, r.ac_no, r.party_abv, r.votes,
+                       ROW_NUMBER() OVER (PARTITION BY r.state_code, r.ac_no
+                                          ORDER BY r.votes DESC) AS rn
+                FROM rounds_ac r
+                JOIN latest l ON r.state_code = l.state_code AND r.ac_no = l.ac_no
+                                 AND r.round_no = l.round_no
+            )
+            SELECT state_code, ac_no, party_abv, votes FROM ranked WHERE rn = 1
+        """, params)
+        return cur.fetchall()
+    finally:
+        conn.close()
+
+
 def get_error_constituencies() -> list[dict]:
     conn = _connect()
     cur = _cursor(conn)
@@ -498,6 +595,57 @@ def insert_round_snapshot(
         conn.close()
 
 
+def insert_round_snapshots(
+    state_code: str,
+    ac_no: int,
+    ac_name: str,
+    rounds: list[dict],
+    replace: bool = False,
+) -> None:
+    """Bulk-insert several rounds of one constituency in a single transaction.
+
+    ``rounds`` is a list of ``{"round": int, "candidates": [...]}``.
+    Rows that already exist are left untouched, unless ``replace`` is set:
+    then every stored row of those rounds is deleted first.
+    """
+    p = _placeholder()
+    rows = [
+        (state_code, ac_no, ac_name, rd["round"],
+         c["candidate"], _normalize_party(c["party"]), c["votes"])
+        for rd in rounds
+        for c in rd["candidates"]
+    ]
+    if not rows:
+        return
+    conn = _connect()
+    cur = _cursor(conn)
+    try:
+        if replace:
+            cur.executemany(
+                f"DELETE FROM rounds_ac WHERE state_code={p} AND ac_no={p} AND round_no={p}",
+                [(state_code, ac_no, rd["round"]) for rd in rounds],
+            )
+        if IS_PG:
+            execute_values(
+                cur,
+                f"""INSERT INTO rounds_ac
+                   (state_code, ac_no, ac_name, round_no, candidate, party_abv, votes)
+                   VALUES %s
+                   ON CONFLICT DO NOTHING""",
+                rows,
+            )
+        else:
+            cur.executemany(
+                f"""INSERT OR IGNORE INTO rounds_ac
+                   (state_code, ac_no, ac_name, round_no, candidate, party_abv, votes)
+                   VALUES ({p},{p},{p},{p},{p},{p},{p})""",
+                rows,
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def update_won_status(state_code: str, won_ac_nos: list[int]) -> None:
     p = _placeholder()
     conn = _connect()
@@ -700,6 +848,22 @@ def get_all_constituency_statuses() -> pd.DataFrame:
         conn.close()
 
 
+def get_assembly_seats(state_code: str) -> int | None:
+    """Number of assembly constituencies of a state (None if unknown)."""
+    p = _placeholder()
+    conn = _connect()
+    cur = _cursor(conn)
+    try:
+        cur.execute(
+            f"SELECT assembly_seats FROM states WHERE state_code = {p}",
+            (state_code,),
+        )
+        row = cur.fetchone()
+        return row["assembly_seats"] if row else None
+    finally:
+        conn.close()
+
+
 def get_state_name(state_code: str) -> str:
     """Look up state name from ECI code via states table."""
     p = _placeholder()
@@ -5,82 +5,128 @@ Thin client that calls eci-ResultsDayServer.py API to download all rounds for al
 All heavy lifting (browser management, scraping) is handled by the API server.
 This client only:
 1. Starts the API server if needed
-2. Calls /scrape/ac-rounds endpoint for each AC
+2. Streams every AC of a cycle through one /scrape/ac-rounds/batch request
+   (NDJSON, one line per AC as it completes), asking only for the rounds
+   after each AC's checkpoint (last round stored; seeded from rounds_ac and
+   constituency_status, so a restart resumes) and skipping ACs that have
+   finished counting
 3. Writes results to PostgreSQL via db_utils
 
+Requests run on asyncio over one pooled httpx connection pool.  ACs that
+go one request each (--sequential, or left over from a broken batch
+stream) are bounded by a semaphore sized to the server's scrape workers
+(/health), each with a deadline and jittered exponential backoff.
+
 Modes:
 - One-shot (default): Download all rounds, write to DB, terminate
 - Live (--live): Continuously monitor and snapshot every N seconds for live dashboard
 
 Usage:
   python eci-ResultsDayLiveClient.py --url "https://results.eci.gov.in/ResultAcGenMay2026/partywiseresult-S03.htm"
+  python eci-ResultsDayLiveClient.py --live                      # every state in election.conf
   python eci-ResultsDayLiveClient.py --url "..." --live          # 300s interval
   python eci-ResultsDayLiveClient.py --url "..." --live 15       # 15s interval
   python eci-ResultsDayLiveClient.py --url "..." --start-round 5
   python eci-ResultsDayLiveClient.py --url "..." --only-ac 1     # Single AC only
+  python eci-ResultsDayLiveClient.py --url "..." --base-url http://127.0.0.1:8080  # stand-in
 """
 
+import asyncio
+import json
+import os
+import random
 import sys
 import time
-import threading
 import subprocess
-import requests
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 
-from db_utils import insert_round_snapshot
+import httpx
+
+from db_utils import (
+    get_ac_checkpoints,
+    get_assembly_seats,
+    insert_round_snapshot,
+    upsert_constituency_status,
+)
+from config import CONF_FILE, get_state_urls
 from core.scraper import get_state_name
 
 DEFAULT_PORT = 8000
 API_URL = f"http://localhost:{DEFAULT_PORT}"
+REQUEST_DEADLINE = 120    # one /scrape/ac-rounds request, start to finish (s)
+BATCH_READ_TIMEOUT = 300  # longest wait for the next AC on a batch stream (s)
+MAX_ATTEMPTS = 3
+BACKOFF_BASE = 1.0        # first retry waits up to this long (s), doubling after
+BACKOFF_MAX = 30.0
+DEFAULT_CONCURRENCY = 3   # if the server's /health does not say
+
 
+def backoff(attempt: int) -> float:
+    """Full-jitter exponential backoff before retry ``attempt`` (0-based)."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
 
-def process_ac(ac_no: int, url: str, state_code: str, start_round: int = 1):
+
+async def process_ac(client: httpx.AsyncClient, limit: asyncio.Semaphore, ac_no: int,
+                     url: str, state_code: str, start_round: int = 1):
     """
     Process a single AC by calling the API endpoint.
-    Returns dict with status info.
+    Returns dict with status info, including the AC's new checkpoint
+    (last_round stored, done once counting is complete).
     
     Args:
+        client: Pooled HTTP client
+        limit: Bounds the requests in flight (held only while one is)
         ac_no: AC number to process
         url: Base URL for the results page
         state_code: State code (e.g., 'S03')
         start_round: Start downloading from this round number (default 1 = all rounds)
     """
-    # Retry logic with increased timeout for slow API responses
-    max_retries = 3
-    response = None
-    
-    for attempt in range(max_retries):
+    error = None
+    for attempt in range(MAX_ATTEMPTS):
         try:
-            response = requests.post(
-                f"{API_URL}/scrape/ac-rounds",
-                json={"url": url, "ac_no": ac_no, "start_round": start_round},
-                timeout=120
-            )
-            break
-        except requests.exceptions.Timeout:
-            if attempt < max_retries - 1:
-                print(f"  AC {ac_no}: Timeout, retrying ({attempt + 1}/{max_retries})...")
-                time.sleep(2)
-                continue
-            return {"status": "error", "ac_no": ac_no, "error": "Timeout after 3 attempts"}
-        except requests.exceptions.ConnectionError as e:
-            if attempt < max_retries - 1:
-                print(f"  AC {ac_no}: Connection error, retrying ({attempt + 1}/{max_retries})...")
-                time.sleep(2)
-                continue
-            return {"status": "error", "ac_no": ac_no, "error": str(e)}
-    
-    # Process the response
+            async with limit:
+                async with asyncio.timeout(REQUEST_DEADLINE):
+                    response = await client.post(
+                        f"{API_URL}/scrape/ac-rounds",
+                        json={"url": url, "ac_no": ac_no, "start_round": start_round,
+                              "postal": False},  # postal votes come once counting is done
+                        timeout=REQUEST_DEADLINE,
+                    )
+            if response.status_code < 500:
+                break
+            error = f"HTTP {response.status_code}"
+        except (TimeoutError, httpx.TimeoutException):
+            error = f"Timeout after {REQUEST_DEADLINE}s"
+        except httpx.TransportError as e:
+            error = f"Connection error: {e or type(e).__name__}"
+        if attempt < MAX_ATTEMPTS - 1:
+            delay = backoff(attempt)
+            print(f"  AC {ac_no}: {error}, retrying in {delay:.1f}s ({attempt + 1}/{MAX_ATTEMPTS})...")
+            await asyncio.sleep(delay)
+    else:
+        return {"status": "error", "ac_no": ac_no, "error": f"{error} ({MAX_ATTEMPTS} attempts)"}
+
     try:
         data = response.json()
-        
+    except ValueError as e:
+        return {"status": "error", "ac_no": ac_no, "error": str(e)}
+    # DB writes are blocking: off the event loop, so other requests keep going
+    return await asyncio.to_thread(store_ac_result, ac_no, data, state_code, start_round)
+
+
+def store_ac_result(ac_no: int, data: dict, state_code: str, start_round: int) -> dict:
+    """
+    Write one /scrape/ac-rounds response to the DB.
+    Returns the process_ac status dict.
+    """
+    try:
         if data.get("status") == "error" and "404" in data.get("error", ""):
             return {"status": "done", "ac_no": ac_no}
         
         if data.get("status") != "success":
-            return {"status": "error", "ac_no": ac_no, "error": data.get("error")}
+            return {"status": "error", "ac_no": ac_no,
+                    "error": data.get("error") or data.get("detail")}
         
         ac_data = data.get("data", {})
         ac_name = ac_data.get("constituency", f"AC-{ac_no}")
@@ -132,81 +178,397 @@ def process_ac(ac_no: int, url: str, state_code: str, start_round: int = 1):
                 scraped_at=scraped_at,
             )
         
-        return {"status": "success", "ac_no": ac_no, "ac_name": ac_name, "rounds": len(rounds)}
+        current_round = ac_data.get("current_round", 0)
+        total_rounds = ac_data.get("total_rounds", 0)
+        counted = 0 < total_rounds == current_round
+        # Done as load_checkpoints has it: counting over and the postal round stored
+        done = counted and bool(postal_votes)
+        if current_round:
+            upsert_constituency_status(
+                state_code=state_code,
+                ac_no=ac_no,
+                ac_name=ac_name,
+                status="DONE" if counted else "LIVE",
+                current_round=current_round,
+                total_rounds=total_rounds,
+            )
+
+        return {
+            "status": "success", "ac_no": ac_no, "ac_name": ac_name, "rounds": len(rounds),
+            "last_round": max((r["round"] for r in rounds), default=start_round - 1),
+            "current_round": current_round, "total_rounds": total_rounds, "done": done,
+        }
         
     except Exception as e:
         return {"status": "error", "ac_no": ac_no, "error": str(e)}
 
 
-def run_cycle(url: str, state_code: str, start_round: int, only_ac: int = 0, sequential: bool = False, start_ac: int = 1):
-    """Run a single processing cycle for all ACs."""
+async def stream_acs(client: httpx.AsyncClient, url: str, state_code: str,
+                     starts: dict[int, int]):
+    """
+    Scrape many ACs over one /scrape/ac-rounds/batch request.
+
+    ``starts`` is {ac_no: start_round}.  Yields (ac_no, result) as each
+    AC's line arrives, after writing it to the DB (store_ac_result, on a
+    worker thread).  If the stream fails or breaks, says so and stops; the
+    caller retries the ACs it has not had.
+    """
+    pending = dict(starts)
+    try:
+        async with client.stream(
+            "POST",
+            f"{API_URL}/scrape/ac-rounds/batch",
+            json={"url": url, "postal": False,  # postal votes come once counting is done
+                  "acs": [{"ac_no": ac_no, "start_round": start_round}
+                          for ac_no, start_round in pending.items()]},
+            timeout=httpx.Timeout(10, read=BATCH_READ_TIMEOUT),
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                print(f"  Batch: HTTP {response.status_code}: {response.text[:200]}")
+                return
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                ac_no = data.get("ac_no")
+                if ac_no in pending:
+                    yield ac_no, await asyncio.to_thread(
+                        store_ac_result, ac_no, data, state_code, pending.pop(ac_no))
+    except (httpx.TransportError, ValueError) as e:
+        print(f"  Batch: {e or type(e).__name__}")
+    if pending:
+        print(f"  Batch: stream ended with {len(pending)} ACs outstanding")
+
+
+async def fetch_ac_range(client: httpx.AsyncClient, url: str, state_code: str) -> list[int]:
+    """
+    AC numbers to process: the server confirms 1..assembly_seats against ECI.
+    Falls back to the seat count in our own states table if it cannot.
+    """
+    try:
+        response = await client.post(f"{API_URL}/scrape/ac-range", json={"url": url},
+                                     timeout=REQUEST_DEADLINE)
+        data = response.json()
+        if data.get("status") == "success":
+            return data["ac_nos"]
+        print(f"  AC range: {data.get('error') or data.get('detail')}")
+    except (httpx.HTTPError, ValueError) as e:
+        print(f"  AC range: {e or type(e).__name__}")
+    seats = get_assembly_seats(state_code) or 0
+    print(f"  Using {seats} seats from the states table")
+    return list(range(1, seats + 1))
+
+
+def load_checkpoints(state_code: str) -> dict[int, dict]:
+    """
+    Per-AC checkpoint {ac_no: {"last_round", "done"}}, seeded from rounds_ac
+    and constituency_status so a restarted client resumes where it stopped.
+    """
+    return {
+        ac_no: {"last_round": cp["last_round"],
+                "done": cp["status"] == "DONE" and cp["postal"]}
+        for ac_no, cp in get_ac_checkpoints(state_code).items()
+    }
+
+
+def _todo(ac_nos: list[int], checkpoints: dict[int, dict], start_ac: int = 1) -> list[int]:
+    """ACs still counting (from start_ac on)."""
+    return [ac_no for ac_no in ac_nos
+            if ac_no >= start_ac and not checkpoints.get(ac_no, {}).get("done")]
+
+
+def _first_round(checkpoints: dict[int, dict], ac_no: int, start_round: int) -> int:
+    """Round to ask an AC for: after its checkpoint, and not before start_round."""
+    return max(start_round, checkpoints.get(ac_no, {}).get("last_round", 0) + 1)
+
+
+def _advance(checkpoints: dict[int, dict], ac_no: int, result: dict) -> None:
+    if result["status"] == "success":
+        cp = checkpoints.setdefault(ac_no, {"last_round": 0, "done": False})
+        cp["last_round"] = max(cp["last_round"], result["last_round"])
+        cp["done"] = result["done"]
+    elif result["status"] == "done":
+        # 404: no such AC (a gap in the numbering).  Done for this run only;
+        # nothing is stored, so a restart asks again.
+        checkpoints.setdefault(ac_no, {"last_round": 0, "done": False})["done"] = True
+
+
+def _report(ac_no: int, result: dict, state_code: str = "") -> None:
+    ac = f"{state_code} AC {ac_no}" if state_code else f"AC {ac_no}"
+    if result["status"] == "success":
+        progress = f", round {result['current_round']}/{result['total_rounds']}" if result.get("total_rounds") else ""
+        print(f"  {ac}: {result.get('ac_name', 'Error')} (+{result.get('rounds', 0)}r{progress})")
+    elif result["status"] == "done":
+        print(f"  {ac}: page not found (404), skipped for this run")
+    else:
+        print(f"  {ac}: FAILED - {result.get('error', 'Unknown error')}")
+
+
+async def run_cycle(client: httpx.AsyncClient, url: str, state_code: str, start_round: int,
+                    only_ac: int = 0, sequential: bool = False, start_ac: int = 1,
+                    ac_nos: list[int] | None = None, checkpoints: dict[int, dict] | None = None,
+                    concurrency: int = DEFAULT_CONCURRENCY):
+    """Run a single processing cycle for all ACs.
+
+    All ACs go to the server in one streamed batch request (stream_acs).
+    Any the stream did not deliver are retried one /scrape/ac-rounds
+    request each, at most ``concurrency`` at a time; ``sequential`` sends
+    every AC that way, one at a time.
+    ``ac_nos`` are the state's AC numbers (fetch_ac_range); a 404 for one of
+    them is reported and skipped rather than ending the cycle.  With
+    ``checkpoints`` (load_checkpoints), each AC is only asked for the rounds
+    after its last stored one, ACs that finished counting are skipped, and
+    the checkpoints are advanced from the results.
+    """
     results = []
-    num_workers = 3  # Each worker gets its own Chrome instance
-    
+    limit = asyncio.Semaphore(1 if sequential else concurrency)
+
     if only_ac > 0:
-        result = process_ac(only_ac, url, state_code, start_round)
+        result = await process_ac(client, limit, only_ac, url, state_code, start_round)
         results.append(result)
         print(f"  AC {only_ac}: {result}")
-    elif sequential:
-        ac_no = start_ac
-        while True:
-            result = process_ac(ac_no, url, state_code, start_round)
-            results.append(result)
-            print(f"  AC {ac_no}: {result.get('ac_name', 'Error')} ({result.get('rounds', 0)}r)" if result["status"] == "success" else f"  AC {ac_no}: FAILED - {result.get('error', 'Unknown error')}")
-            if result["status"] in ("done", "error"):
-                break
-            ac_no += 1
+        return results
+
+    if ac_nos is None:
+        ac_nos = await fetch_ac_range(client, url, state_code)
+    checkpoints = {} if checkpoints is None else checkpoints
+    ac_nos = _todo(ac_nos, checkpoints, start_ac)
+
+    def first_round(ac_no):
+        return _first_round(checkpoints, ac_no, start_round)
+
+    def advance(ac_no, result):
+        _advance(checkpoints, ac_no, result)
+        results.append(result)
+        _report(ac_no, result)
+
+    pending = set(ac_nos)
+    if not sequential and ac_nos:
+        async for ac_no, result in stream_acs(client, url, state_code,
+                                              {ac_no: first_round(ac_no) for ac_no in ac_nos}):
+            pending.discard(ac_no)
+            advance(ac_no, result)
+
+    async def one(ac_no):
+        return ac_no, await process_ac(client, limit, ac_no, url, state_code, first_round(ac_no))
+
+    rest = [ac_no for ac_no in ac_nos if ac_no in pending]
+    if sequential:
+        for ac_no in rest:
+            advance(*await one(ac_no))
     else:
-        worker_state = {"current": start_ac, "end_of_results": False}
-        lock = threading.Lock()
-        
-        def worker():
-            while True:
-                with lock:
-                    if worker_state["end_of_results"]:
-                        break
-                    ac_no = worker_state["current"]
-                    worker_state["current"] += 1
-                
-                result = process_ac(ac_no, url, state_code, start_round)
-                results.append(result)
-                
-                if result["status"] == "done":
-                    with lock:
-                        worker_state["end_of_results"] = True
-                    break
-                
-                if result["status"] == "error":
-                    print(f"  AC {ac_no}: FAILED - {result.get('error', 'Unknown error')}")
-                else:
-                    print(f"  AC {ac_no}: {result.get('ac_name', 'Error')} ({result.get('rounds', 0)}r)")
-        
-        with ThreadPoolExecutor(max_workers=num_workers) as executor:
-            futures = [executor.submit(worker) for _ in range(num_workers)]
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"Worker error: {e}")
+        for next_done in asyncio.as_completed([one(ac_no) for ac_no in rest]):
+            advance(*await next_done)
     
     return results
 
 
-def main(url: str, only_ac: int = 0, flush_db: bool = False, 
+async def monitor(url: str, state_code: str, only_ac: int = 0, live: int = 0,
+                  interval: int = 30, start_round: int = 1, sequential: bool = False,
+                  start_ac: int = 1, concurrency: int = DEFAULT_CONCURRENCY):
+    """One cycle, or (live > 0) a cycle every ``interval`` seconds until every AC is done."""
+    limits = httpx.Limits(max_connections=concurrency + 1,
+                          max_keepalive_connections=concurrency + 1)
+    async with httpx.AsyncClient(limits=limits) as client:
+        # AC numbers are fixed for the count; ask once
+        ac_nos = None if only_ac else await fetch_ac_range(client, url, state_code)
+        checkpoints = load_checkpoints(state_code)
+        if ac_nos is not None:
+            done = sum(1 for ac_no in ac_nos if checkpoints.get(ac_no, {}).get("done"))
+            started = sum(1 for ac_no in ac_nos if checkpoints.get(ac_no, {}).get("last_round"))
+            print(f"  ACs: {len(ac_nos)} ({done} finished, {started} with rounds stored)")
+
+        cycle_num = 0
+        while True:
+            cycle_num += 1
+            print(f"\n{'='*60}")
+            print(f"Cycle {cycle_num} - {time.strftime('%H:%M:%S')}")
+            
+            start_time = time.time()
+            results = await run_cycle(client, url, state_code, start_round, only_ac, sequential,
+                                      start_ac, ac_nos, checkpoints, concurrency)
+            
+            elapsed = time.time() - start_time
+            successful = sum(1 for r in results if r["status"] == "success")
+            new_rounds = sum(r.get("rounds", 0) for r in results)
+            
+            print(f"\nCycle {cycle_num} completed: {successful} of {len(results)} ACs polled, "
+                  f"{new_rounds} new rounds in {elapsed:.1f}s")
+            
+            if live <= 0:
+                break
+            if ac_nos is not None and not _todo(ac_nos, checkpoints, start_ac):
+                print("Every AC has finished counting.")
+                break
+            
+            print(f"Next update in {interval}s... (Ctrl+C to stop)")
+            await asyncio.sleep(interval)
+
+
+async def run_states_cycle(client: httpx.AsyncClient, states: list[dict], start_round: int,
+                           start_ac: int = 1, concurrency: int = DEFAULT_CONCURRENCY):
+    """Run a single processing cycle for the ACs of several states.
+
+    ``states`` are dicts {"code", "url", "ac_nos", "checkpoints"}.  All
+    states share one budget of ``concurrency`` ACs in flight, split evenly
+    between the states that still have ACs to ask for this cycle.  Each
+    state sends its ACs in slices of its share, one streamed batch request
+    (stream_acs) per slice, so a large state cannot crowd out a small one,
+    and a state that runs out of ACs leaves its share to the others.  ACs a
+    slice's stream did not deliver are retried one /scrape/ac-rounds
+    request each within that slice's share, as in run_cycle.  Returns
+    {state_code: results}; checkpoints are advanced as in run_cycle.
+    """
+    by_code = {state["code"]: state for state in states}
+    queues = {code: _todo(state["ac_nos"], state["checkpoints"], start_ac)
+              for code, state in by_code.items()}
+    results = {code: [] for code in by_code}
+    in_flight = 0
+    slot_freed = asyncio.Condition()
+
+    def share(code):
+        """``code``'s part of the budget among the states with ACs left (at least 1)."""
+        waiting = [c for c, queue in queues.items() if queue or c == code]
+        extra = waiting.index(code) < concurrency % len(waiting)
+        return max(1, concurrency // len(waiting) + extra)
+
+    async def run_state(code):
+        nonlocal in_flight
+        state = by_code[code]
+        queue = queues[code]
+
+        def first_round(ac_no):
+            return _first_round(state["checkpoints"], ac_no, start_round)
+
+        def advance(ac_no, result):
+            _advance(state["checkpoints"], ac_no, result)
+            results[code].append(result)
+            _report(ac_no, result, code)
+
+        while queue:
+            async with slot_freed:
+                # A share that just grew may not be free yet: wait for it
+                await slot_freed.wait_for(
+                    lambda: in_flight + min(len(queue), share(code)) <= concurrency
+                    or in_flight == 0)
+                size = min(len(queue), share(code))
+                in_flight += size
+            ac_slice, queue[:] = queue[:size], queue[size:]
+            try:
+                pending = set(ac_slice)
+                async for ac_no, result in stream_acs(
+                        client, state["url"], code,
+                        {ac_no: first_round(ac_no) for ac_no in ac_slice}):
+                    pending.discard(ac_no)
+                    advance(ac_no, result)
+
+                limit = asyncio.Semaphore(size)
+
+                async def one(ac_no):
+                    return ac_no, await process_ac(client, limit, ac_no, state["url"], code,
+                                                   first_round(ac_no))
+
+                rest = [ac_no for ac_no in ac_slice if ac_no in pending]
+                for next_done in asyncio.as_completed([one(ac_no) for ac_no in rest]):
+                    advance(*await next_done)
+            finally:
+                async with slot_freed:
+                    in_flight -= size
+                    slot_freed.notify_all()
+
+    await asyncio.gather(*(run_state(code) for code in by_code))
+    return results
+
+
+async def monitor_states(urls: dict[str, str], live: int = 0, interval: int = 30,
+                         start_round: int = 1, start_ac: int = 1,
+                         concurrency: int = DEFAULT_CONCURRENCY):
+    """monitor() for every state in ``urls`` ({state_code: url}) at once.
+
+    A state drops out of the cycles once every one of its ACs has finished
+    counting; live mode ends when all states have.
+    """
+    limits = httpx.Limits(max_connections=concurrency + 1,
+                          max_keepalive_connections=concurrency + 1)
+    async with httpx.AsyncClient(limits=limits) as client:
+        ranges = await asyncio.gather(*(fetch_ac_range(client, url, code)
+                                        for code, url in urls.items()))
+        states = []
+        for (code, url), ac_nos in zip(urls.items(), ranges):
+            checkpoints = load_checkpoints(code)
+            states.append({"code": code, "name": get_state_name(code), "url": url,
+                           "ac_nos": ac_nos, "checkpoints": checkpoints})
+            done = len(ac_nos) - len(_todo(ac_nos, checkpoints))
+            print(f"  {code} {get_state_name(code)}: {len(ac_nos)} ACs ({done} finished)")
+
+        def counting(state):
+            return bool(_todo(state["ac_nos"], state["checkpoints"], start_ac))
+
+        active = [state for state in states if counting(state)]
+        cycle_num = 0
+        while active:
+            cycle_num += 1
+            print(f"\n{'='*60}")
+            print(f"Cycle {cycle_num} - {time.strftime('%H:%M:%S')} - {len(active)} states")
+
+            start_time = time.time()
+            results = await run_states_cycle(client, active, start_round, start_ac, concurrency)
+            elapsed = time.time() - start_time
+
+            print(f"\nCycle {cycle_num} completed in {elapsed:.1f}s")
+            for state in active:
+                code, state_results = state["code"], results[state["code"]]
+                successful = sum(1 for r in state_results if r["status"] == "success")
+                new_rounds = sum(r.get("rounds", 0) for r in state_results)
+                left = len(_todo(state["ac_nos"], state["checkpoints"], start_ac))
+                status = "all ACs finished counting" if not left else f"{left} ACs still counting"
+                print(f"  {code} {state['name']}: {successful} of {len(state_results)} ACs polled, "
+                      f"{new_rounds} new rounds; {status}")
+
+            active = [state for state in active if counting(state)]
+            if live <= 0 or not active:
+                break
+            print(f"Next update in {interval}s... (Ctrl+C to stop)")
+            await asyncio.sleep(interval)
+
+        if not active:
+            print("Every AC in every state has finished counting.")
+
+
+def server_concurrency() -> int:
+    """ACs the API server scrapes at once, from /health."""
+    try:
+        return int(httpx.get(f"{API_URL}/health", timeout=5).json()["scrape_workers"])
+    except (httpx.HTTPError, ValueError, KeyError, TypeError):
+        return DEFAULT_CONCURRENCY
+
+
+def main(url: str | None = None, only_ac: int = 0, flush_db: bool = False, 
          live: int = 0, interval: int = 30, start_round: int = 1, sequential: bool = False,
-         start_ac: int = 1, no_server: bool = False):
+         start_ac: int = 1, no_server: bool = False, base_url: str | None = None):
     """Main entry point.
     
     Args:
+        url: Party-wise results URL of one state.  Without it, every state
+             in election.conf is covered from this one process
+             (monitor_states), sharing one concurrency budget.
         live: If > 0, enables live mode with this as the interval (seconds)
         no_server: If True, connect to an existing server instead of starting one.
-                   Use this when running multiple clients against one server:
+                   Use this when several clients share one server:
                  Terminal 1:  uv run server.py --api
                  Terminal 2:  uv run eci-ResultsDayLiveClient.py --url ...PY... --no-server
                  Terminal 3:  uv run eci-ResultsDayLiveClient.py --url ...KL... --no-server
+        base_url: Site the API server fetches ECI pages from (e.g. a local
+                  core.standin); passed to a server we start as ECI_BASE_URL.
+                  An existing server keeps its own ECI_BASE_URL.
     """
-    if not url:
-        print("Error: --url parameter is required")
+    state_urls = [url] if url else list(get_state_urls().values())
+    if not state_urls:
+        print(f"Error: no --url given and no URLs in {CONF_FILE}")
+        sys.exit(1)
+    if only_ac and not url:
+        print("Error: --only-ac needs --url")
         sys.exit(1)
     
     print("Starting download of election results...")
@@ -226,6 +588,8 @@ def main(url: str, only_ac: int = 0, flush_db: bool = False,
     we_started_server = False
     api_process = None
 
+    if base_url and (no_server or port_in_use):
+        print(f"Note: the running server fetches from its own ECI_BASE_URL, not {base_url}")
     if no_server:
         if not port_in_use:
             print(f"Error: No server running on port {DEFAULT_PORT}")
@@ -237,12 +601,16 @@ def main(url: str, only_ac: int = 0, flush_db: bool = False,
     else:
         script_dir = Path(__file__).parent
         server_path = script_dir / "server.py"
+        env = dict(os.environ)
+        if base_url:
+            env["ECI_BASE_URL"] = base_url
 
         api_process = subprocess.Popen(
             [sys.executable, str(server_path), "--api"],
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
-            cwd=str(script_dir)
+            cwd=str(script_dir),
+            env=env,
         )
         we_started_server = True
 
@@ -250,11 +618,11 @@ def main(url: str, only_ac: int = 0, flush_db: bool = False,
         for i in range(max_wait):
             time.sleep(1)
             try:
-                response = requests.get(f"{API_URL}/health", timeout=2)
+                response = httpx.get(f"{API_URL}/health", timeout=2)
                 if response.status_code == 200:
                     print(f"API server: {response.json()}")
                     break
-            except:
+            except httpx.HTTPError:
                 if i == max_wait - 1:
                     print(f"Error: API server failed to start after {max_wait}s")
                     api_process.terminate()
@@ -263,44 +631,34 @@ def main(url: str, only_ac: int = 0, flush_db: bool = False,
         else:
             print(f"Error: Could not connect to API server")
     
-    # Parse URL to get state code
-    match = re.match(r'^https://results\.eci\.gov\.in/([^/]+)/partywiseresult-([A-Z]\d+)\.htm$', url)
-    if not match:
-        print("Error: Invalid URL format")
-        if we_started_server and api_process is not None:
-            api_process.terminate()
-        sys.exit(1)
-    
-    election_id = match.group(1)
-    state_code = match.group(2)
+    # Parse URLs to get state codes
+    urls = {}
+    for state_url in state_urls:
+        match = re.match(r'^https?://[^/]+(?:/[^/]+)*?/([^/]+)/partywiseresult-([A-Z]\d+)\.htm$', state_url)
+        if not match:
+            print(f"Error: Invalid URL format: {state_url}")
+            if we_started_server and api_process is not None:
+                api_process.terminate()
+            sys.exit(1)
+        urls[match.group(2)] = state_url
 
-    print(f"\nProcessing: {url}")
-    print(f"  State: {get_state_name(state_code)} ({state_code})")
+    for state_code, state_url in urls.items():
+        print(f"\nProcessing: {state_url}")
+        print(f"  State: {get_state_name(state_code)} ({state_code})")
     if start_round > 1:
         print(f"  Start round: {start_round} (incremental mode)")
     
-    # Live mode loop
-    cycle_num = 0
+    concurrency = 1 if sequential else server_concurrency()
+    if not sequential:
+        print(f"  Concurrency: {concurrency} (server scrape workers)")
+
     try:
-        while True:
-            cycle_num += 1
-            print(f"\n{'='*60}")
-            print(f"Cycle {cycle_num} - {time.strftime('%H:%M:%S')}")
-            
-            start_time = time.time()
-            results = run_cycle(url, state_code, start_round, only_ac, sequential, start_ac)
-            
-            elapsed = time.time() - start_time
-            successful = sum(1 for r in results if r["status"] == "success")
-            
-            print(f"\nCycle {cycle_num} completed: {successful} ACs in {elapsed:.1f}s")
-            
-            if live <= 0:
-                break
-            
-            print(f"Next update in {interval}s... (Ctrl+C to stop)")
-            time.sleep(interval)
-    
+        if url:
+            state_code, = urls
+            asyncio.run(monitor(url, state_code, only_ac, live, interval, start_round,
+                                sequential, start_ac, concurrency))
+        else:
+            asyncio.run(monitor_states(urls, live, interval, start_round, start_ac, concurrency))
     except KeyboardInterrupt:
         print("\n\nLive monitoring stopped by user")
     
@@ -311,7 +669,8 @@ def main(url: str, only_ac: int = 0, flush_db: bool = False,
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser()
-    parser.add_argument("--url", required=True)
+    parser.add_argument("--url", default=None,
+                        help="Party-wise results URL of one state (default: every state in election.conf)")
     parser.add_argument("--test-ac", type=int, default=0)
     parser.add_argument("--flush", action="store_true")
     parser.add_argument("--live", type=int, nargs="?", const=300, default=0, 
@@ -320,14 +679,17 @@ if __name__ == "__main__":
     parser.add_argument("--only-ac", type=int, default=0, help="Process only this specific AC number (0 = all ACs)")
     parser.add_argument("--start-ac", type=int, default=1, help="Start downloading from this AC number (default: 1)")
     parser.add_argument("--sequential", action="store_true", 
-                        help="Process ACs sequentially instead of concurrently (safer for resource-constrained systems)")
+                        help="One request per AC instead of one streamed batch per cycle "
+                             "(safer for resource-constrained systems)")
     parser.add_argument("--no-server", action="store_true",
-                        help="Connect to an existing server instead of starting one. "
-                             "Use for multi-state runs: start server separately, "
-                             "then run multiple clients with --no-server")
+                        help="Connect to an existing server instead of starting one "
+                             "(e.g. one server shared by several clients)")
+    parser.add_argument("--base-url", default=None,
+                        help="Have the API server fetch pages from here instead of "
+                             "results.eci.gov.in (e.g. a core.standin rehearsal server)")
     args = parser.parse_args()
     
     main(url=args.url, only_ac=args.only_ac, flush_db=args.flush,
          live=args.live, interval=args.live if args.live > 0 else 30, start_round=args.start_round, 
          sequential=args.sequential, start_ac=args.start_ac,
-         no_server=args.no_server)
+         no_server=args.no_server, base_url=args.base_url)
@@ -3,23 +3,29 @@
 ECI Live Election Scraper.
 
 Scrapes round-wise counting results from results.eci.gov.in.
-Primary: requests + BeautifulSoup (pages are server-rendered).
-Fallback: Selenium headless Chrome (if requests fails / pages need JS).
+Primary: pooled libcurl (core.fetch) + core.parser (pages are server-rendered).
+Fallback: Selenium headless Chrome (if the fetch fails / pages need JS).
 
-Called by scheduler.sh every 15 minutes on counting day.
+Called by scheduler.sh every 15 minutes on counting day, or run once with
+--daemon to keep the config, DB caches, HTTP connections and Chrome warm
+and poll back to back until every constituency is DONE.
 """
 
+import json
 import logging
+import math
+import os
 import random
 import re
-import subprocess
+import signal
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from queue import Empty, SimpleQueue
+from urllib.parse import urljoin, urlsplit
 
-import requests
 from bs4 import BeautifulSoup
 
 try:
@@ -45,16 +51,41 @@ try:
 except ImportError:
     HAS_UC = False
 
+try:
+    import fcntl
+
+    HAS_FCNTL = True
+except ImportError:  # Windows: no run lock
+    HAS_FCNTL = False
+
 from db_utils import (
     _normalize_party,
+    get_ingested_rounds,
+    get_latest_leaders,
     get_work_queue,
     init_db,
-    insert_round_snapshot,
+    insert_round_snapshots,
     update_won_status,
     upsert_constituency_status,
 )
 from config import get_election_id, get_tracked_states
-from core.scraper import build_roundwise_url
+from core.browser import FETCH_BATCH, DriverPool
+from core import throttle
+from core.archive import PageArchive
+from core.circuit import breaker_stats, get_breaker
+from core.fetch import SLOT_TIMEOUT, ValidatorCache, close_fetcher, get_fetcher, outcome
+from core.parse_pool import EXECUTORS, close_parse_pool, get_parse_pool
+from core.parser import (
+    ENGINES,
+    Bs4RoundwisePage,
+    ParsedPage,
+    open_roundwise,
+    parse_roundwise,
+    peek_round_status,
+)
+from core.schedule import PollScheduler, ac_key, margin_ratio
+from core.session import get_session_broker
+from core.scraper import build_partywise_url, build_roundwise_url, eci_url, set_base_url
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -64,10 +95,43 @@ ELECTION_ID = get_election_id()
 TRACKED_STATES = get_tracked_states()
 
 # DB_PATH removed — all DB access goes through db_utils (PostgreSQL)
-MAX_WORKERS = 8  # requests is lightweight — can run more workers
+# Worker threads; requests actually in flight and the request rate are set
+# by the shared AIMD controller (core.throttle), which adapts to ECI
+MAX_WORKERS = throttle.MAX_CONCURRENCY
 PAGE_LOAD_TIMEOUT = 15
-MIN_JITTER = 0.2
-MAX_JITTER = 0.8
+# Budget per AC page, fetch + parse + any Selenium fallback.  Past it the
+# task is reported as TIMEOUT and retried next cycle.
+TASK_TIMEOUT = 45
+MIN_SELENIUM_TIME = 5  # don't start the Selenium fallback with less left
+# Chrome drivers shared by the workers for the Selenium fallback
+SELENIUM_POOL_SIZE = int(os.environ.get("SELENIUM_POOL_SIZE", "2"))
+# Pages that need Chrome go to their own lane: at most SELENIUM_MAX_FALLBACKS
+# at once (the rest queue, while the HTTP workers carry on) and at most
+# SELENIUM_BUDGET per cycle (the rest are deferred to the next cycle)
+SELENIUM_MAX_FALLBACKS = SELENIUM_POOL_SIZE
+SELENIUM_BUDGET = int(os.environ.get("ECI_SELENIUM_BUDGET", "60"))
+# Roundwise parser: "fast" (core.parser byte scanner) or "bs4"; --parser overrides
+PARSER = os.environ.get("ECI_PARSER", "fast")
+# Where pages are parsed (core.parse_pool): auto, thread, process or
+# interpreter; --parse-executor overrides
+PARSE_EXECUTOR = os.environ.get("ECI_PARSE_EXECUTOR", "auto")
+# ETag / Last-Modified / body digest per Roundwise URL, kept between cycles
+VALIDATORS_FILE = os.path.join(os.path.dirname(__file__), "data", "fetch_validators.json")
+# Per-AC round cadence and next-due times for --adaptive
+SCHEDULE_FILE = os.path.join(os.path.dirname(__file__), "data", "poll_schedule.json")
+# Held for the whole run, so cron runs and a daemon never overlap
+LOCK_FILE = os.path.join(os.path.dirname(__file__), "data", "eci-live-scraper.lock")
+# Raw Roundwise pages (content-addressed, zstd) for --archive / --replay
+ARCHIVE_DIR = os.environ.get("ECI_ARCHIVE_DIR",
+                             os.path.join(os.path.dirname(__file__), "data", "archive"))
+ARCHIVE = os.environ.get("ECI_ARCHIVE", "") == "1"
+# One JSON line of stats per cycle
+CYCLE_STATS_FILE = os.path.join(os.path.dirname(__file__), "data", "cycle_stats.jsonl")
+# --daemon: seconds between cycle starts (0 = back to back) and the budget
+# for starting tasks in one cycle; tasks left over wait for the next cycle
+DAEMON_INTERVAL = int(os.environ.get("ECI_DAEMON_INTERVAL", "0"))
+CYCLE_DEADLINE = int(os.environ.get("ECI_CYCLE_DEADLINE", "600"))
+MIN_CYCLE_GAP = 5  # rest between back-to-back cycles
 
 USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
@@ -77,8 +141,14 @@ USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0",
 ]
 
-# Thread-local storage for requests sessions
-_thread_local = threading.local()
+_validators = ValidatorCache(VALIDATORS_FILE)
+
+# Set in main when archiving (--archive / ECI_ARCHIVE=1)
+_archive: PageArchive | None = None
+
+# Set by SIGTERM / SIGINT: workers stop taking tasks, the cycle is written
+# out and the run ends
+_stop = threading.Event()
 
 # Logging
 logging.basicConfig(
@@ -93,33 +163,13 @@ logger = logging.getLogger(__name__)
 
 
 # ---------------------------------------------------------------------------
-# HTTP session management
+# HTML parsing (core.parser — fast scanner by default, BS4 as fallback)
 # ---------------------------------------------------------------------------
 
-def _get_session() -> requests.Session:
-    """Get or create a thread-local requests session."""
-    if not hasattr(_thread_local, "session") or _thread_local.session is None:
-        s = requests.Session()
-        s.headers.update(
-            {
-                "User-Agent": random.choice(USER_AGENTS),
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-            }
-        )
-        _thread_local.session = s
-    return _thread_local.session
-
-
-# ---------------------------------------------------------------------------
-# HTML parsing (requests + BeautifulSoup — primary method)
-# ---------------------------------------------------------------------------
-
-def _parse_page_bs4(html: str, task: dict) -> dict:
+def _parse_page(html: str | bytes | ParsedPage, task: dict, engine: str | None = None) -> dict:
     """
-    Parse an ECI Roundwise page using BeautifulSoup.
+    Parse an ECI Roundwise page with the chosen core.parser engine, or read
+    a ParsedPage the parse pool already produced.
     All round tables are pre-rendered in the HTML — no JS needed.
     """
     result = {
@@ -132,28 +182,27 @@ def _parse_page_bs4(html: str, task: dict) -> dict:
         "current_round": 0,
         "total_rounds": 0,
         "candidates": [],
+        "rounds": [],
     }
 
-    soup = BeautifulSoup(html, "html.parser")
+    page = html if isinstance(html, ParsedPage) else open_roundwise(html, engine or PARSER)
 
     # Check for 404 / Access Denied
-    title = soup.title.string if soup.title else ""
-    if "404" in (title or "") or "Not Found" in (title or "") or "Access Denied" in (title or ""):
+    title = page.title
+    if "404" in title or "Not Found" in title or "Access Denied" in title:
         result["status"] = "NOT_YET_LIVE"
         return result
 
     # Extract constituency name from h2 > span
-    h2 = soup.find("h2")
-    if not h2:
+    full_text = page.heading
+    if full_text is None:
         result["status"] = "ERROR"
         return result
 
-    span = h2.find("span")
-    full_text = span.get_text() if span else h2.get_text()
     result["ac_name"] = _parse_ac_name(full_text, task["ac_no"])
 
     # Extract round info: "Status as on Round, X/Y"
-    round_info = _extract_round_info_bs4(soup)
+    round_info = page.round_status
     if round_info is None:
         result["status"] = "NOT_YET_LIVE"
         return result
@@ -169,15 +218,16 @@ def _parse_page_bs4(html: str, task: dict) -> dict:
 
     # Extract candidates from the CURRENT round's table.
     # Each round is in <div id="tab{N}"> with a <table> inside.
-    candidates = _extract_candidates_bs4(soup, current_round)
+    candidates = _candidates_from_rows(page.tab_rows(current_round))
     if not candidates:
         # Fallback: try tab1 (sometimes only tab1 has data)
-        candidates = _extract_candidates_bs4(soup, 1)
+        candidates = _candidates_from_rows(page.tab_rows(1))
 
     if not candidates:
         return result
 
     result["candidates"] = candidates
+    result["rounds"] = _all_rounds(page, current_round, candidates)
     result["status"] = (
         "DONE" if current_round == total_rounds and total_rounds > 0
         else "LIVE"
@@ -185,6 +235,27 @@ def _parse_page_bs4(html: str, task: dict) -> dict:
     return result
 
 
+def _all_rounds(page, current_round: int, candidates: list[dict]) -> list[dict]:
+    """
+    Every round published on the page, as ``{"round": N, "candidates": [...]}``.
+    Earlier tabs are kept so run_cycle can back-fill rounds that a slow or
+    missed cycle never stored; the current round uses ``candidates``.
+    """
+    rounds = []
+    for n in sorted(page.tab_numbers()):
+        if 0 < n < current_round:
+            tally = _candidates_from_rows(page.tab_rows(n))
+            if tally:
+                rounds.append({"round": n, "candidates": tally})
+    rounds.append({"round": current_round, "candidates": candidates})
+    return rounds
+
+
+def _parse_page_bs4(html: str | bytes, task: dict) -> dict:
+    """Parse a Roundwise page with BeautifulSoup (reference parser)."""
+    return _parse_page(html, task, engine="bs4")
+
+
 def _parse_ac_name(text: str, fallback_no: int) -> str:
     """Parse constituency name from h2 text."""
     # Pattern: "195 - THIRUPARANKUNDRAM(Tamil Nadu)"
@@ -198,49 +269,18 @@ def _parse_ac_name(text: str, fallback_no: int) -> str:
     return f"AC-{fallback_no}"
 
 
-def _extract_round_info_bs4(soup: BeautifulSoup) -> tuple[int, int] | None:
-    """Extract current/total round from 'Status as on Round, X/Y'."""
-    # The HTML has: <div class='round-status'> Status as on Round, <span>9</span>/26</div>
-    round_div = soup.find("div", class_="round-status")
-    if not round_div:
-        # Fallback: search all text
-        for el in soup.find_all(string=re.compile(r"Status as on Round")):
-            text = el.strip()
-            m = re.search(r"(\d+)\s*/\s*(\d+)", text)
-            if m:
-                return int(m.group(1)), int(m.group(2))
-        return None
-
-    text = round_div.get_text()
-    m = re.search(r"(\d+)\s*/\s*(\d+)", text)
-    if m:
-        return int(m.group(1)), int(m.group(2))
-    return None
-
-
-def _extract_candidates_bs4(soup: BeautifulSoup, round_no: int) -> list[dict]:
+def _candidates_from_rows(rows: list[list[str]] | None) -> list[dict]:
     """
-    Extract candidate data for a specific round.
-    Looks for <div id="tab{round_no}"> then its <tbody> rows.
+    Build candidate dicts from one round's table rows (cell texts).
+    Columns: candidate, party, brought forward, current round, total.
     """
     candidates = []
-
-    # Find the specific round's tab div
-    tab_div = soup.find("div", id=f"tab{round_no}")
-    if not tab_div:
-        return candidates
-
-    tbody = tab_div.find("tbody")
-    if not tbody:
-        return candidates
-
-    for row in tbody.find_all("tr"):
-        cols = row.find_all("td")
+    for cols in rows or []:
         if len(cols) >= 5:
-            candidate_name = cols[0].get_text(strip=True)
-            party_name = cols[1].get_text(strip=True)
+            candidate_name = cols[0]
+            party_name = cols[1]
             # Column 5 (index 4) = Total votes
-            total_votes_text = cols[4].get_text(strip=True).replace(",", "").replace(" ", "")
+            total_votes_text = cols[4].replace(",", "").replace(" ", "")
             if candidate_name and party_name and total_votes_text.isdigit():
                 candidates.append(
                     {
@@ -257,9 +297,6 @@ def _extract_candidates_bs4(soup: BeautifulSoup, round_no: int) -> list[dict]:
 # Selenium fallback (for pages that need JS)
 # ---------------------------------------------------------------------------
 
-_thread_local_driver = threading.local()
-
-
 def _create_selenium_driver():
     """Create a headless Chrome driver."""
     if HAS_UC:
@@ -291,19 +328,14 @@ def _create_selenium_driver():
     return driver
 
 
-def _get_selenium_driver():
-    if not hasattr(_thread_local_driver, "driver") or _thread_local_driver.driver is None:
-        _thread_local_driver.driver = _create_selenium_driver()
-    return _thread_local_driver.driver
-
-
-def _quit_selenium_driver():
-    if hasattr(_thread_local_driver, "driver") and _thread_local_driver.driver:
-        try:
-            _thread_local_driver.driver.quit()
-        except Exception:
-            pass
-        _thread_local_driver.driver = None
+# Drivers are shared by all worker threads and started only when a page
+# actually needs the Selenium fallback; recycled by page count / memory.
+_driver_pool = (
+    DriverPool(size=SELENIUM_POOL_SIZE, factory=_create_selenium_driver)
+    if HAS_SELENIUM else None
+)
+# The HTTP fetcher's Akamai session (core.session) is renewed on these drivers
+get_session_broker().pool = _driver_pool
 
 
 def _parse_page_selenium(task: dict) -> dict:
@@ -321,29 +353,29 @@ def _parse_page_selenium(task: dict) -> dict:
     }
 
     try:
-        driver = _get_selenium_driver()
-        driver.get(task["url"])
+        with _driver_pool.lease(timeout=_time_left(task)) as driver:
+            driver.get(task["url"])
 
-        title = driver.title
-        if "404" in title or "Not Found" in title or "Access Denied" in title:
-            result["status"] = "NOT_YET_LIVE"
-            return result
+            title = driver.title
+            if "404" in title or "Not Found" in title or "Access Denied" in title:
+                result["status"] = "NOT_YET_LIVE"
+                return result
 
-        wait = WebDriverWait(driver, PAGE_LOAD_TIMEOUT)
-        h2_el = wait.until(EC.presence_of_element_located((By.TAG_NAME, "h2")))
+            wait = WebDriverWait(driver, PAGE_LOAD_TIMEOUT)
+            h2_el = wait.until(EC.presence_of_element_located((By.TAG_NAME, "h2")))
 
-        try:
-            span_el = h2_el.find_element(By.TAG_NAME, "span")
-            full_text = span_el.text
-        except NoSuchElementException:
-            full_text = h2_el.text
+            try:
+                span_el = h2_el.find_element(By.TAG_NAME, "span")
+                full_text = span_el.text
+            except NoSuchElementException:
+                full_text = h2_el.text
 
-        result["ac_name"] = _parse_ac_name(full_text, task["ac_no"])
+            result["ac_name"] = _parse_ac_name(full_text, task["ac_no"])
 
-        # Read round info from the page source (more reliable)
-        page_src = driver.page_source
-        soup = BeautifulSoup(page_src, "html.parser")
-        round_info = _extract_round_info_bs4(soup)
+            # Read round info from the page source (more reliable)
+            page = Bs4RoundwisePage(driver.page_source)
+
+        round_info = page.round_status
         if round_info is None:
             result["status"] = "NOT_YET_LIVE"
             return result
@@ -353,15 +385,16 @@ def _parse_page_selenium(task: dict) -> dict:
         result["total_rounds"] = total_rounds
 
         # Use BS4 to extract from the correct round's tab
-        candidates = _extract_candidates_bs4(soup, current_round)
+        candidates = _candidates_from_rows(page.tab_rows(current_round))
         if not candidates:
-            candidates = _extract_candidates_bs4(soup, 1)
+            candidates = _candidates_from_rows(page.tab_rows(1))
 
         if not candidates:
             result["status"] = "ERROR"
             return result
 
         result["candidates"] = candidates
+        result["rounds"] = _all_rounds(page, current_round, candidates)
         result["status"] = (
             "DONE" if current_round == total_rounds and total_rounds > 0
             else "LIVE"
@@ -369,10 +402,14 @@ def _parse_page_selenium(task: dict) -> dict:
 
     except TimeoutException:
         result["status"] = "ERROR"
+    except TimeoutError:
+        # No pooled driver came free before the task's deadline
+        logger.warning("No Selenium driver free in time for %s", task["url"])
+        result["status"] = "TIMEOUT"
     except WebDriverException as e:
+        # lease() has already recycled the driver
         logger.error("WebDriver error on %s: %s", task["url"], e)
         result["status"] = "ERROR"
-        _quit_selenium_driver()
     except Exception as e:
         logger.error("Unexpected Selenium error on %s: %s", task["url"], e)
         result["status"] = "ERROR"
@@ -384,25 +421,44 @@ def _parse_page_selenium(task: dict) -> dict:
 # Main scrape function (tries requests first, falls back to Selenium)
 # ---------------------------------------------------------------------------
 
-def _fetch_html_curl(url: str, timeout: int = 15) -> str | None:
-    """Fetch HTML via curl subprocess. Avoids Akamai TLS fingerprint blocking."""
-    try:
-        r = subprocess.run(
-            ["curl", "-s", "-L", "--max-time", str(timeout), url],
-            capture_output=True, text=True, timeout=timeout + 5,
-        )
-        if r.returncode != 0:
-            return None
-        return r.stdout
-    except Exception:
-        return None
+# Why the HTTP path produced no page (see _fetch_failure)
+NOT_FOUND = "not_found"    # 404: not yet live — Chrome would see the same
+DENIED = "denied"          # Access Denied / 403 / 429 / 503
+TRANSIENT = "transient"    # timeout, connection error, other 5xx
+
+
+def _fetch_failure(fetched) -> str | None:
+    """NOT_FOUND, DENIED or TRANSIENT; None for a page worth parsing."""
+    if not fetched.ok:
+        return TRANSIENT
+    if fetched.status == 404:
+        return NOT_FOUND
+    if outcome(fetched) == throttle.DENIED:
+        return DENIED
+    head = fetched.body[:500]
+    if b"404" in head or b"Not Found" in head:
+        return NOT_FOUND
+    if fetched.status >= 500:
+        return TRANSIENT
+    return None
 
 
 def scrape_constituency(task: dict) -> dict:
     """
-    Scrape one constituency Roundwise page.
-    Primary: curl + BeautifulSoup (avoids Akamai TLS fingerprint block).
-    Fallback: Selenium (if curl fails).
+    Scrape one constituency Roundwise page over HTTP.
+    Primary: pooled libcurl (avoids Akamai TLS fingerprint block) + core.parser,
+    retried with BS4 if the fast parser cannot read the page.
+
+    Returns status UNCHANGED (no parse) when the server answers 304, the
+    body is byte-identical to the last successfully processed fetch, or
+    its round-status still reads the AC's last stored round (``known_round``)
+    and total (``same_round`` set: read off the raw bytes by
+    peek_round_status), and
+    NEEDS_BROWSER when the page should be tried in Chrome: the fetch was
+    denied or failed, the page could not be parsed, or the host's circuit
+    breaker is open.  run_cycle hands those to the Selenium lane
+    (_browser_fallback).  A 404 never needs the browser.  TIMEOUT when the
+    rate controller held the request back until the task's deadline.
     """
     not_yet_live = {
         "state_code": task["state_code"],
@@ -415,228 +471,603 @@ def scrape_constituency(task: dict) -> dict:
         "total_rounds": 0,
         "candidates": [],
     }
+    needs_browser = {**not_yet_live, "status": "NEEDS_BROWSER"} if HAS_SELENIUM else not_yet_live
+    unchanged = {
+        **not_yet_live,
+        "status": "UNCHANGED",
+        "current_round": task.get("current_round", 0),
+        "total_rounds": task.get("total_rounds", 0),
+    }
 
-    # --- Primary: curl + BeautifulSoup ---
-    html = _fetch_html_curl(task["url"], timeout=PAGE_LOAD_TIMEOUT)
-    if html:
-        # Check for 404 / Access Denied in the HTML itself
-        if "404" in html[:500] or "Not Found" in html[:500] or "Access Denied" in html[:500]:
-            time.sleep(random.uniform(MIN_JITTER, MAX_JITTER))
-            return not_yet_live
+    breaker = get_breaker(urlsplit(task["url"]).netloc)
+    if not breaker.allow():
+        return needs_browser
 
-        result = _parse_page_bs4(html, task)
+    # --- Primary: pooled libcurl + core.parser ---
+    fetch_timeout = max(1, min(PAGE_LOAD_TIMEOUT, math.ceil(_time_left(task))))
+    try:
+        fetched = get_fetcher().fetch(task["url"], timeout=fetch_timeout, cache=_validators)
+    except Exception:
+        breaker.record(False)
+        raise
+    if fetched.error == SLOT_TIMEOUT:
+        # Held back by the rate controller past the deadline, never sent
+        breaker.cancel()
+        return {**not_yet_live, "status": "TIMEOUT"}
+    failure = _fetch_failure(fetched)
+    breaker.record(failure not in (DENIED, TRANSIENT))
+    if fetched.unchanged:
+        # Nothing published since last cycle — skip parse and DB writes
+        return unchanged
+
+    html = fetched.body if fetched.ok else None
+    if html and _archive is not None and fetched.status == 200:
+        try:
+            _archive.put(task["url"], html, digest=fetched.digest)
+        except OSError as e:
+            logger.warning("Could not archive %s: %s", task["url"], e)
+    if failure == NOT_FOUND:
+        _validators.store(fetched)
+        return not_yet_live
+    if failure is None and task.get("known_round") and (
+            peek_round_status(html) == (task["known_round"], task.get("total_rounds"))):
+        # New bytes (a timestamp, a banner), but still the round already stored
+        _validators.store(fetched)
+        return {**unchanged, "same_round": True}
+    if failure is None:
+        # CPU-bound: off the fetch threads, onto the parse executor
+        # Rounds up to known_round are in rounds_ac: skip their tabs
+        try:
+            page = get_parse_pool().run(parse_roundwise, html, PARSER, task.get("known_round", 0),
+                                        timeout=max(1.0, _time_left(task)))
+        except TimeoutError:
+            # A busy parse executor is not a broken page: retried next cycle
+            logger.warning("Parse of %s did not finish before the task deadline", task["url"])
+            return {**not_yet_live, "status": "TIMEOUT"}
+        result = _parse_page(page, task)
+        if result["status"] == "ERROR" and PARSER != "bs4":
+            logger.debug("Fast parse failed for %s, retrying with BS4", task["url"])
+            result = _parse_page_bs4(html, task)
         if result["status"] != "ERROR":
-            time.sleep(random.uniform(MIN_JITTER, MAX_JITTER))
+            _validators.store(fetched)
             return result
-        # BS4 parse failed — fall through to Selenium
-        logger.debug("BS4 parse failed for %s, trying Selenium", task["url"])
+        logger.debug("Parse failed for %s, needs Selenium", task["url"])
     else:
-        logger.debug("curl failed for %s, trying Selenium", task["url"])
+        logger.debug("fetch failed for %s (%s: %s), needs Selenium", task["url"], failure,
+                     fetched.error or f"HTTP {fetched.status}")
+    return needs_browser
+
+
+def _browser_batch(tasks: list[dict]) -> list[dict]:
+    """
+    NEEDS_BROWSER pages fetched together with fetch() inside Chrome
+    (core.browser.BrowserFetcher: the browser's TLS fingerprint and
+    cookies, no rendering) and read like HTTP pages.  Pages that still
+    fail are loaded in full (_browser_fallback).  Selenium lane only.
+    """
+    results = {}
+    bucket = throttle.get_controller().bucket
+    batch = []
+    for task in tasks:
+        if _time_left(task) < MIN_SELENIUM_TIME or not bucket.acquire(timeout=_time_left(task)):
+            results[task["url"]] = {**_failed(task), "status": "TIMEOUT"}
+        else:
+            batch.append(task)
+
+    timeout = max(1, min(PAGE_LOAD_TIMEOUT, math.ceil(min((_time_left(t) for t in batch), default=1))))
+    fetched = _driver_pool.fetcher().fetch_many([t["url"] for t in batch], timeout=timeout)
+    for task in batch:
+        page = fetched[task["url"]]
+        failure = _fetch_failure(page)
+        if failure == NOT_FOUND:
+            results[task["url"]] = {**_failed(task), "status": "NOT_YET_LIVE"}
+            continue
+        if failure is None:
+            try:
+                parsed = get_parse_pool().run(parse_roundwise, page.body, PARSER,
+                                              task.get("known_round", 0),
+                                              timeout=max(1.0, _time_left(task)))
+            except TimeoutError:
+                logger.warning("Parse of %s did not finish before the task deadline", task["url"])
+                results[task["url"]] = {**_failed(task), "status": "TIMEOUT"}
+                continue
+            result = _parse_page(parsed, task)
+            if result["status"] != "ERROR":
+                results[task["url"]] = result
+                continue
+        logger.debug("In-browser fetch of %s failed (%s), loading it", task["url"],
+                     failure or "parse error")
+        results[task["url"]] = _browser_fallback(task)
+    return [results[task["url"]] for task in tasks]
 
-    # --- Fallback: Selenium ---
-    if HAS_SELENIUM:
-        result = _parse_page_selenium(task)
-        time.sleep(random.uniform(MIN_JITTER, MAX_JITTER))
-        return result
 
-    return not_yet_live
+def _browser_fallback(task: dict) -> dict:
+    """Load a NEEDS_BROWSER page in Chrome (Selenium lane only)."""
+    if _time_left(task) < MIN_SELENIUM_TIME:
+        logger.warning("Task deadline reached for %s, skipping Selenium", task["url"])
+        return {**_failed(task), "status": "TIMEOUT"}
+    # Browser page loads count against the shared rate, but their
+    # latency says more about Chrome than about ECI: no AIMD feedback
+    if not throttle.get_controller().bucket.acquire(timeout=_time_left(task)):
+        return {**_failed(task), "status": "TIMEOUT"}
+    return _parse_page_selenium(task)
 
 
 # ---------------------------------------------------------------------------
 # Worker and cycle orchestration
 # ---------------------------------------------------------------------------
 
-def _worker_run(tasks: list[dict], scraped_at: str) -> list[dict]:
-    """Each thread runs this with its assigned slice of tasks."""
+def _time_left(task: dict) -> float:
+    """Seconds before the task's deadline (set when a worker picks it up)."""
+    deadline = task.get("deadline")
+    return PAGE_LOAD_TIMEOUT if deadline is None else deadline - time.monotonic()
+
+
+def _failed(task: dict, scraped_at: str | None = None) -> dict:
+    """An ERROR result for ``task``."""
+    return {
+        "state_code": task["state_code"],
+        "state_name": task["state_name"],
+        "ac_no": task["ac_no"],
+        "url": task["url"],
+        "scraped_at": scraped_at,
+        "status": "ERROR",
+        "ac_name": None,
+        "current_round": 0,
+        "total_rounds": 0,
+        "candidates": [],
+    }
+
+
+def _known_round(rounds: set[int]) -> int:
+    """The highest round K with every round 1..K in ``rounds`` (0 if round 1 is missing)."""
+    known = 0
+    while known + 1 in rounds:
+        known += 1
+    return known
+
+
+def _worker_run(task_queue: SimpleQueue, scraped_at: str,
+                stop_at: float | None = None,
+                fallback_queue: SimpleQueue | None = None) -> tuple[list[dict], dict]:
+    """
+    Each thread pulls tasks from the shared queue until it is empty, so a
+    worker stuck on a slow page does not hold back tasks the other workers
+    could take.  Tasks that need Chrome are put on ``fallback_queue`` for
+    the Selenium lane.  No new task is taken after ``stop_at`` (monotonic)
+    or once a stop signal has arrived.
+
+    Returns (results, stats) where stats has tasks (every task taken, the
+    ones handed to the Selenium lane too), handed_off, busy_s and wall_s.
+    """
     results = []
-    for task in tasks:
+    handed_off = 0
+    started = time.monotonic()
+    busy = 0.0
+    while True:
+        if _stop.is_set() or (stop_at is not None and time.monotonic() >= stop_at):
+            break
+        try:
+            task = task_queue.get_nowait()
+        except Empty:
+            break
+        task_start = time.monotonic()
+        task["deadline"] = task_start + TASK_TIMEOUT
         try:
             result = scrape_constituency(task)
-            result["scraped_at"] = scraped_at
-            results.append(result)
+            if result["status"] == "NEEDS_BROWSER" and fallback_queue is not None:
+                fallback_queue.put(task)
+                handed_off += 1
+            else:
+                result["scraped_at"] = scraped_at
+                results.append(result)
         except Exception as e:
             logger.error("Worker error on %s: %s", task["url"], e)
-            results.append(
-                {
-                    "state_code": task["state_code"],
-                    "state_name": task["state_name"],
-                    "ac_no": task["ac_no"],
-                    "url": task["url"],
-                    "scraped_at": scraped_at,
-                    "status": "ERROR",
-                    "ac_name": None,
-                    "current_round": 0,
-                    "total_rounds": 0,
-                    "candidates": [],
-                }
-            )
-    return results
-
-
-def fetch_won_lists() -> dict[str, list[int]]:
+            results.append(_failed(task, scraped_at))
+        elapsed = time.monotonic() - task_start
+        busy += elapsed
+        if elapsed > TASK_TIMEOUT:
+            logger.warning("Task %s took %.1fs (deadline %ds)", task["url"], elapsed, TASK_TIMEOUT)
+    stats = {"tasks": len(results) + handed_off, "handed_off": handed_off,
+             "busy_s": busy, "wall_s": time.monotonic() - started}
+    return results, stats
+
+
+def _fallback_run(fallback_queue: SimpleQueue, scraped_at: str, http_done: threading.Event,
+                  budget: threading.Semaphore,
+                  stop_at: float | None = None) -> tuple[list[dict], dict]:
     """
-    Scrape ECI's partywise result pages to get won constituency numbers.
-    Uses subprocess curl (Akamai blocks requests session on these pages).
-    Returns {state_code: [ac_no, ac_no, ...]} for all won seats.
+    One Selenium lane: takes NEEDS_BROWSER tasks, up to FETCH_BATCH at a
+    time, into Chrome (_browser_batch) until the HTTP workers are done and
+    the queue is empty.  Each page takes one unit of the cycle's
+    ``budget``; once it is spent, the remaining tasks stay queued
+    (deferred to the next cycle).
     """
-    won_by_state: dict[str, list[int]] = {}
+    results = []
+    started = time.monotonic()
+    busy = 0.0
+    while not _stop.is_set() and (stop_at is None or time.monotonic() < stop_at):
+        try:
+            task = fallback_queue.get(timeout=0.2)
+        except Empty:
+            if http_done.is_set() and fallback_queue.empty():
+                break
+            continue
+        if not budget.acquire(blocking=False):
+            fallback_queue.put(task)
+            break
+        tasks = [task]
+        while len(tasks) < FETCH_BATCH:
+            try:
+                task = fallback_queue.get_nowait()
+            except Empty:
+                break
+            if not budget.acquire(blocking=False):
+                fallback_queue.put(task)
+                break
+            tasks.append(task)
+        task_start = time.monotonic()
+        for task in tasks:
+            task["deadline"] = task_start + TASK_TIMEOUT
+        try:
+            batch_results = _browser_batch(tasks)
+        except Exception as e:
+            logger.error("Selenium lane error on %d pages (%s...): %s", len(tasks), tasks[0]["url"], e)
+            batch_results = [_failed(task) for task in tasks]
+        for result in batch_results:
+            result["scraped_at"] = scraped_at
+            results.append(result)
+        busy += time.monotonic() - task_start
+    stats = {"tasks": len(results), "busy_s": busy, "wall_s": time.monotonic() - started}
+    return results, stats
 
-    for state in TRACKED_STATES:
-        state_code = state["code"]
 
-        # Fetch partywise result page via curl
-        party_url = f"https://results.eci.gov.in/ResultAcGenMay2026/partywiseresult-{state_code}.htm"
+_AC_NO_SUFFIX_RE = re.compile(r"\((\d+)\)\s*$")
+
+
+def _partywise_wins(html: bytes) -> dict[str, tuple[int, str]]:
+    """{party: (seats won, partywisewinresult href)} from a partywise page."""
+    soup = BeautifulSoup(html, "html.parser")
+    wins: dict[str, tuple[int, str]] = {}
+    for link in soup.find_all("a", href=True):
+        href = link["href"]
+        if "partywisewinresult" not in href:
+            continue
         try:
-            result = subprocess.run(
-                ["curl", "-s", "-H", "Accept: text/html", "-H", "Referer: https://results.eci.gov.in/ResultAcGenMay2026/index.htm", party_url],
-                capture_output=True, text=True, timeout=15,
-            )
-            if result.returncode != 0:
-                continue
-            soup = BeautifulSoup(result.stdout, "html.parser")
-        except Exception:
+            won_count = int(link.get_text(strip=True))
+        except ValueError:
             continue
+        parent_tr = link.find_parent("tr")
+        tds = parent_tr.find_all("td") if parent_tr else []
+        if tds:
+            party_text = tds[0].get_text(strip=True)
+            party_name = party_text.split(" - ")[0].strip() if " - " in party_text else party_text
+            wins[_normalize_party(party_name)] = (won_count, href)
+    return wins
 
-        # Extract won counts from link text
-        won_by_party: dict[str, int] = {}
-        for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if "partywisewinresult" not in href:
-                continue
-            try:
-                won_count = int(link.get_text(strip=True))
-            except ValueError:
-                continue
-            parent_tr = link.find_parent("tr")
-            if parent_tr:
-                tds = parent_tr.find_all("td")
-                if tds:
-                    party_text = tds[0].get_text(strip=True)
-                    party_name = party_text.split(" - ")[0].strip() if " - " in party_text else party_text
-                    canonical = _normalize_party(party_name)
-                    won_by_party[canonical] = won_count
-
-        if not won_by_party:
-            continue
 
-        # Match won counts to specific ACs by vote rank from DB
-        from db_utils import _connect, _cursor
-        conn = _connect()
-        cur = _cursor(conn)
-        try:
-            cur.execute(
-                """
-                SELECT r.party_abv, r.ac_no, r.votes
-                FROM rounds_ac r
-                INNER JOIN (
-                    SELECT state_code, ac_no, MAX(round_no) as latest
-                    FROM rounds_ac WHERE state_code=%s
-                    GROUP BY state_code, ac_no
-                ) latest ON r.state_code=latest.state_code AND r.ac_no=latest.ac_no AND r.round_no=latest.latest
-                WHERE r.state_code=%s AND r.votes = (
-                    SELECT MAX(r2.votes) FROM rounds_ac r2
-                    WHERE r2.state_code=r.state_code AND r2.ac_no=r.ac_no AND r2.round_no=r.round_no
-                )
-                """,
-                (state_code, state_code),
-            )
-            rows = cur.fetchall()
-        finally:
-            conn.close()
-
-        party_acs: dict[str, list[tuple[int, int]]] = {}
-        for row in rows:
-            party = _normalize_party(row["party_abv"])
-            if party not in party_acs:
-                party_acs[party] = []
-            party_acs[party].append((row["ac_no"], row["votes"]))
-
-        all_won_acs = []
-        for party, won_count in won_by_party.items():
-            if party in party_acs:
-                sorted_acs = sorted(party_acs[party], key=lambda x: -x[1])
-                all_won_acs.extend([ac_no for ac_no, _ in sorted_acs[:won_count]])
-
-        if all_won_acs:
-            won_by_state[state_code] = list(set(all_won_acs))
-            logger.info(
-                "ECI won list for %s: %d constituencies",
-                state["name"], len(all_won_acs),
-            )
+def _won_ac_numbers(html: bytes, state_code: str) -> list[int]:
+    """AC numbers listed on a partywisewinresult page.
 
+    Taken from the constituency link (``...S2212.htm``) or, failing that, a
+    trailing ``(12)`` in the constituency cell.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    link_re = re.compile(rf"{re.escape(state_code)}(\d+)\.htm$")
+    ac_nos = []
+    for tr in soup.select("tbody tr") or soup.find_all("tr"):
+        ac_no = None
+        for link in tr.find_all("a", href=True):
+            m = link_re.search(link["href"])
+            if m:
+                ac_no = int(m.group(1))
+                break
+        if ac_no is None:
+            for td in tr.find_all("td"):
+                m = _AC_NO_SUFFIX_RE.search(td.get_text(strip=True))
+                if m:
+                    ac_no = int(m.group(1))
+                    break
+        if ac_no is not None:
+            ac_nos.append(ac_no)
+    return ac_nos
+
+
+def _won_acs_from_leaders(won_counts: dict[str, dict[str, int]]) -> dict[str, list[int]]:
+    """
+    Fallback when the win pages cannot be read: give each party its
+    ``won`` count of the ACs it leads, by votes, from one set-based query
+    over every state.
+    """
+    leads: dict[tuple[str, str], list[tuple[int, int]]] = {}
+    for row in get_latest_leaders(list(won_counts)):
+        key = (row["state_code"], _normalize_party(row["party_abv"]))
+        leads.setdefault(key, []).append((row["ac_no"], row["votes"]))
+    won_by_state = {}
+    for state_code, by_party in won_counts.items():
+        acs = set()
+        for party, won_count in by_party.items():
+            ranked = sorted(leads.get((state_code, party), []), key=lambda x: -x[1])
+            acs.update(ac_no for ac_no, _ in ranked[:won_count])
+        if acs:
+            won_by_state[state_code] = sorted(acs)
     return won_by_state
 
 
-def run_cycle() -> None:
+def fetch_won_lists(fetcher=None) -> tuple[dict[str, list[int]], list]:
+    """
+    ECI's declared winners for every tracked state whose partywise page
+    changed since it was last processed.
+
+    All partywise pages are fetched at once through the shared fetcher
+    (Akamai blocks requests sessions on these pages), then every changed
+    state's partywisewinresult pages (one per party with wins), which list
+    the exact ACs won.  States whose win pages cannot all be read fall back
+    to the vote leaders in rounds_ac.
+
+    Returns ({state_code: [ac_no, ...]}, partywise responses to store in the
+    validator cache once the won lists are in the DB).
+    """
+    fetcher = fetcher or get_fetcher()
+    headers = {
+        "Accept": "text/html",
+        "Referer": eci_url(ELECTION_ID, "index.htm"),
+    }
+    states = {build_partywise_url(ELECTION_ID, s["code"]): s for s in TRACKED_STATES}
+    party_pages = fetcher.fetch_many(list(states), headers=headers,
+                                     timeout=PAGE_LOAD_TIMEOUT, cache=_validators)
+
+    wins_by_state: dict[str, dict[str, tuple[int, str]]] = {}
+    to_store = {}
+    for url, fetched in party_pages.items():
+        state_code = states[url]["code"]
+        if fetched.unchanged:
+            continue
+        if not fetched.ok or fetched.status != 200:
+            logger.warning("Partywise page for %s: %s", state_code,
+                           fetched.error or f"HTTP {fetched.status}")
+            continue
+        wins = _partywise_wins(fetched.body)
+        if wins:
+            wins_by_state[state_code] = wins
+            to_store[state_code] = fetched
+    skipped = sum(1 for fetched in party_pages.values() if fetched.unchanged)
+    if not wins_by_state:
+        if skipped:
+            logger.info("Won lists: %d partywise pages unchanged", skipped)
+        return {}, []
+
+    win_urls = {}
+    for url, state in states.items():
+        for party, (won_count, href) in wins_by_state.get(state["code"], {}).items():
+            if won_count:
+                win_urls[urljoin(url, href)] = (state["code"], party, won_count)
+    win_pages = fetcher.fetch_many(list(win_urls), headers=headers, timeout=PAGE_LOAD_TIMEOUT)
+
+    won_by_state: dict[str, set[int]] = {code: set() for code in wins_by_state}
+    fallback: dict[str, dict[str, int]] = {}
+    for url, (state_code, party, won_count) in win_urls.items():
+        fetched = win_pages[url]
+        ac_nos = []
+        if fetched.ok and fetched.status == 200:
+            ac_nos = _won_ac_numbers(fetched.body, state_code)
+        if len(ac_nos) != won_count:
+            logger.debug("Win page %s: %d ACs for %d seats", url, len(ac_nos), won_count)
+            fallback[state_code] = {p: n for p, (n, _) in wins_by_state[state_code].items()}
+        won_by_state[state_code].update(ac_nos)
+
+    if fallback:
+        logger.info("Won lists from DB leaders for %s", ", ".join(sorted(fallback)))
+        for state_code in fallback:
+            won_by_state.pop(state_code)
+        won_by_state.update(_won_acs_from_leaders(fallback))
+
+    result = {code: sorted(acs) for code, acs in won_by_state.items() if acs}
+    for state_code, won_acs in result.items():
+        logger.info("ECI won list for %s: %d constituencies", state_code, len(won_acs))
+    if skipped:
+        logger.info("Won lists: %d partywise pages unchanged", skipped)
+    return result, [to_store[code] for code in result]
+
+
+def _log_utilisation(worker_stats: dict, wall: float) -> None:
+    """Per-worker busy time as a share of the dispatch wall time."""
+    if not worker_stats or wall <= 0:
+        return
+    busy_total = sum(s["busy_s"] for s in worker_stats.values())
+    tasks_total = sum(s["tasks"] for s in worker_stats.values())
+    handed_off = sum(s["handed_off"] for s in worker_stats.values())
+    shares = [s["busy_s"] / wall for s in worker_stats.values()]
+    logger.info(
+        "Dispatch: %d tasks (%d handed to Chrome) in %.1fs on %d workers | avg page %.2fs | "
+        "utilisation avg %.0f%% min %.0f%% | ideal wall %.1fs",
+        tasks_total, handed_off, wall, len(worker_stats),
+        busy_total / max(tasks_total, 1),
+        100 * sum(shares) / len(shares), 100 * min(shares),
+        busy_total / len(worker_stats),
+    )
+    for worker_id, s in sorted(worker_stats.items()):
+        logger.info(
+            "  worker %d: %d tasks, busy %.1fs (%.0f%%)",
+            worker_id, s["tasks"], s["busy_s"], 100 * s["busy_s"] / wall,
+        )
+
+
+def run_cycle(scheduler: PollScheduler | None = None, deadline: float | None = None) -> dict:
     """
     One complete scrape cycle across all non-DONE constituencies.
     Called every 15 minutes by scheduler.sh.
+
+    With a ``scheduler`` (--adaptive), only the ACs it says are due are
+    fetched, and each result updates that AC's next due time.  With a
+    ``deadline`` (seconds), no task is started after it; the rest are
+    counted as deferred and picked up next cycle.
+
+    Returns the cycle's stats (see CYCLE_STATS_FILE).
     """
     cycle_start = datetime.now(timezone.utc)
     cycle_start_iso = cycle_start.isoformat()
     logger.info("=== Cycle started at %s ===", cycle_start_iso)
+    cycle_stats = {
+        "started_at": cycle_start_iso,
+        "duration_s": 0.0,
+        "open": 0,
+        "due": 0,
+        "deferred": 0,
+        "success": 0,
+        "unchanged": 0,
+        "same_round": 0,
+        "skipped": 0,
+        "timeout": 0,
+        "error": 0,
+        "rounds_inserted": 0,
+        "rounds_backfilled": 0,
+    }
 
     # Get work queue
     queue = get_work_queue()
     logger.info("Work queue: %d constituencies to scrape", len(queue))
+    cycle_stats["open"] = cycle_stats["due"] = len(queue)
 
     if not queue:
         logger.info("All constituencies DONE or no live pages yet.")
-        return
-
-    # Build task list with URLs
+        return cycle_stats
+
+    if scheduler is not None:
+        open_acs = len(queue)
+        queue = scheduler.select(queue)
+        cycle_stats["due"] = len(queue)
+        logger.info("Adaptive schedule: %d of %d open constituencies due", len(queue), open_acs)
+        if not queue:
+            return cycle_stats
+
+    # Build task list with URLs.  known_round (every round up to it is in
+    # rounds_ac) comes from rounds_ac itself: constituency_status.current_round
+    # can run ahead of the rounds stored, e.g. when the live client's rounds
+    # stop short
+    ingested = get_ingested_rounds()
     tasks = [
         {
             "state_code": item["state_code"],
             "state_name": item["state_name"],
             "ac_no": item["ac_no"],
             "url": build_roundwise_url(ELECTION_ID, item["state_code"], item["ac_no"]),
+            "current_round": item.get("current_round") or 0,
+            "total_rounds": item.get("total_rounds") or 0,
+            "known_round": _known_round(ingested.get((item["state_code"], item["ac_no"]), set())),
         }
         for item in queue
     ]
 
     random.shuffle(tasks)
 
-    # Split evenly across workers
-    chunks = [[] for _ in range(MAX_WORKERS)]
-    for i, task in enumerate(tasks):
-        chunks[i % MAX_WORKERS].append(task)
+    # Shared queue: idle workers keep pulling until it is empty
+    task_queue = SimpleQueue()
+    for task in tasks:
+        task_queue.put(task)
+
+    # Pages that need Chrome: queued for the Selenium lanes
+    fallback_queue = SimpleQueue()
+    http_done = threading.Event()
+    budget = threading.Semaphore(SELENIUM_BUDGET)
 
     scraped_at = datetime.now(timezone.utc).isoformat()
     all_results = []
+    worker_stats = {}
+    n_workers = min(MAX_WORKERS, len(tasks))
+    n_lanes = SELENIUM_MAX_FALLBACKS if HAS_SELENIUM else 0
+    dispatch_start = time.monotonic()
+    stop_at = None if deadline is None else dispatch_start + deadline
 
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="scraper") as executor:
+    with ThreadPoolExecutor(max_workers=n_workers + n_lanes, thread_name_prefix="scraper") as executor:
         futures = {
-            executor.submit(_worker_run, chunk, scraped_at): i
-            for i, chunk in enumerate(chunks)
-            if chunk
+            executor.submit(_worker_run, task_queue, scraped_at, stop_at, fallback_queue): i
+            for i in range(n_workers)
         }
+        lanes = [
+            executor.submit(_fallback_run, fallback_queue, scraped_at, http_done, budget, stop_at)
+            for _ in range(n_lanes)
+        ]
         for future in as_completed(futures):
             worker_id = futures[future]
             try:
-                worker_results = future.result()
+                worker_results, stats = future.result()
                 all_results.extend(worker_results)
-                logger.info("Worker %d finished: %d results", worker_id, len(worker_results))
+                worker_stats[worker_id] = stats
             except Exception as e:
                 logger.error("Worker %d failed: %s", worker_id, e)
-
-    # Write results to DB
+        http_done.set()
+        http_pages = len(all_results)
+        fallback_results = []
+        for future in lanes:
+            try:
+                fallback_results.extend(future.result()[0])
+            except Exception as e:
+                logger.error("Selenium lane failed: %s", e)
+        all_results.extend(fallback_results)
+
+    dispatch_wall = time.monotonic() - dispatch_start
+    _log_utilisation(worker_stats, dispatch_wall)
+    logger.info("Parse pool: %s", get_parse_pool().stats())
+    # Pages left in the Selenium queue: over budget if the budget is spent,
+    # otherwise the lanes stopped for the cycle deadline (or a stop signal)
+    left_for_chrome = fallback_queue.qsize()
+    budget_left = budget.acquire(blocking=False)
+    if budget_left:
+        budget.release()
+    over_budget = 0 if budget_left else left_for_chrome
+    fallback_late = left_for_chrome - over_budget
+    fallbacks = len(fallback_results) + left_for_chrome
+    fallback_rate = fallbacks / max(http_pages + fallbacks, 1)
+    breakers = breaker_stats()
+    browser_fetch = _driver_pool.fetcher().stats() if _driver_pool is not None else {}
+    logger.info(
+        "Selenium fallback: %d of %d pages (%.0f%%), %d over budget, %d not reached | "
+        "in-browser fetch: %d pages in %d batches, %d page loads | breakers: %s",
+        fallbacks, http_pages + fallbacks, 100 * fallback_rate, over_budget, fallback_late,
+        browser_fetch.get("pages", 0), browser_fetch.get("batches", 0),
+        browser_fetch.get("navigations", 0),
+        ", ".join(f"{host} {b['state']} (opened {b['opened']}x)" for host, b in breakers.items()) or "none",
+    )
+    deferred = task_queue.qsize() + left_for_chrome
+    if deferred:
+        reasons = []
+        if task_queue.qsize() or fallback_late:
+            late = task_queue.qsize() + fallback_late
+            reasons.append(f"{late} left when stopping" if _stop.is_set()
+                           else f"{late} past the {deadline}s cycle deadline")
+        if over_budget:
+            reasons.append(f"{over_budget} over the Selenium budget of {SELENIUM_BUDGET} pages")
+        logger.info("%d tasks deferred to the next cycle (%s)", deferred, ", ".join(reasons))
+
+    # Write results to DB (rounds_ac inserts are ON CONFLICT DO NOTHING, so
+    # the snapshot taken above is good enough to pick the missing rounds)
     pages_success = 0
+    rounds_inserted = 0
+    rounds_backfilled = 0
     pages_skipped = 0
+    pages_unchanged = 0
+    pages_same_round = 0
+    pages_timeout = 0
     pages_error = 0
 
     for r in all_results:
         if r["status"] in ("LIVE", "DONE") and r["candidates"]:
-            insert_round_snapshot(
-                state_code=r["state_code"],
-                state_name=r["state_name"],
-                ac_no=r["ac_no"],
-                ac_name=r["ac_name"],
-                round_no=r["current_round"],
-                total_rounds=r["total_rounds"],
-                candidates=r["candidates"],
-                scraped_at=r["scraped_at"],
-            )
+            # Insert only the rounds rounds_ac doesn't hold yet for this AC
+            have = ingested.get((r["state_code"], r["ac_no"]), set())
+            rounds = r.get("rounds") or [
+                {"round": r["current_round"], "candidates": r["candidates"]}
+            ]
+            missing = [rd for rd in rounds if rd["round"] not in have]
+            if missing:
+                insert_round_snapshots(
+                    state_code=r["state_code"],
+                    ac_no=r["ac_no"],
+                    ac_name=r["ac_name"],
+                    rounds=missing,
+                )
+                rounds_inserted += len(missing)
+                rounds_backfilled += sum(1 for rd in missing if rd["round"] != r["current_round"])
             upsert_constituency_status(
                 state_code=r["state_code"],
                 ac_no=r["ac_no"],
@@ -651,6 +1082,14 @@ def run_cycle() -> None:
         elif r["status"] == "NOT_YET_LIVE":
             pages_skipped += 1
 
+        elif r["status"] == "UNCHANGED":
+            pages_unchanged += 1
+            pages_same_round += r.get("same_round", False)
+
+        elif r["status"] == "TIMEOUT":
+            # Not an ECI error: left as is and retried next cycle
+            pages_timeout += 1
+
         elif r["status"] == "ERROR":
             upsert_constituency_status(
                 state_code=r["state_code"],
@@ -663,30 +1102,297 @@ def run_cycle() -> None:
             )
             pages_error += 1
 
+    # Only now that the results are in the DB may unchanged pages be skipped
+    _validators.save()
+
+    if scheduler is not None:
+        for r in all_results:
+            scheduler.observe(
+                r["state_code"], r["ac_no"], r["status"],
+                current_round=r["current_round"], total_rounds=r["total_rounds"],
+                margin=margin_ratio(r["candidates"]) if r["candidates"] else None,
+            )
+        scheduler.save()
+        logger.info("Adaptive schedule: %s", scheduler.stats())
+
     cycle_end = datetime.now(timezone.utc)
     cycle_end_iso = cycle_end.isoformat()
     duration = (cycle_end - cycle_start).total_seconds()
 
 
     logger.info(
-        "=== Cycle done in %.1fs | success=%d skipped=%d error=%d ===",
-        duration, pages_success, pages_skipped, pages_error,
+        "=== Cycle done in %.1fs | success=%d unchanged=%d (%d same round, not parsed) "
+        "skipped=%d timeout=%d error=%d ===",
+        duration, pages_success, pages_unchanged, pages_same_round, pages_skipped, pages_timeout,
+        pages_error,
     )
+    logger.info(
+        "Rounds inserted: %d (%d back-filled from earlier tabs)",
+        rounds_inserted, rounds_backfilled,
+    )
+    controller = throttle.get_controller().stats()
+    logger.info("Rate controller: %s", controller)
+    logger.info("Session handoff: %s", get_session_broker().stats())
+    if _archive is not None:
+        logger.info("Archive: %s", _archive.stats())
+    if _driver_pool is not None:
+        pool_stats = _driver_pool.stats()
+        if pool_stats["checkouts"]:
+            logger.info(
+                "Selenium pool: %d started, %d checkouts, wait avg %.2fs max %.2fs, recycled %s",
+                pool_stats["created"], pool_stats["checkouts"], pool_stats["wait_avg_s"],
+                pool_stats["wait_max_s"], pool_stats["recycled"],
+            )
 
     # Fetch ECI's official won lists and update DB
     try:
-        won_lists = fetch_won_lists()
+        won_lists, party_pages = fetch_won_lists()
         for state_code, won_acs in won_lists.items():
             update_won_status(state_code, won_acs)
+        for fetched in party_pages:
+            _validators.store(fetched)
+        _validators.save()
         logger.info("Updated won status for %d states", len(won_lists))
     except Exception as e:
         logger.warning("Failed to fetch won lists: %s", e)
 
+    cycle_stats.update({
+        "duration_s": round((datetime.now(timezone.utc) - cycle_start).total_seconds(), 1),
+        "dispatch_s": round(dispatch_wall, 1),
+        "workers": n_workers,
+        "deferred": deferred,
+        "success": pages_success,
+        "unchanged": pages_unchanged,
+        "same_round": pages_same_round,
+        "skipped": pages_skipped,
+        "timeout": pages_timeout,
+        "error": pages_error,
+        "rounds_inserted": rounds_inserted,
+        "rounds_backfilled": rounds_backfilled,
+        "rate": controller["rate"],
+        "concurrency": controller["concurrency"],
+        "fallbacks": fallbacks,
+        "over_budget": over_budget,
+        "fallback_late": fallback_late,
+        "fallback_rate": round(fallback_rate, 3),
+        "breakers": {host: b["state"] for host, b in breakers.items()},
+    })
+    return cycle_stats
+
+
+# ---------------------------------------------------------------------------
+# Daemon mode
+# ---------------------------------------------------------------------------
+
+def _acquire_lock(path: str = LOCK_FILE):
+    """
+    Take the run lock, or return None if another run holds it.  The lock is
+    released when the process exits, however it exits.
+    """
+    if not HAS_FCNTL:
+        return True
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    lock = open(path, "a+")
+    try:
+        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock.close()
+        return None
+    lock.seek(0)
+    lock.truncate()
+    lock.write(f"{os.getpid()}\n")
+    lock.flush()
+    return lock
+
+
+def _handle_signal(signum, frame) -> None:
+    """First signal: finish the tasks in hand and stop.  Second: exit now."""
+    logger.info("Received %s — stopping after the tasks in progress",
+                signal.Signals(signum).name)
+    _stop.set()
+    signal.signal(signum, signal.SIG_DFL)
+
+
+def _write_cycle_stats(stats: dict, path: str = CYCLE_STATS_FILE) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(stats) + "\n")
+
+
+def run_daemon(adaptive: bool = False, interval: float = DAEMON_INTERVAL,
+               deadline: float = CYCLE_DEADLINE) -> None:
+    """
+    Run cycles in this process until every constituency is DONE or a stop
+    signal arrives, keeping config, caches, connections and Chrome warm.
+
+    A cycle starts ``interval`` seconds after the previous one started (at
+    least MIN_CYCLE_GAP after it ended).  With ``adaptive``, each AC is
+    polled when core.schedule says its next round is due instead.
+    """
+    scheduler = None
+    if adaptive:
+        scheduler = PollScheduler(SCHEDULE_FILE)
+        scheduler.load()
+        logger.info("Adaptive polling: %d ACs with a saved schedule", len(scheduler))
+    cycles = 0
+    while not _stop.is_set():
+        started = time.monotonic()
+        stats = run_cycle(scheduler, deadline=deadline)
+        cycles += 1
+        _write_cycle_stats({"cycle": cycles, **stats})
+        if _stop.is_set():
+            break
+        queue = get_work_queue()
+        if not queue:
+            logger.info("No open constituencies left — stopping.")
+            break
+        if stats["deferred"]:
+            wait = MIN_CYCLE_GAP
+        elif scheduler is not None:
+            wait = scheduler.seconds_until_due({ac_key(q["state_code"], q["ac_no"]) for q in queue})
+            wait = scheduler.min_interval if wait is None else max(wait, 1.0)
+        else:
+            wait = max(MIN_CYCLE_GAP, interval - (time.monotonic() - started))
+        logger.info("Next cycle in %.0fs", wait)
+        _stop.wait(wait)
+    logger.info("Daemon stopped after %d cycles", cycles)
+
+
+# ---------------------------------------------------------------------------
+# Archive replay
+# ---------------------------------------------------------------------------
+
+_ROUNDWISE_URL_RE = re.compile(r"Roundwise([A-Z]\d{2})(\d+)\.htm")
+
+
+def _replay_parse(job: tuple[str, str, str, str]) -> dict | None:
+    """Parse one archived Roundwise page (runs in a worker process)."""
+    root, url, digest, engine = job
+    m = _ROUNDWISE_URL_RE.search(url)
+    task = {"state_code": m.group(1), "state_name": None, "ac_no": int(m.group(2)), "url": url}
+    body = PageArchive(root).get(digest)
+    result = _parse_page(body, task, engine)
+    if result["status"] == "ERROR" and engine != "bs4":
+        result = _parse_page_bs4(body, task)
+    if result["status"] not in ("LIVE", "DONE") or not result["candidates"]:
+        return None
+    return {k: result[k] for k in ("state_code", "ac_no", "ac_name", "rounds")}
+
+
+def run_replay(root: str = ARCHIVE_DIR, workers: int | None = None) -> dict:
+    """
+    Re-parse every archived Roundwise page on all cores and rebuild the
+    rounds_ac rows they cover.  Each distinct page is parsed once; for each
+    AC and round, the most recently fetched page holding that round wins.
+    """
+    started = time.monotonic()
+    archive = PageArchive(root)
+    last_seen: dict[tuple[str, str], str] = {}  # (url, hash) -> fetched_at
+    for entry in archive.entries():
+        if entry.get("status", 200) == 200 and _ROUNDWISE_URL_RE.search(entry["url"]):
+            last_seen[(entry["url"], entry["hash"])] = entry["fetched_at"]
+    jobs = [(root, url, digest, PARSER) for url, digest in sorted(last_seen, key=last_seen.get)]
+    logger.info("Replay: %d distinct Roundwise pages in %s", len(jobs), root)
+
+    by_ac: dict[tuple[str, int], dict] = {}
+    parsed_pages = 0
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for parsed in pool.map(_replay_parse, jobs, chunksize=16):
+            if parsed is None:
+                continue
+            parsed_pages += 1
+            ac = by_ac.setdefault((parsed["state_code"], parsed["ac_no"]),
+                                  {"ac_name": None, "rounds": {}})
+            ac["ac_name"] = parsed["ac_name"] or ac["ac_name"]
+            for rd in parsed["rounds"]:
+                ac["rounds"][rd["round"]] = rd["candidates"]
+    parse_s = time.monotonic() - started
+
+    rounds = 0
+    for (state_code, ac_no), ac in sorted(by_ac.items()):
+        insert_round_snapshots(
+            state_code=state_code,
+            ac_no=ac_no,
+            ac_name=ac["ac_name"],
+            rounds=[{"round": n, "candidates": c} for n, c in sorted(ac["rounds"].items())],
+            replace=True,
+        )
+        rounds += len(ac["rounds"])
+    stats = {
+        "pages": len(jobs),
+        "parsed": parsed_pages,
+        "acs": len(by_ac),
+        "rounds": rounds,
+        "parse_s": round(parse_s, 1),
+        "total_s": round(time.monotonic() - started, 1),
+    }
+    logger.info(
+        "Replay done: %d pages (%d with results) parsed in %.1fs (%.0f pages/s), "
+        "%d rounds rebuilt for %d ACs",
+        stats["pages"], stats["parsed"], parse_s, len(jobs) / max(parse_s, 1e-9),
+        rounds, len(by_ac),
+    )
+    return stats
+
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ECI live round-wise scraper")
+    parser.add_argument("--parser", choices=ENGINES, default=PARSER,
+                        help="Roundwise parser (default: fast; BS4 is always the fallback)")
+    parser.add_argument("--parse-executor", choices=EXECUTORS, default=PARSE_EXECUTOR,
+                        help="Where pages are parsed: auto (default), thread, process "
+                             "or interpreter (see core/parse_pool.py)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Keep running, polling each AC when its next round is due "
+                             "(instead of one cycle over every open AC)")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep running cycles until every AC is DONE (or SIGTERM)")
+    parser.add_argument("--interval", type=float, default=DAEMON_INTERVAL,
+                        help="--daemon: seconds between cycle starts (default: back to back)")
+    parser.add_argument("--deadline", type=float, default=CYCLE_DEADLINE,
+                        help="--daemon: seconds per cycle for starting tasks")
+    parser.add_argument("--archive", action="store_true", default=ARCHIVE,
+                        help=f"Keep every fetched Roundwise page in the archive ({ARCHIVE_DIR})")
+    parser.add_argument("--replay", nargs="?", const=ARCHIVE_DIR, metavar="DIR",
+                        help="Re-parse an archive (default: the --archive one) and rebuild "
+                             "rounds_ac from it, then exit")
+    parser.add_argument("--base-url", default=None,
+                        help="Fetch ECI pages from here, e.g. a core.standin rehearsal server "
+                             "(default: ECI_BASE_URL or https://results.eci.gov.in)")
+    args = parser.parse_args()
+    PARSER = args.parser
+    get_parse_pool(args.parse_executor)
+    if args.base_url:
+        set_base_url(args.base_url)
+
+    lock = _acquire_lock()
+    if lock is None:
+        logger.warning("Another eci-live-scraper run holds %s — exiting.", LOCK_FILE)
+        sys.exit(1)
+    signal.signal(signal.SIGTERM, _handle_signal)
+    signal.signal(signal.SIGINT, _handle_signal)
+
     init_db()
-    run_cycle()
+    if args.replay:
+        run_replay(args.replay)
+        sys.exit(0)
+    if args.archive:
+        _archive = PageArchive(ARCHIVE_DIR)
+    try:
+        if args.daemon or args.adaptive:
+            run_daemon(adaptive=args.adaptive, interval=args.interval, deadline=args.deadline)
+        else:
+            _write_cycle_stats(run_cycle())
+    finally:
+        if _archive is not None:
+            _archive.close()
+        close_fetcher()
+        close_parse_pool()
+        if _driver_pool is not None:
+            _driver_pool.close()
@@ -5,23 +5,43 @@ This module provides the FastAPI server for ECI results scraping
 and the live election dashboard API.
 """
 
+import asyncio
+import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
 from db_utils import _connect, _cursor, IS_PG
 
+# Chrome drivers to start in the background when the server comes up, so the
+# first scrape that needs the Chrome fallback does not wait ~5s for one
+CHROME_POOL_WARM = int(os.environ.get("CHROME_POOL_WARM", "1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from core.browser import close_driver_pool, get_driver_pool
+
+    if CHROME_POOL_WARM:
+        get_driver_pool().warm(CHROME_POOL_WARM)
+    yield
+    close_driver_pool()
+
+
 app = FastAPI(
     title="ECI Results Scraper API",
     description="API for scraping Election Commission of India election results",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -77,6 +97,25 @@ class ScrapeAcRoundsRequest(BaseModel):
     url: str
     ac_no: int
     start_round: int = 1
+    engine: str = "http"  # "http" (Chrome only as fallback) or "chrome"
+    postal: bool = True   # False: postal votes only once counting is complete
+
+
+class AcStart(BaseModel):
+    ac_no: int
+    start_round: int = 1
+
+
+class ScrapeAcRoundsBatchRequest(BaseModel):
+    url: str
+    acs: list[AcStart]
+    engine: str = "http"
+    postal: bool = True
+
+
+class ScrapeAcRangeRequest(BaseModel):
+    url: str
+    engine: str = "http"
 
 
 class ScrapeAllRoundsRequest(BaseModel):
@@ -84,6 +123,7 @@ class ScrapeAllRoundsRequest(BaseModel):
     start_ac: int = 1
     end_ac: int = 0
     respect: bool = False
+    engine: str = "http"
 
 
 # ---------------------------------------------------------------------------
@@ -556,7 +596,7 @@ def constituency_rounds(state_code: str, ac_no: int):
 @app.post("/scrape")
 async def scrape_endpoint(request: ScrapeRequest):
     """Scrape constituency results from ECI party-wise URL."""
-    from core.browser import create_chrome_driver
+    from core.browser import get_driver_pool
     from core.scraper import (
         build_constituency_url, get_state_code,
         parse_partywise_url, scrape_constituency_sync,
@@ -577,99 +617,196 @@ async def scrape_endpoint(request: ScrapeRequest):
     )
 
     if results["constituencywise_results"]:
-        driver = create_chrome_driver()
         try:
-            url = build_constituency_url(election_identifier, state_code, 1)
-            driver.get(url)
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, 'h1'))
-            )
-            h1 = driver.find_element(By.TAG_NAME, 'h1').text
-            h2 = driver.find_element(By.TAG_NAME, 'h2').text
+            with get_driver_pool().lease() as driver:
+                url = build_constituency_url(election_identifier, state_code, 1)
+                driver.get(url)
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.TAG_NAME, 'h1'))
+                )
+                h1 = driver.find_element(By.TAG_NAME, 'h1').text
+                h2 = driver.find_element(By.TAG_NAME, 'h2').text
             state_name = h2.split('(')[-1].replace(')', '')
             results["election_year"] = h1.split('-')[-1].strip()
             results["election_type"] = ''.join(h2.split()[:1])
             results["election_state"] = get_state_code(state_name)
         except Exception:
             pass
-        finally:
-            driver.quit()
 
     return {"status": "success", "data": results}
 
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    # scrape_workers: ACs the server scrapes at once; clients size their concurrency to it
+    return {"status": "healthy", "scrape_workers": _scrape_workers("http")}
 
 
-@app.post("/scrape/ac-rounds")
-def scrape_ac_rounds_endpoint(request: ScrapeAcRoundsRequest):
-    from core.browser import create_chrome_driver
-    from core.scraper import parse_partywise_url, scrape_ac_rounds_core
+@app.get("/api/browser-pool")
+def browser_pool_stats():
+    """Chrome driver pool: drivers idle/in use, checkout wait times, recycles."""
+    from core.browser import get_driver_pool
+
+    return get_driver_pool().stats()
+
+
+def _scrape_request(url: str, engine: str) -> tuple[str, str]:
+    """(election_identifier, state_code) of a scrape request; 400 if invalid."""
+    from core.scraper import ENGINES, parse_partywise_url
 
     try:
-        election_identifier, state_code = parse_partywise_url(request.url)
+        election_identifier, state_code = parse_partywise_url(url)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
+    if engine not in ENGINES:
+        raise HTTPException(status_code=400, detail=f"engine must be one of {ENGINES}")
+    return election_identifier, state_code
+
+
+def _scrape_workers(engine: str, respect: bool = False) -> int:
+    """Threads for a multi-AC scrape: the rate controller or Chrome pool sets the real pace."""
+    from core import throttle
+    from core.browser import get_driver_pool
+
+    if respect:
+        return 1
+    return throttle.MAX_CONCURRENCY if engine == "http" else get_driver_pool().size
+
+
+def _ac_rounds(election_identifier: str, state_code: str, ac_no: int, start_round: int,
+               engine: str, postal: bool) -> dict:
+    """The /scrape/ac-rounds response for one AC."""
+    from core.scraper import scrape_ac_rounds
 
-    driver = create_chrome_driver()
     try:
-        result = scrape_ac_rounds_core(
-            driver, election_identifier, state_code,
-            request.ac_no, request.start_round
+        result = scrape_ac_rounds(
+            election_identifier, state_code, ac_no, start_round,
+            engine=engine, postal=postal,
         )
         if result.get("status") == "done":
             return {"status": "error", "error": "AC not found (404)"}
         return result
     except Exception as e:
         return {"status": "error", "error": str(e)}
-    finally:
-        driver.quit()
+
+
+@app.post("/scrape/ac-rounds")
+def scrape_ac_rounds_endpoint(request: ScrapeAcRoundsRequest):
+    election_identifier, state_code = _scrape_request(request.url, request.engine)
+    return _ac_rounds(election_identifier, state_code, request.ac_no, request.start_round,
+                      request.engine, request.postal)
+
+
+@app.post("/scrape/ac-rounds/batch")
+async def scrape_ac_rounds_batch_endpoint(request: ScrapeAcRoundsBatchRequest):
+    """
+    /scrape/ac-rounds for many ACs in one request, streamed as NDJSON.
+
+    One line per AC as soon as it is scraped (completion order): the
+    /scrape/ac-rounds response plus "ac_no".  The last line is
+    {"status": "complete", "acs": n, "seconds": s}.  ACs share the
+    server's fetcher, rate controller and Chrome pool with every other
+    request; if the client disconnects, ACs not yet started are dropped.
+    """
+    election_identifier, state_code = _scrape_request(request.url, request.engine)
+    acs = {}
+    for ac in request.acs:
+        acs.setdefault(ac.ac_no, ac.start_round)
+
+    def scrape(ac_no, start_round):
+        result = _ac_rounds(election_identifier, state_code, ac_no, start_round,
+                            request.engine, request.postal)
+        return {"ac_no": ac_no, **result}
+
+    async def stream():
+        started = time.monotonic()
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=max(1, min(len(acs), _scrape_workers(request.engine))))
+        try:
+            futures = [loop.run_in_executor(executor, scrape, ac_no, start_round)
+                       for ac_no, start_round in acs.items()]
+            for next_done in asyncio.as_completed(futures):
+                yield json.dumps(await next_done) + "\n"
+            yield json.dumps({"status": "complete", "acs": len(acs),
+                              "seconds": round(time.monotonic() - started, 2)}) + "\n"
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+def _ac_range(election_identifier: str, state_code: str, engine: str) -> list[int]:
+    """AC numbers of a state from states.assembly_seats, confirmed on Roundwise pages."""
+    from core.fetch import get_fetcher
+    from core.scraper import ac_numbers, build_roundwise_url
+    from db_utils import get_assembly_seats
+
+    return ac_numbers(
+        election_identifier, state_code, get_assembly_seats(state_code),
+        build_url=build_roundwise_url,
+        fetcher=get_fetcher() if engine == "http" else None,
+    )
+
+
+@app.post("/scrape/ac-range")
+def scrape_ac_range_endpoint(request: ScrapeAcRangeRequest):
+    """AC numbers to scrape for a state: 1..assembly_seats, confirmed against ECI."""
+    election_identifier, state_code = _scrape_request(request.url, request.engine)
+
+    try:
+        acs = _ac_range(election_identifier, state_code, request.engine)
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+    return {"status": "success", "state_code": state_code, "ac_nos": acs}
 
 
 @app.post("/scrape/all-rounds")
 def scrape_all_rounds_endpoint(request: ScrapeAllRoundsRequest):
-    from core.browser import create_chrome_driver
-    from core.scraper import build_constituency_url, parse_partywise_url, scrape_ac_rounds_core
+    from core.scraper import scrape_ac_rounds
 
-    try:
-        election_identifier, state_code = parse_partywise_url(request.url)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    election_identifier, state_code = _scrape_request(request.url, request.engine)
 
-    driver = create_chrome_driver()
     results = []
+    missing = []
+    errors = {}
 
     try:
-        if request.end_ac == 0:
-            max_ac = 0
-            for i in range(1, 1000):
-                test_url = build_constituency_url(election_identifier, state_code, i)
-                driver.get(test_url)
-                if "404" in driver.title:
-                    break
-                max_ac = i
+        # With no end_ac, the ACs come from the state's seat count instead of
+        # walking Roundwise pages until the first 404
+        if request.end_ac:
+            acs = list(range(request.start_ac, request.end_ac + 1))
         else:
-            max_ac = request.end_ac
-
-        for ac_no in range(request.start_ac, max_ac + 1):
-            result = scrape_ac_rounds_core(
-                driver, election_identifier, state_code, ac_no, 1
-            )
-            if result.get("status") == "done":
-                break
-            if result.get("status") == "success":
-                results.append(result.get("data", {}))
+            acs = [ac_no for ac_no in _ac_range(election_identifier, state_code, request.engine)
+                   if ac_no >= request.start_ac]
+
+        workers = _scrape_workers(request.engine, request.respect)
+
+        def scrape(ac_no):
+            try:
+                result = scrape_ac_rounds(
+                    election_identifier, state_code, ac_no, 1,
+                    engine=request.engine,
+                )
+            except Exception as e:
+                result = {"status": "error", "error": str(e)}
             if request.respect and ac_no % 10 == 0:
                 time.sleep(1)
+            return ac_no, result
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for ac_no, result in executor.map(scrape, acs):
+                if result.get("status") == "done":
+                    missing.append(ac_no)   # this AC's page is a 404; carry on
+                elif result.get("status") == "success":
+                    results.append(result.get("data", {}))
+                else:
+                    errors[ac_no] = result.get("error")
 
     except Exception as e:
         return {"status": "error", "error": str(e)}
-    finally:
-        driver.quit()
 
-    return {"status": "success", "data": results, "total_acs": len(results)}
+    return {"status": "success", "data": results, "total_acs": len(results),
+            "missing_acs": missing, "errors": errors}
 
 
 # ---------------------------------------------------------------------------
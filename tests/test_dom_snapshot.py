@@ -0,0 +1,151 @@
+"""The dom_snapshot extractors must return what the per-element ones do.
+
+No Chrome is needed: ``FakeDriver`` serves a stand-in page through the
+WebDriver calls the extractors make, with BS4 as the DOM.  ``.text`` is
+rendered text (empty inside a ``display:none`` round tab until the bench's
+show-all-tabs script runs), and ``execute_script(_DOM_SNAPSHOT_JS)`` is
+answered by ``_snapshot``, a line-for-line port of that script.  The script
+itself only runs in a browser (``bench.py extract``).
+"""
+
+import re
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from bench import _SHOW_ALL_TABS_JS
+from core import scraper
+from core.parser import HAS_BS4
+from core.standin import render_constituencywise, render_roundwise, synthetic_rounds
+
+if HAS_BS4:
+    from bs4 import BeautifulSoup
+
+pytestmark = pytest.mark.skipif(not HAS_BS4, reason="needs beautifulsoup4")
+
+
+def _text(tag) -> str:
+    return tag.get_text().strip() if tag is not None else ""
+
+
+def _rows(tbody):
+    if tbody is None:
+        return None
+    return [[_text(td) for td in tr.select("td")] for tr in tbody.select("tr")]
+
+
+def _snapshot(soup) -> dict:
+    """_DOM_SNAPSHOT_JS over a BS4 tree (innerText || textContent is the text)."""
+    h2 = soup.select_one("h2")
+    span = h2.select_one("span") if h2 is not None else None
+    tabs = {}
+    for div in soup.select('div[id^="tab"]'):
+        m = re.match(r"^tab(\d+)$", div["id"])
+        if m and m[1] not in tabs:
+            tabs[m[1]] = _rows(div.select_one("tbody"))
+    return {
+        "title": soup.title.string if soup.title else "",
+        "h1": _text(soup.select_one("h1")),
+        "h2": _text(h2),
+        "h2_span": _text(span) if span is not None else None,
+        "round_status": _text(soup.select_one("div.round-status")),
+        "tabs": tabs,
+        "table": _rows(soup.select_one("tbody")),
+    }
+
+
+class FakeElement:
+    def __init__(self, driver: "FakeDriver", tag):
+        self.driver = driver
+        self.tag = tag
+
+    def find_elements(self, by: str, value: str) -> list["FakeElement"]:
+        if by == By.TAG_NAME:
+            found = self.tag.find_all(value)
+        elif by == By.CSS_SELECTOR:
+            found = self.tag.select(value)
+        elif by == By.ID:
+            found = self.tag.find_all(id=value)
+        else:  # XPath: only for page variants without tab<N> divs
+            found = []
+        return [FakeElement(self.driver, tag) for tag in found]
+
+    def find_element(self, by: str, value: str) -> "FakeElement":
+        found = self.find_elements(by, value)
+        if not found:
+            raise NoSuchElementException(f"{by}={value}")
+        return found[0]
+
+    def get_attribute(self, name: str) -> str | None:
+        return self.tag.get(name)
+
+    @property
+    def text(self) -> str:
+        if not self.driver.all_tabs_shown:
+            for tag in [self.tag, *self.tag.parents]:
+                if "display:none" in (tag.get("style") or "").replace(" ", ""):
+                    return ""
+        return " ".join(self.tag.get_text().split())
+
+
+class FakeDriver(FakeElement):
+    def __init__(self, page: str):
+        super().__init__(self, BeautifulSoup(page, "html.parser"))
+        self.all_tabs_shown = False
+
+    def execute_script(self, script: str, *args):
+        if script == scraper._DOM_SNAPSHOT_JS:
+            return _snapshot(self.tag)
+        if script == _SHOW_ALL_TABS_JS:
+            self.all_tabs_shown = True
+        return None
+
+
+def _roundwise(ac_no: int, n_rounds: int, n_candidates: int = 8) -> str:
+    rounds = synthetic_rounds(n_candidates, n_rounds, seed=ac_no)
+    return render_roundwise(ac_no, f"CONSTITUENCY {ac_no}", "Stand-in State", rounds, 30)
+
+
+PAGES = [(ac_no, n_rounds) for ac_no in (1, 7, 23) for n_rounds in (1, 5, 30)]
+
+
+@pytest.mark.parametrize("ac_no, n_rounds", PAGES)
+def test_all_rounds_match_per_element(ac_no, n_rounds):
+    driver = FakeDriver(_roundwise(ac_no, n_rounds))
+    driver.execute_script(_SHOW_ALL_TABS_JS)  # as bench.py extract does
+    fast = scraper.extract_all_roundwise_rounds(driver)
+    assert len(fast["rounds"]) == n_rounds
+    assert fast == scraper._extract_all_roundwise_rounds_elements(driver)
+
+
+@pytest.mark.parametrize("ac_no, n_rounds", PAGES)
+def test_each_round_matches_per_element(ac_no, n_rounds):
+    driver = FakeDriver(_roundwise(ac_no, n_rounds))
+    driver.execute_script(_SHOW_ALL_TABS_JS)
+    snap = scraper.dom_snapshot(driver)
+    info = None
+    for round_num in range(1, n_rounds + 1):
+        fast = scraper.extract_roundwise_results(driver, round_num, info, snap)
+        assert fast["round_tally"]
+        assert fast == scraper._extract_roundwise_results_elements(driver, round_num, info)
+        info = info or fast
+
+
+def test_snapshot_reads_hidden_round_tabs():
+    # Only the latest tab is displayed; per-element .text sees nothing in the others
+    driver = FakeDriver(_roundwise(5, 6))
+    fast = scraper.extract_all_roundwise_rounds(driver)
+    assert [r["round"] for r in fast["rounds"]] == [1, 2, 3, 4, 5, 6]
+    assert [r["round"] for r in scraper._extract_all_roundwise_rounds_elements(driver)["rounds"]] == [6]
+
+
+@pytest.mark.parametrize("ac_no", [1, 7, 23])
+def test_results_match_per_element(ac_no):
+    tally = synthetic_rounds(8, 12, seed=ac_no)[-1]
+    page = render_constituencywise(ac_no, f"CONSTITUENCY {ac_no}", "Stand-in State", tally,
+                                   postal_seed=ac_no)
+    driver = FakeDriver(page)
+    fast = scraper.extract_results(driver)
+    assert len(fast["voting_tally"]) == len(tally) + 1  # and the Total row
+    assert fast == scraper._extract_results_elements(driver)
@@ -0,0 +1,19 @@
+"""core.parser's fast scanner must read Roundwise pages exactly as BS4 does.
+
+Runs over the synthetic stand-in pages from ``bench.py parse`` (half of
+them perturbed like real markup); ``bench.py parse PATHS`` does the same
+check on recorded pages.
+"""
+
+import pytest
+
+from bench import _page_pieces, _synthetic_pages
+from core.parser import HAS_BS4, Bs4RoundwisePage, RoundwisePage
+
+PAGES = _synthetic_pages(60)
+
+
+@pytest.mark.skipif(not HAS_BS4, reason="needs beautifulsoup4")
+@pytest.mark.parametrize("name, body", PAGES, ids=[name for name, _ in PAGES])
+def test_fast_parser_matches_bs4(name, body):
+    assert _page_pieces(RoundwisePage(body)) == _page_pieces(Bs4RoundwisePage(body))
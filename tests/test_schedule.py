@@ -0,0 +1,40 @@
+"""Adaptive polling: how long an AC can wait, and when its back-off ends.
+
+``bench.py schedule`` prints requests and staleness for a simulated count;
+these tests assert the bounds behind its worst case.
+"""
+
+from core.schedule import PollScheduler
+
+
+def test_not_started_backoff_stays_below_half_the_default_gap():
+    scheduler = PollScheduler(default_gap=1200, max_interval=900)
+    now = 0.0
+    waits = []
+    for _ in range(10):
+        due = scheduler.observe("S22", 1, "NOT_YET_LIVE", now=now)
+        waits.append(due - now)
+        now = due
+    assert waits[1:4] == [240, 480, 600]
+    assert max(waits) == 600
+
+
+def test_first_round_resets_the_backoff():
+    scheduler = PollScheduler(default_gap=1200)
+    now = 0.0
+    for _ in range(5):
+        now = scheduler.observe("S22", 1, "NOT_YET_LIVE", now=now)
+    assert scheduler._acs["S22-1"]["misses"] == 4
+    scheduler.observe("S22", 1, "LIVE", current_round=1, total_rounds=20, now=now)
+    assert scheduler._acs["S22-1"]["misses"] == 0
+
+
+def test_wait_for_next_round_is_capped():
+    scheduler = PollScheduler(default_gap=1200, max_interval=900)
+    now = 0.0
+    # Rounds every 40 minutes: the AC's own estimate is far longer than the cap
+    for rnd in range(1, 5):
+        due = scheduler.observe("S22", 1, "LIVE", current_round=rnd, total_rounds=20, now=now)
+        now += 2400
+    assert scheduler.round_gap(scheduler._acs["S22-1"]) == 2400
+    assert due - (now - 2400) == 600
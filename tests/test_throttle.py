@@ -0,0 +1,90 @@
+"""AIMD back-off: the controller cuts on denials and climbs back on clean traffic.
+
+``bench.py throttle`` prints the same behaviour against the stand-in; these
+tests assert it.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench import _fetch_until_ok, _roundwise_urls
+from core import throttle
+from core.fetch import HAS_PYCURL, CurlFetcher, SubprocessFetcher
+from core.standin import StandinServer, ThrottlePolicy
+
+
+def _request(controller: throttle.AimdController, outcome: str, latency: float = 0.01) -> None:
+    assert controller.acquire(timeout=5)
+    controller.release(outcome, latency)
+
+
+def test_denied_halves_limits_once_per_cooldown():
+    controller = throttle.AimdController(rate=20, concurrency=8)
+    _request(controller, throttle.DENIED)
+    assert controller.limit == 4
+    assert controller.bucket.rate == 10
+    _request(controller, throttle.DENIED)  # inside DECREASE_COOLDOWN: no second cut
+    assert controller.limit == 4
+    assert controller.stats()["decreases"] == 1
+
+
+def test_timeouts_and_slow_responses_back_off():
+    controller = throttle.AimdController(rate=20, concurrency=10)
+    _request(controller, throttle.TIMEOUT)
+    assert controller.limit == 5
+    controller._last_decrease = 0.0  # past the cooldown
+    _request(controller, throttle.OK, latency=controller.target_latency + 1)
+    assert controller.limit == 4
+    assert controller.stats()["slow"] == 1
+
+
+def test_clean_responses_recover_after_a_cut():
+    controller = throttle.AimdController(rate=20, concurrency=8)
+    _request(controller, throttle.DENIED)
+    assert controller.limit == 4
+    for _ in range(40):
+        _request(controller, throttle.OK)
+    assert controller.limit >= 8
+    assert controller.bucket.rate > 10
+
+
+def test_acquire_gives_up_at_its_timeout():
+    controller = throttle.AimdController(rate=100, concurrency=1)
+    assert controller.acquire(timeout=1)
+    started = time.monotonic()
+    assert not controller.acquire(timeout=0.2)
+    assert time.monotonic() - started < 1
+    controller.release(throttle.OK, 0.01)
+
+
+def test_backs_off_against_a_throttling_standin():
+    # Start well above what the stand-in allows: it must answer with 403s,
+    # the controller must cut below its start, and every page still arrives
+    controller = throttle.AimdController(rate=throttle.MAX_RATE, concurrency=throttle.MAX_CONCURRENCY)
+    lowest = [controller.limit]
+    stop = threading.Event()
+
+    def watch():
+        while not stop.wait(0.005):
+            lowest[0] = min(lowest[0], controller.limit)
+
+    policy = ThrottlePolicy(max_rate=40, max_in_flight=6)
+    with StandinServer(throttle=policy) as server:
+        fetcher = (CurlFetcher if HAS_PYCURL else SubprocessFetcher)(max_connections=16)
+        fetcher.controller = controller
+        watcher = threading.Thread(target=watch, daemon=True)
+        watcher.start()
+        try:
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                counts = list(pool.map(lambda url: _fetch_until_ok(fetcher, url, None),
+                                       _roundwise_urls(server.base_url, 150)))
+        finally:
+            stop.set()
+            watcher.join()
+            fetcher.close()
+
+    assert policy.denied > 0
+    assert controller.stats()["decreases"] > 0
+    assert lowest[0] < throttle.MAX_CONCURRENCY
+    assert sum(c["ok"] for c in counts) == 150